@@ -0,0 +1,116 @@
+"""Benchmark memory use and build time of value snapshots with the slotted player model.
+
+Compares the current slotted Player/Info model against a replica of the previous plain dataclasses, building a
+synthetic FantasyCalc payload several times over (as the bot does for each pre-warmed settings combination).
+
+Usage:
+    python scripts/benchmark_player_model.py [--assets 500] [--snapshots 36]
+"""
+
+import argparse
+import copy
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.player_model import create_player_from_dict
+
+RESOURCE = Path(__file__).resolve().parents[1] / "tests" / "resources" / "player_data_response.json"
+
+
+@dataclass
+class LegacyInfo:
+    id: int
+    name: str
+    mflId: Optional[str]
+    sleeperId: Optional[str]
+    position: str
+    maybeBirthday: Optional[str]
+    maybeHeight: Optional[str]
+    maybeWeight: Optional[int]
+    maybeCollege: Optional[str]
+    maybeTeam: Optional[str]
+    maybeAge: Optional[float]
+    maybeYoe: Optional[int]
+    espnId: Optional[str]
+    fleaflickerId: Optional[str]
+
+
+@dataclass
+class LegacyPlayer:
+    info: LegacyInfo
+    value: int
+    overallRank: int
+    positionRank: int
+    trend30Day: int
+    redraftDynastyValueDifference: int
+    redraftDynastyValuePercDifference: int
+    redraftValue: int
+    combinedValue: int
+    maybeMovingStandardDeviation: int
+    maybeMovingStandardDeviationPerc: int
+    maybeMovingStandardDeviationAdjusted: int
+    displayTrend: bool
+    maybeOwner: Optional[str]
+    starter: bool
+    maybeTier: Optional[int]
+    maybeAdp: Optional[int]
+    maybeTradeFrequency: Optional[int]
+
+
+def create_legacy_player(data: Dict[str, Any]) -> LegacyPlayer:
+    player_info = LegacyInfo(**data["player"])
+    player_fields = {field for field in LegacyPlayer.__dataclass_fields__ if field != "player"}
+    player_kwargs = {k: v for k, v in data.items() if k in player_fields}
+    return LegacyPlayer(info=player_info, **player_kwargs)
+
+
+def synthetic_payload(assets: int) -> str:
+    """Build the JSON text of a payload of distinct assets from the test resource."""
+    template = json.loads(RESOURCE.read_text(encoding="utf-8"))
+    payload = []
+    for i in range(assets):
+        asset = copy.deepcopy(template)
+        asset["player"]["id"] = i
+        asset["player"]["name"] = f"Player {i}"
+        asset["value"] = 10000 - i
+        payload.append(asset)
+    return json.dumps(payload)
+
+
+def measure(build: Callable[[Dict[str, Any]], Any], payloads: List[str]) -> tuple[float, int]:
+    """Return (seconds, bytes) needed to parse every payload and keep one object per asset in memory.
+    The parsed payloads are dropped after building, as the bot does, so only memory the objects retain counts.
+    """
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    held = []
+    for text in payloads:
+        response = json.loads(text)
+        held.append([build(asset) for asset in response])
+        del response
+    elapsed = time.perf_counter() - start_time
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return elapsed, size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Player model benchmark")
+    parser.add_argument("--assets", type=int, default=500, help="Assets per snapshot. Default is 500.")
+    parser.add_argument("--snapshots", type=int, default=36, help="Snapshots held in memory. Default is 36.")
+    args = parser.parse_args()
+
+    payloads = [synthetic_payload(args.assets)] * args.snapshots
+    legacy_time, legacy_size = measure(create_legacy_player, payloads)
+    slotted_time, slotted_size = measure(create_player_from_dict, payloads)
+
+    logger.info("%s snapshots x %s assets", args.snapshots, args.assets)
+    logger.info("legacy dataclasses : %8.1f ms %10.1f KiB", legacy_time * 1000, legacy_size / 1024)
+    logger.info("slotted + interned : %8.1f ms %10.1f KiB", slotted_time * 1000, slotted_size / 1024)
+    logger.info("memory saved       : %7.1f %%", (1 - slotted_size / legacy_size) * 100)
@@ -1,29 +1,57 @@
-"""This module is used for comparing dynasty trades between two sides locally using launch.json in VS Code."""
+"""This module is used for comparing dynasty trades between two sides locally using launch.json in VS Code.
+With --batch it instead reads trades as JSON lines from a file or stdin ("-") and streams the scored trades to stdout
+as JSON lines in input order, e.g. to re-score historical trades for analysis.
+"""
 
 import argparse
 import asyncio
+import sys
 
 from typing import List
 
+from qsleeperfantasybot.batch_compare import DEFAULT_CONCURRENCY, run_batch
 from qsleeperfantasybot.dynasty_compare import dynasty_compare
+from qsleeperfantasybot.fantasycalc import get_player_values
+from qsleeperfantasybot.http_session import session_scope
 from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.name_index import MatchQuality
+from qsleeperfantasybot.snapshot_cache import SettingsKey
 
 
 async def main(side_a: List[str], side_b: List[str], ppr: float, super_flex: bool, number_of_teams: int) -> None:
-    result = await dynasty_compare(
-        side_a=side_a,
-        side_b=side_b,
-        ppr=ppr,
-        is_super_flex=super_flex,
-        number_of_teams=number_of_teams,
-    )
+    async with session_scope():
+        settings = SettingsKey.create(True, 2 if super_flex else 1, number_of_teams, ppr)
+        for match in await get_player_values(side_a + side_b, settings):
+            if match.quality is not MatchQuality.EXACT:
+                matched = match.player.info.name if match.player else "nothing"
+                logger.warning("'%s' matched %s (%s match)", match.query, matched, match.quality.value)
+        result = await dynasty_compare(
+            side_a=side_a,
+            side_b=side_b,
+            ppr=ppr,
+            is_super_flex=super_flex,
+            number_of_teams=number_of_teams,
+        )
     logger.info("Trade comparison complete. \n %s", result)
 
 
+async def batch(path: str, concurrency: int) -> None:
+    async with session_scope():
+        if path == "-":
+            await run_batch(sys.stdin, sys.stdout, concurrency)
+        else:
+            with open(path, encoding="utf-8") as f:
+                await run_batch(f, sys.stdout, concurrency)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Dynasty trade comparison")
-    parser.add_argument("--side-a", nargs="+", required=True, help="Assets for Side A (players or picks)")
-    parser.add_argument("--side-b", nargs="+", required=True, help="Assets for Side B (players or picks)")
+    parser.add_argument("--side-a", nargs="+", help="Assets for Side A (players or picks)")
+    parser.add_argument("--side-b", nargs="+", help="Assets for Side B (players or picks)")
+    parser.add_argument("--batch", metavar="FILE", help="Score trades from a JSON lines file, or - for stdin.")
+    parser.add_argument(
+        "--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Trades scored at once in batch mode."
+    )
     parser.add_argument("--ppr", type=float, default=1.0, help="PPR setting (e.g., 0, 0.5, 1). Default is 1.")
     (
         parser.add_argument(
@@ -35,4 +63,9 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    asyncio.run(main(args.side_a, args.side_b, args.ppr, args.super_flex, args.number_of_teams))
+    if args.batch:
+        asyncio.run(batch(args.batch, args.concurrency))
+    elif args.side_a and args.side_b:
+        asyncio.run(main(args.side_a, args.side_b, args.ppr, args.super_flex, args.number_of_teams))
+    else:
+        parser.error("either --batch or both --side-a and --side-b are required")
@@ -1,26 +1,27 @@
 """This module provides an autocomplete function for asset names in a fantasy football bot.
-It fetches cached asset names and returns matches based on user input.
+It queries the prebuilt asset autocomplete index and returns ranked matches based on user input.
 The autocomplete function is designed to work with Discord's application commands.
 """
 
 from discord import app_commands, Interaction
-from qsleeperfantasybot.fantasycalc import get_cached_asset_names
+from qsleeperfantasybot.fantasycalc import get_asset_index
 from qsleeperfantasybot.logger import logger
 from typing import List
 
 
 async def asset_autocomplete(interaction: Interaction, current: str) -> List[app_commands.Choice[str]]:
     """Autocomplete function for asset names.
-    Fetches cached asset names and returns matches based on the current input.
+    Queries the asset autocomplete index and returns matches for the last comma-separated part of the input,
+    ranked by relevance and value.
     Args:
         interaction (Interaction): The interaction context.
         current (str): The current input string for autocomplete."""
-    asset_names = await get_cached_asset_names()
-    if not asset_names:
+    asset_index = await get_asset_index()
+    if not len(asset_index):
         logger.warning("No asset names available during autocomplete.")
     parts = current.split(",")
     last_part = parts[-1].strip()
-    matches = [name for name in asset_names if last_part.lower() in name.lower()][:25]
+    matches = asset_index.complete(last_part, limit=25)
 
     base = ", ".join(p.strip() for p in parts[:-1] if p.strip())
 
@@ -0,0 +1,159 @@
+"""Streaming batch scoring of dynasty trades.
+Trades are read as JSON lines and valued concurrently with evaluate_trade against the shared snapshot cache, so a
+batch costs one FantasyCalc fetch per combination of league settings however many trades it holds. Input is read in
+a worker thread and every trade starts as soon as its line arrives. Results are written as JSON lines in input order
+as soon as every earlier line is done, with at most `concurrency` trades in flight, so thousands of historical trades
+can be re-scored in one process with bounded memory and a slow producer such as an interactive stdin sees each
+result right away.
+Input lines hold "side_a" and "side_b" as lists or comma-separated strings of asset names, and optionally "ppr"
+(default 1), "super_flex" (default true), "number_of_teams" (default 12) and an "id" that is copied to the output.
+Output lines hold the line number, the id, both adjusted totals, the advantage ("A", "B" or "even"), the assets of
+each side with their values, the unresolved assets and the age of stale values, or an "error" for invalid lines.
+Classes:
+    BatchStats: Counts and duration of a batch run.
+Functions:
+    evaluate_line(number, line): Values the trade on one input line and returns its output record.
+    run_batch(lines, out, concurrency): Values every trade of a JSON lines stream and writes the results in order.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, TextIO
+
+from qsleeperfantasybot.dynasty_compare import evaluate_trade
+from qsleeperfantasybot.fantasycalc import FantasyCalcError
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.snapshot_cache import SettingsKey
+
+DEFAULT_CONCURRENCY = 64
+
+
+@dataclass
+class BatchStats:
+    """
+    Counts and duration of a batch run.
+
+    Attributes:
+        trades (int): Number of input lines that held a trade.
+        errors (int): Number of those that could not be valued.
+        elapsed (float): Seconds the run took.
+    """
+
+    trades: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Trades per second."""
+        return self.trades / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _assets(side: Any) -> List[str]:
+    """Asset names of a side given as a list or a comma-separated string."""
+    names = side.split(",") if isinstance(side, str) else side
+    if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+        raise ValueError("sides must be lists or comma-separated strings of asset names")
+    return [name.strip() for name in names if name.strip()]
+
+
+async def evaluate_line(number: int, line: str) -> Dict[str, Any]:
+    """Values the trade on one input line.
+    Args:
+        number (int): The 1-based line number, copied to the output.
+        line (str): One JSON object describing a trade.
+    Returns:
+        Dict[str, Any]: The output record, with an "error" key instead of the values if the line is invalid,
+        FantasyCalc is unavailable or valuing the trade failed unexpectedly.
+    """
+    record: Dict[str, Any] = {"line": number}
+    try:
+        trade = json.loads(line)
+        if not isinstance(trade, dict):
+            raise ValueError("expected a JSON object")
+        record["id"] = trade.get("id")
+        side_a, side_b = _assets(trade.get("side_a")), _assets(trade.get("side_b"))
+        settings = SettingsKey.create(
+            is_dynasty=True,
+            num_qbs=2 if trade.get("super_flex", True) else 1,
+            num_teams=trade.get("number_of_teams", 12),
+            ppr=trade.get("ppr", 1),
+        )
+        evaluation = await evaluate_trade(side_a, side_b, settings)
+    except (ValueError, TypeError, FantasyCalcError) as e:
+        record["error"] = str(e)
+        return record
+    except Exception as e:
+        logger.exception(f"Unexpected error valuing the trade on line {number}")
+        record["error"] = f"unexpected error: {e!r}"
+        return record
+    result = evaluation.sides
+    advantage = "A" if result.total_a > result.total_b else "B" if result.total_b > result.total_a else "even"
+    record.update(
+        total_a=result.total_a,
+        total_b=result.total_b,
+        advantage=advantage,
+        side_a=result.details_a,
+        side_b=result.details_b,
+        unresolved=result.unresolved,
+        stale_age=evaluation.stale_age,
+    )
+    return record
+
+
+async def run_batch(lines: Iterable[str], out: TextIO, concurrency: int = DEFAULT_CONCURRENCY) -> BatchStats:
+    """Values every trade of a JSON lines stream and writes one JSON line per trade in input order.
+    Lines are read in a worker thread, so reading never blocks the event loop, and every output line is flushed as
+    soon as it is written. If the run fails or is cancelled, the trades still in flight are cancelled.
+    Args:
+        lines (Iterable[str]): The input lines, e.g. a file or sys.stdin. Blank lines are skipped.
+        out (TextIO): Stream the output lines are written to.
+        concurrency (int): Largest number of trades in flight or waiting to be written. Defaults to 64.
+    Returns:
+        BatchStats: Counts and duration of the run.
+    """
+    stats = BatchStats()
+    start = time.perf_counter()
+    lines_iterator = iter(lines)
+    slots = asyncio.Semaphore(max(concurrency, 1))
+    # Trades in input order; None marks the end of the input.
+    queue: "asyncio.Queue[asyncio.Task[Dict[str, Any]] | None]" = asyncio.Queue()
+
+    async def read() -> None:
+        try:
+            number = 0
+            while (line := await asyncio.to_thread(next, lines_iterator, None)) is not None:
+                number += 1
+                if not line.strip():
+                    continue
+                await slots.acquire()
+                stats.trades += 1
+                queue.put_nowait(asyncio.create_task(evaluate_line(number, line)))
+        finally:
+            queue.put_nowait(None)
+
+    reader = asyncio.create_task(read())
+    try:
+        while (task := await queue.get()) is not None:
+            record = await task
+            slots.release()
+            stats.errors += "error" in record
+            out.write(json.dumps(record, separators=(",", ":")) + "\n")
+            out.flush()
+        await reader
+    finally:
+        unfinished: List["asyncio.Task[Any]"] = [reader]
+        while not queue.empty():
+            if (queued := queue.get_nowait()) is not None:
+                unfinished.append(queued)
+        for pending in unfinished:
+            pending.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+    stats.elapsed = time.perf_counter() - start
+    logger.info(
+        f"Scored {stats.trades} trades ({stats.errors} errors) in {stats.elapsed:.2f}s, "
+        f"{stats.throughput:.0f} trades/s"
+    )
+    return stats
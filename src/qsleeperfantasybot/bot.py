@@ -4,6 +4,9 @@ and dynasty trade evaluations.
 It supports slash command interface, including autocomplete for asset names.
 Features:
 - Fetches and caches player/asset names for autocomplete.
+- Keeps value snapshots for common league settings warm in the background.
+- Restores the last good value snapshots from disk on startup, so restarts survive FantasyCalc outages.
+- Shares one pooled HTTP session for all outbound requests, opened on setup and closed on shutdown.
 - Compares dynasty trades between two sides, supporting multiple assets per side.
 - Logs bot activity and warnings.
 - Loads configuration from environment variables.
@@ -27,9 +30,17 @@ import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
-from qsleeperfantasybot.fantasycalc import fetch_asset_names
+from qsleeperfantasybot.fantasycalc import (
+    ASSET_NAMES_KEY,
+    fetch_asset_names,
+    restore_snapshots,
+    snapshot_cache,
+    value_history,
+)
+from qsleeperfantasybot.http_session import close_session, open_session
 from qsleeperfantasybot.logger import logger
 from qsleeperfantasybot.commands import setup_commands
+from qsleeperfantasybot.snapshot_refresher import SnapshotRefresher, default_prewarm_matrix
 from qsleeperfantasybot import __version__
 
 load_dotenv()
@@ -43,9 +54,20 @@ intents.message_content = True  # Required for reading messages
 class FantasyBot(commands.Bot):
     """Custom bot class for QSleeper Fantasy Bot."""
 
+    snapshot_refresher: SnapshotRefresher | None = None
+
     async def setup_hook(self) -> None:
+        await open_session()
         setup_commands(self)
-        await fetch_asset_names()
+        await restore_snapshots()
+        if ASSET_NAMES_KEY not in snapshot_cache:
+            # Nothing on disk yet, so autocomplete needs a first fetch. Startup must not fail if FantasyCalc is down.
+            try:
+                await fetch_asset_names()
+            except Exception as e:
+                logger.warning(f"Could not fetch asset names at startup, retrying in the background: {e}")
+        self.snapshot_refresher = SnapshotRefresher(snapshot_cache, default_prewarm_matrix())
+        self.snapshot_refresher.start()
 
         # Sync commands (guild = instant, global = slow)
         if GUILD_ID:
@@ -57,6 +79,13 @@ class FantasyBot(commands.Bot):
             await self.tree.sync()
             logger.info("Synced commands globally (may take up to 1h)")
 
+    async def close(self) -> None:
+        if self.snapshot_refresher is not None:
+            await self.snapshot_refresher.stop()
+        await value_history.flush()
+        await close_session()
+        await super().close()
+
     async def on_ready(self) -> None:
         logger.info("Starting QSleeperFantasyBot version %s", __version__)
         logger.info("Logged in as %s", self.user)
@@ -0,0 +1,115 @@
+"""Circuit breaker that stops calling an upstream service after repeated failures.
+While the circuit is open every call fails immediately instead of waiting for a dead endpoint to time out, so
+callers can fall back to cached data at cache-hit speed. After a cooldown a single trial call is let through
+(half-open); its success closes the circuit again and its failure reopens it for another cooldown. A call that ends
+without telling anything about upstream, e.g. because it was cancelled, releases its trial without counting; only the
+call that was handed the trial can release it.
+Classes:
+    CircuitState: The state of a circuit breaker.
+    CircuitOpenError: Raised instead of calling upstream while the circuit is open.
+    CircuitBreaker: Counts consecutive failures and decides whether upstream may be called.
+"""
+
+import time
+from enum import Enum
+from typing import Callable
+
+from qsleeperfantasybot.logger import logger
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT_SECONDS = 60
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+    def __init__(self, name: str, retry_in: float) -> None:
+        super().__init__(f"{name} circuit is open, retrying in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    Args:
+        name (str): Name of the protected service, used in logs and errors.
+        failure_threshold (int): Consecutive failures that open the circuit. Defaults to 3.
+        reset_timeout (float): Seconds the circuit stays open before a trial call is allowed. Defaults to 60.
+        clock (Callable[[], float]): Time source, injectable for tests. Defaults to time.time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._trials = 0
+        self._trial: int | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the circuit."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def before_call(self) -> int | None:
+        """Check that upstream may be called and reserve the trial call when half-open.
+        Returns:
+            int | None: An ID of the reserved trial call when half-open, to be passed to `release`, otherwise None.
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a trial call already running.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return None
+        if state is CircuitState.HALF_OPEN and self._trial is None:
+            self._trials += 1
+            self._trial = self._trials
+            return self._trial
+        assert self._opened_at is not None
+        raise CircuitOpenError(self.name, max(0.0, self._opened_at + self.reset_timeout - self._clock()))
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        if self._opened_at is not None:
+            logger.info(f"{self.name} circuit closed")
+        self.failures = 0
+        self._opened_at = None
+        self._trial = None
+
+    def release(self, trial: int | None) -> None:
+        """End a call without counting a success or a failure, freeing the trial call slot if the call holds it.
+        Args:
+            trial (int | None): The value `before_call` returned for the call.
+        """
+        if trial is not None and trial == self._trial:
+            self._trial = None
+
+    def record_failure(self) -> None:
+        """Count a failed call and open the circuit once the threshold is reached or a trial call failed."""
+        self.failures += 1
+        if self._trial is not None or self.failures >= self.failure_threshold:
+            if self._opened_at is None or self._trial is not None:
+                logger.warning(f"{self.name} circuit opened after {self.failures} consecutive failures")
+            self._opened_at = self._clock()
+        self._trial = None
@@ -4,7 +4,7 @@ like dynasty trade comparisons and help requests."""
 
 from discord.ext.commands import Bot
 
-__all__ = ["dynasty_trade", "help", "store_sleeper_user", "get_leagues"]
+__all__ = ["dynasty_trade", "help", "store_sleeper_user", "get_leagues", "risers", "propose_trades", "shop_asset"]
 
 
 def setup_commands(bot: Bot) -> None:
@@ -14,10 +14,22 @@ def setup_commands(bot: Bot) -> None:
     Args:
         bot (commands.Bot): The Discord bot instance.
     """
-    from . import dynasty_trade, help, store_sleeper_user, get_leagues, kicker_to_pick
+    from . import (
+        dynasty_trade,
+        help,
+        store_sleeper_user,
+        get_leagues,
+        kicker_to_pick,
+        risers,
+        propose_trades,
+        shop_asset,
+    )
 
     dynasty_trade.setup(bot)
     help.setup(bot)
     store_sleeper_user.setup(bot)
     get_leagues.setup(bot)
     kicker_to_pick.setup(bot)
+    risers.setup(bot)
+    propose_trades.setup(bot)
+    shop_asset.setup(bot)
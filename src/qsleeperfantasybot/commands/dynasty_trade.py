@@ -7,6 +7,8 @@ with autocomplete support for asset names.
 from discord import Interaction, app_commands
 from discord.ext.commands import Bot
 from qsleeperfantasybot.dynasty_compare import dynasty_compare
+from qsleeperfantasybot.fantasycalc import FantasyCalcError
+from qsleeperfantasybot.logger import logger
 from qsleeperfantasybot.autocomplete import asset_autocomplete
 
 
@@ -44,11 +46,15 @@ def setup(bot: Bot) -> None:
         await interaction.response.defer(ephemeral=True)
         side_a_list = [s.strip() for s in side_a.split(",")]
         side_b_list = [s.strip() for s in side_b.split(",")]
-        result = await dynasty_compare(
-            side_a_list,
-            side_b_list,
-            ppr,
-            is_super_flex=super_flex,
-            number_of_teams=number_of_teams,
-        )
+        try:
+            result = await dynasty_compare(
+                side_a_list,
+                side_b_list,
+                ppr,
+                is_super_flex=super_flex,
+                number_of_teams=number_of_teams,
+            )
+        except FantasyCalcError as e:
+            logger.warning(f"Dynasty trade comparison failed: {e}")
+            result = "❌ FantasyCalc values are currently unavailable. Please try again later."
         await interaction.followup.send(result, ephemeral=True)
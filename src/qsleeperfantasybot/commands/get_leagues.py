@@ -3,7 +3,7 @@
 from discord import Interaction
 from discord.ext.commands import Bot
 from qsleeperfantasybot.logger import logger
-from qsleeperfantasybot.sleeper.api.parser import sleeper_api_parser
+from qsleeperfantasybot.sleeper.api.client import sleeper_client
 from qsleeperfantasybot.commands.store_sleeper_user import sleeper_user_handler
 from qsleeperfantasybot.sleeper.model.user import User
 from qsleeperfantasybot.sleeper.model.league import League, create_league_from_dict
@@ -24,7 +24,7 @@ def setup(bot: Bot) -> None:
                 ephemeral=True,
             )
             return
-        user_data = sleeper_api_parser.get_user(user_name=sleeper_username)
+        user_data = await sleeper_client.get_user(user_name=sleeper_username)
         logger.info(f"Retrieved user data: {user_data}")
         if not user_data:
             await interaction.response.send_message(
@@ -34,7 +34,7 @@ def setup(bot: Bot) -> None:
             return
         if isinstance(user_data, dict):
             user = User.from_dict(user_data)
-            user_leagues = sleeper_api_parser.get_all_leagues_for_user(user.id)
+            user_leagues = await sleeper_client.get_all_leagues_for_user(user.id)
             logger.info(f"Retrieved leagues for user {sleeper_username}: {user_leagues}")
             if not user_leagues:
                 await interaction.response.send_message(
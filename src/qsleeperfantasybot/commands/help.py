@@ -17,6 +17,9 @@ def setup(bot: Bot) -> None:
             "**Available Commands:**\n"
             "• `/dynastytrade` — Compare dynasty trade value between two sides.\n"
             "   - Example: `side_a = Tyreek Hill`, `side_b = Bijan Robinson`\n"
+            "• `/risers` — Show the biggest dynasty value gainers and losers over the last days.\n"
+            "• `/proposetrades` — Propose fair trades that improve two rosters of a Sleeper league.\n"
+            "• `/shopasset` — Find which teams in a league could offer a fair package for one of your assets.\n"
             "• `/help` — Show this message.\n\n"
             "For autocomplete, just start typing a name — it will suggest matching players or assets."
         )
@@ -39,7 +39,7 @@ def setup(bot: Bot) -> None:
         """Slash command handler for kicker->rookie pick conversion."""
         await interaction.response.defer(ephemeral=True)
 
-        result = run_kicker_scan(league_id, draft_id, name or "Sleeper League", teams, rounds)
+        result = await run_kicker_scan(league_id, draft_id, name or "Sleeper League", teams, rounds)
         # Send result as followup (we deferred earlier)
         if result:
             await interaction.followup.send(result, ephemeral=True)
@@ -0,0 +1,38 @@
+"""This file is part of QSleeperFantasyBot, a Discord bot for fantasy football.
+It implements the /proposetrades slash command, which searches two rosters of a Sleeper league for fair trades
+that improve both starting lineups.
+"""
+
+from discord import Interaction, app_commands
+from discord.ext.commands import Bot
+
+from qsleeperfantasybot.fantasycalc import FantasyCalcError
+from qsleeperfantasybot.league_trades import propose_trades
+from qsleeperfantasybot.logger import logger
+
+
+def setup(bot: Bot) -> None:
+    """Setup the proposetrades command for the bot."""
+
+    @bot.tree.command(name="proposetrades", description="Propose fair trades that help two rosters in a league.")
+    @app_commands.describe(
+        league_id="Sleeper league ID",
+        roster_a="Roster ID of the first team",
+        roster_b="Roster ID of the second team",
+        max_assets="Largest number of assets each side gives. Default is 3.",
+    )
+    async def proposetrades(
+        interaction: Interaction,
+        league_id: str,
+        roster_a: int,
+        roster_b: int,
+        max_assets: app_commands.Range[int, 1, 3] = 3,
+    ) -> None:
+        """Propose fair trades between two rosters using slash command."""
+        await interaction.response.defer(ephemeral=True)
+        try:
+            result = await propose_trades(league_id, roster_a, roster_b, max_assets)
+        except FantasyCalcError as e:
+            logger.warning(f"Trade proposals failed: {e}")
+            result = "❌ FantasyCalc values are currently unavailable. Please try again later."
+        await interaction.followup.send(result, ephemeral=True)
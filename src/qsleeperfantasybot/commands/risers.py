@@ -0,0 +1,49 @@
+"""This file is part of QSleeperFantasyBot, a Discord bot for fantasy football.
+It implements the /risers slash command, which lists the assets that gained and lost the most value over a
+window of days, answered from the locally recorded value history without calling FantasyCalc.
+"""
+
+from discord import Interaction, app_commands
+from discord.ext.commands import Bot
+
+from qsleeperfantasybot.fantasycalc import value_history
+from qsleeperfantasybot.messages import construct_no_history_message, construct_risers_message
+from qsleeperfantasybot.snapshot_cache import SettingsKey
+
+
+def setup(bot: Bot) -> None:
+    """Setup the risers command for the bot."""
+
+    @bot.tree.command(name="risers", description="Show the biggest dynasty value gainers and losers.")
+    @app_commands.describe(
+        days="Window length in days. Default is 7.",
+        count="Number of gainers and losers to show. Default is 5.",
+        ppr="PPR setting (e.g., 0, 0.5, 1). Default is 1.",
+        super_flex="Whether the league is super flex. Default is True.",
+        number_of_teams="Number of teams in the league. Default is 12.",
+    )
+    @app_commands.choices(
+        ppr=[
+            app_commands.Choice(name="Standard (0 PPR)", value=0.0),
+            app_commands.Choice(name="Half PPR (0.5)", value=0.5),
+            app_commands.Choice(name="Full PPR (1.0)", value=1.0),
+        ]
+    )
+    async def risers(
+        interaction: Interaction,
+        days: app_commands.Range[int, 1, 365] = 7,
+        count: app_commands.Range[int, 1, 25] = 5,
+        ppr: float = 1.0,
+        super_flex: bool = True,
+        number_of_teams: int = 12,
+    ) -> None:
+        """Show the top value gainers and losers using slash command."""
+        settings = SettingsKey.create(True, 2 if super_flex else 1, number_of_teams, ppr)
+        history = await value_history.load(settings)
+        window = history.window(days)
+        if window is None or window[0] == window[1]:
+            message = construct_no_history_message(len(history))
+        else:
+            gainers, losers = history.movers(days, count)
+            message = construct_risers_message(days, gainers, losers, (window[1] - window[0]).days)
+        await interaction.response.send_message(message, ephemeral=True)
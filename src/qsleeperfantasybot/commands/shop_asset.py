@@ -0,0 +1,33 @@
+"""This file is part of QSleeperFantasyBot, a Discord bot for fantasy football.
+It implements the /shopasset slash command, which scans every roster of a Sleeper league for the packages its
+managers could offer for an asset, with autocomplete support for asset names.
+"""
+
+from discord import Interaction, app_commands
+from discord.ext.commands import Bot
+
+from qsleeperfantasybot.autocomplete import asset_autocomplete
+from qsleeperfantasybot.fantasycalc import FantasyCalcError
+from qsleeperfantasybot.league_trades import shop_asset
+from qsleeperfantasybot.logger import logger
+
+
+def setup(bot: Bot) -> None:
+    """Setup the shopasset command for the bot."""
+
+    @bot.tree.command(name="shopasset", description="Find which teams in a league could offer a package for an asset.")
+    @app_commands.describe(
+        league_id="Sleeper league ID",
+        roster_id="Roster ID of your team",
+        asset="The asset you are shopping",
+    )
+    @app_commands.autocomplete(asset=asset_autocomplete)
+    async def shopasset(interaction: Interaction, league_id: str, roster_id: int, asset: str) -> None:
+        """Scan a league for packages offered for an asset using slash command."""
+        await interaction.response.defer(ephemeral=True)
+        try:
+            result = await shop_asset(league_id, roster_id, asset.strip())
+        except FantasyCalcError as e:
+            logger.warning(f"Shopping an asset failed: {e}")
+            result = "❌ FantasyCalc values are currently unavailable. Please try again later."
+        await interaction.followup.send(result, ephemeral=True)
@@ -0,0 +1,183 @@
+"""Draft pick parsing and pick value index.
+Managers spell picks in many ways: "2026 1.05", "2026 Pick 1.05", "2027 Early 1st", "2028 Round 1" or
+"2028 first". All of them are parsed into a PickKey of season, round and either a slot or an early/mid/late tier,
+and the pick assets of a FantasyCalc snapshot are parsed with the same parser. The index maps every key FantasyCalc
+lists to its entry and precomputes, per season and round, a value curve over all slots by interpolating the slots,
+tiers and round values that are listed. Slots, tiers and rounds that are not listed themselves are then answered
+from the curve with a dictionary lookup, just like listed picks.
+Classes:
+    PickTier: Early, mid or late third of a round.
+    PickKey: Season, round and slot or tier of a draft pick.
+    PickValue: The value of a pick key and the entry it was taken from.
+    PickIndex: Pick entries and slot value curves of one snapshot.
+Functions:
+    parse_pick(text): Parses a draft pick spelling into a PickKey, or None if the text is not a pick.
+"""
+
+import math
+import re
+from enum import Enum
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+MAX_ROUNDS = 7
+PICK_POSITION = "PICK"
+
+_ORDINAL_WORDS = {"first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5, "sixth": 6, "seventh": 7}
+_NUMBER_WORDS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7}
+_FILLER_WORDS = frozenset({"pick", "round", "rookie", "draft"})
+_ORDINALS = {1: "1st", 2: "2nd", 3: "3rd"}
+
+_SEASON = re.compile(r"\b(20\d\d)\b")
+_SLOT = re.compile(r"#?\b(\d{1,2})\.(\d{1,2})\b")
+_ROUND = re.compile(
+    r"\b(?:round|rd|r)\s*(\d|one|two|three|four|five|six|seven)\b"
+    r"|\b(\d)(?:st|nd|rd|th)(?:\s+round)?\b"
+    r"|\b(first|second|third|fourth|fifth|sixth|seventh)(?:\s+round)?\b"
+)
+_TIER = re.compile(r"\b(early|mid|middle|late)\b")
+
+
+class PickTier(Enum):
+    """Early, mid or late third of a draft round."""
+
+    EARLY = 0
+    MID = 1
+    LATE = 2
+
+
+class PickKey(NamedTuple):
+    """Season, round and optionally slot or tier of a draft pick."""
+
+    season: int
+    round: int
+    slot: int | None = None
+    tier: PickTier | None = None
+
+    @property
+    def label(self) -> str:
+        """Display name of the pick, e.g. "2026 Pick 1.05", "2027 Early 1st" or "2028 1st"."""
+        if self.slot is not None:
+            return f"{self.season} Pick {self.round}.{self.slot:02d}"
+        ordinal = _ORDINALS.get(self.round, f"{self.round}th")
+        if self.tier is not None:
+            return f"{self.season} {self.tier.name.capitalize()} {ordinal}"
+        return f"{self.season} {ordinal}"
+
+
+class PickValue(NamedTuple):
+    """Value of a pick key. entry is the listed pick asset, or None if the value was interpolated, in which case
+    template is the listed pick of the same season and round closest to the key."""
+
+    key: PickKey
+    value: int
+    entry: int | None
+    template: int
+
+
+def parse_pick(text: str) -> PickKey | None:
+    """Parses a draft pick spelling.
+    Args:
+        text (str): The queried asset name, e.g. "2026 1.05", "2027 Early 1st" or "2028 Round 1".
+    Returns:
+        PickKey or None: The parsed pick, or None if the text contains anything besides a season, a round, a slot or
+        tier and filler words such as "pick".
+    """
+    rest = text.lower()
+    season_match = _SEASON.search(rest)
+    if season_match is None:
+        return None
+    rest = rest[: season_match.start()] + " " + rest[season_match.end() :]
+
+    slot = tier = None
+    slot_match = _SLOT.search(rest)
+    if slot_match is not None:
+        number, slot = int(slot_match.group(1)), int(slot_match.group(2))
+        rest = rest[: slot_match.start()] + " " + rest[slot_match.end() :]
+    else:
+        round_match = _ROUND.search(rest)
+        if round_match is None:
+            return None
+        word = next(group for group in round_match.groups() if group)
+        number = int(word) if word.isdigit() else _NUMBER_WORDS.get(word) or _ORDINAL_WORDS[word]
+        rest = rest[: round_match.start()] + " " + rest[round_match.end() :]
+        tier_match = _TIER.search(rest)
+        if tier_match is not None:
+            tier = PickTier.MID if tier_match.group(1) == "middle" else PickTier[tier_match.group(1).upper()]
+            rest = rest[: tier_match.start()] + " " + rest[tier_match.end() :]
+
+    if not 1 <= number <= MAX_ROUNDS or slot == 0:
+        return None
+    if any(word not in _FILLER_WORDS for word in re.split(r"[^a-z0-9#]+", rest) if word):
+        return None
+    return PickKey(int(season_match.group(1)), number, slot, tier)
+
+
+class PickIndex:
+    """Listed pick assets of a snapshot and an interpolated value for every slot, tier and round.
+
+    Args:
+        names (Sequence[str]): Asset names, one per entry.
+        values (Sequence[int]): Asset values, one per entry.
+        positions (Sequence[str]): Asset positions, one per entry. Only PICK entries are indexed.
+        num_teams (int): Number of teams, i.e. slots per round.
+    """
+
+    def __init__(self, names: Sequence[str], values: Sequence[int], positions: Sequence[str], num_teams: int) -> None:
+        self.num_teams = max(num_teams, 3)
+        self._picks: Dict[PickKey, PickValue] = {}
+        points: Dict[Tuple[int, int], List[Tuple[float, int, int]]] = {}
+        for entry, (name, value, position) in enumerate(zip(names, values, positions)):
+            if position != PICK_POSITION or not value:
+                continue
+            key = parse_pick(name)
+            if key is None:
+                continue
+            self._picks.setdefault(key, PickValue(key, value, entry, entry))
+            points.setdefault((key.season, key.round), []).append((self._position(key), value, entry))
+        for (season, number), listed in points.items():
+            self._interpolate(season, number, listed)
+
+    def __len__(self) -> int:
+        return len(self._picks)
+
+    def _tier_slots(self, tier: PickTier) -> range:
+        """The slots of a tier: the round split into thirds."""
+        size = self.num_teams / 3
+        return range(math.floor(tier.value * size) + 1, math.floor((tier.value + 1) * size) + 1)
+
+    def _position(self, key: PickKey) -> float:
+        """Slot a listed pick stands for on the curve: its slot, the middle of its tier or the middle of the round."""
+        if key.slot is not None:
+            return float(key.slot)
+        slots = self._tier_slots(key.tier) if key.tier is not None else range(1, self.num_teams + 1)
+        return (slots[0] + slots[-1]) / 2
+
+    def _interpolate(self, season: int, number: int, listed: List[Tuple[float, int, int]]) -> None:
+        """Precompute the values of every slot, tier and the round itself that FantasyCalc does not list."""
+        listed.sort()
+        positions = np.asarray([position for position, _, _ in listed])
+        slots = np.arange(1, self.num_teams + 1, dtype=np.float64)
+        curve = np.interp(slots, positions, np.asarray([value for _, value, _ in listed], dtype=np.float64))
+        nearest = np.abs(slots[:, None] - positions[None, :]).argmin(axis=1)
+
+        def add(key: PickKey, value: float, slot: int) -> None:
+            if key not in self._picks:
+                self._picks[key] = PickValue(key, round(value), None, listed[int(nearest[slot - 1])][2])
+
+        for slot in range(1, self.num_teams + 1):
+            add(PickKey(season, number, slot), curve[slot - 1], slot)
+        for tier in PickTier:
+            tier_slots = self._tier_slots(tier)
+            middle = tier_slots[len(tier_slots) // 2]
+            add(PickKey(season, number, tier=tier), curve[tier_slots[0] - 1 : tier_slots[-1]].mean(), middle)
+        add(PickKey(season, number), curve.mean(), (self.num_teams + 1) // 2)
+
+    def lookup(self, key: PickKey) -> PickValue | None:
+        """Return the value of a pick, or None if FantasyCalc lists no pick of its season and round.
+        Slots beyond the number of teams count as the last slot.
+        """
+        if key.slot is not None and key.slot > self.num_teams and key not in self._picks:
+            key = key._replace(slot=self.num_teams)
+        return self._picks.get(key)
@@ -1,17 +1,64 @@
 """This module provides functionality to compare two sides of a dynasty fantasy football trade.
-It calculates the total value of assets on each side using player values from the fantasycalc module,
-and returns a formatted message summarizing the trade comparison, including the total values for each side,
-a breakdown of individual asset values, and which side holds the advantage.
+It values the assets on each side using player values from the fantasycalc module and the consolidation
+adjustment of the trade_valuation module, and returns a formatted message summarizing the trade comparison,
+including the total values for each side, a breakdown of individual asset values, and which side holds the
+advantage.
+Classes:
+    TradeEvaluation: A valued trade with its side order and the age of stale values.
 Functions:
-    dynasty_compare(side_a: List[str], side_b: List, ppr: float, is_super_flex: bool, number_of_teams: int) -> str
+    dynasty_compare(side_a: List[str], side_b: List, ppr: float, is_super_flex: bool, number_of_teams: int,
+                    deadline: float) -> str
         Asynchronously compares two lists of dynasty assets and returns a formatted trade comparison message.
         Options include PPR settings, super flex status, and number of teams in the league.
+        All assets of both sides are resolved against a single value snapshot in one batch. If FantasyCalc is
+        unreachable the last good snapshot is used and the message says how old its values are; expired values
+        served while newer ones are fetched are flagged as being refreshed instead. Loading the snapshot is bounded
+        by a per-command deadline, past which any cached snapshot is used as if FantasyCalc were unreachable, and
+        assets that cannot be resolved are listed as missing instead of failing the comparison. When one side is
+        ahead, the trade balancer suggests filler assets for the other side. Results valued with current values
+        are memoized by canonical trade, so repeated trades skip resolution and formatting.
+    evaluate_trade(side_a: List[str], side_b: List[str], settings: SettingsKey, deadline: float) -> TradeEvaluation
+        Values a trade and returns the structured result that dynasty_compare formats, e.g. for batch scoring.
+    total_value(matches: List[AssetMatch], valuator: TradeValuator) -> Tuple[int, List[Tuple[str, int]]]
+        Values one side of resolved assets with the consolidation adjustment and returns per-asset details.
 """
 
-from typing import List, Tuple
+import asyncio
+from typing import List, NamedTuple, Tuple
 
-from qsleeperfantasybot.fantasycalc import get_player_value
-from qsleeperfantasybot.messages import construct_dynasty_trade_message
+from qsleeperfantasybot.fantasycalc import AssetMatch, FantasyCalcError, resolve_player, snapshot_cache
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.snapshot_cache import SettingsKey, SnapshotStatus
+from qsleeperfantasybot.trade_balancer import TradeBalancer
+from qsleeperfantasybot.trade_cache import TradeResult, TradeResultCache, canonical_trade
+from qsleeperfantasybot.trade_valuation import TradeValuator
+
+COMPARE_DEADLINE_SECONDS = 10
+
+trade_valuator = TradeValuator()
+trade_balancer = TradeBalancer(trade_valuator)
+trade_cache = TradeResultCache()
+snapshot_cache.add_listener(trade_cache.evict_replaced)
+snapshot_cache.add_listener(trade_balancer.evict_replaced)
+
+
+class TradeEvaluation(NamedTuple):
+    """A valued trade: its canonical result, whether the queried sides are swapped relative to it, the age of
+    the values if they are stale, and whether stale values are being refreshed rather than a fallback for an outage."""
+
+    result: TradeResult
+    swapped: bool
+    stale_age: float | None
+    refreshing: bool = False
+
+    @property
+    def sides(self) -> TradeResult:
+        """The result with the sides in the queried order."""
+        return self.result.swap() if self.swapped else self.result
+
+    def message(self) -> str:
+        """The comparison message with the sides in the queried order."""
+        return self.result.message(self.swapped, self.stale_age, self.refreshing)
 
 
 async def dynasty_compare(
@@ -20,6 +67,7 @@ async def dynasty_compare(
     ppr: float,
     is_super_flex: bool,
     number_of_teams: int,
+    deadline: float = COMPARE_DEADLINE_SECONDS,
 ) -> str:
     """Compare two sides of a dynasty trade and return a formatted message.
     Args:
@@ -28,37 +76,88 @@ async def dynasty_compare(
         ppr (float): PPR setting (e.g., 0, 0.5, 1). Default is 1.
         is_super_flex (bool): Whether the league is super flex. Default is True.
         number_of_teams (int): Number of teams in the league. Default is 12.
+        deadline (float): Seconds to wait for the value snapshot. Defaults to 10.
 
     Returns:
         str: Formatted message with total values and advantage.
+    Raises:
+        FantasyCalcError: If no snapshot for the settings can be loaded within the deadline and none is cached.
     """
 
-    async def total_value(assets: List[str]) -> Tuple[int, List[Tuple[str, int]]]:
-        """Calculate the total value of a list of assets and return the total and details.
-        Args:
-            assets (List[str]): List of asset names.
-        Returns:
-            Tuple[int, List[Tuple[str, int]]]: Total value and a list of tuples with asset names and their values.
-        """
-        total = 0
-        asset_details: List[Tuple[str, int]] = []
-        for name in assets:
-            player = await get_player_value(
-                name,
-                is_dynasty=True,
-                ppr=ppr,
-                num_qbs=(2 if is_super_flex else 1),
-                num_teams=number_of_teams,
-            )
-            if player:
-                value = player.value
-                total += value
-                asset_details.append((player.info.name, value))
-            else:
-                asset_details.append((name, 0))
-        return total, asset_details
-
-    total_a, details_a = await total_value(side_a)
-    total_b, details_b = await total_value(side_b)
-
-    return construct_dynasty_trade_message(total_a, details_a, total_b, details_b)
+    settings = SettingsKey.create(
+        is_dynasty=True,
+        num_qbs=(2 if is_super_flex else 1),
+        num_teams=number_of_teams,
+        ppr=ppr,
+    )
+    evaluation = await evaluate_trade(side_a, side_b, settings, deadline)
+    return evaluation.message()
+
+
+async def evaluate_trade(
+    side_a: List[str], side_b: List[str], settings: SettingsKey, deadline: float = COMPARE_DEADLINE_SECONDS
+) -> TradeEvaluation:
+    """Value a trade with the snapshot of the given settings, reusing the memoized result of an equal trade.
+    Args:
+        side_a (List[str]): List of assets for side A.
+        side_b (List[str]): List of assets for side B.
+        settings (SettingsKey): The league settings to value the assets with.
+        deadline (float): Seconds to wait for the value snapshot. Defaults to 10. Past it, the cached snapshot is
+            used with a note on the age of its values, while the load continues in the background.
+    Returns:
+        TradeEvaluation: The valued trade.
+    Raises:
+        FantasyCalcError: If no snapshot for the settings can be loaded within the deadline and none is cached.
+    """
+    try:
+        snapshot, status = await asyncio.wait_for(snapshot_cache.lookup(settings), deadline)
+    except asyncio.TimeoutError as e:
+        cached_snapshot = snapshot_cache.peek(settings)
+        if cached_snapshot is None:
+            raise FantasyCalcError(f"No value snapshot for {settings} within {deadline:g}s") from e
+        logger.warning(f"No value snapshot for {settings} within {deadline:g}s, using the cached one")
+        snapshot = cached_snapshot
+        status = SnapshotStatus.FRESH if snapshot_cache.is_fresh(snapshot) else SnapshotStatus.FALLBACK
+    stale_age = None if status is SnapshotStatus.FRESH else snapshot.age()
+    refreshing = status is SnapshotStatus.REFRESHING
+    key, swapped = canonical_trade(snapshot, side_a, side_b)
+    cached = trade_cache.get(key) if stale_age is None else None
+    if cached is not None:
+        return TradeEvaluation(cached, swapped, stale_age, refreshing)
+
+    matches = [resolve_player(snapshot, name) for name in side_a + side_b]
+    total_a, details_a = total_value(matches[: len(side_a)])
+    total_b, details_b = total_value(matches[len(side_a) :])
+
+    unresolved = [match.query for match in matches if match.player is None]
+    values_a = [value for _, value in details_a]
+    values_b = [value for _, value in details_b]
+    leading, trailing = (values_a, values_b) if total_a > total_b else (values_b, values_a)
+    in_trade = {match.entry for match in matches if match.entry is not None}
+    suggestions = trade_balancer.suggest(snapshot, leading, trailing, exclude=in_trade)
+    result = TradeResult(total_a, details_a, total_b, details_b, unresolved, suggestions)
+    if swapped:
+        result = result.swap()
+    # The age in a stale message changes with every request, so results from stale values are not cached.
+    if stale_age is None:
+        trade_cache.put(key, result)
+    return TradeEvaluation(result, swapped, stale_age, refreshing)
+
+
+def total_value(matches: List[AssetMatch], valuator: TradeValuator | None = None) -> Tuple[int, List[Tuple[str, int]]]:
+    """Calculate the adjusted total value of a list of resolved assets and return the total and details.
+    Args:
+        matches (List[AssetMatch]): Resolved assets for one side of the trade.
+        valuator (TradeValuator, optional): The valuation engine. Defaults to the module-level trade_valuator.
+    Returns:
+        Tuple[int, List[Tuple[str, int]]]: Adjusted total value and a list of tuples with asset names and their
+        values.
+    """
+    asset_details: List[Tuple[str, int]] = []
+    for match in matches:
+        if match.player:
+            asset_details.append((match.player.info.name, match.player.value or 0))
+        else:
+            asset_details.append((match.query, 0))
+    total = (valuator or trade_valuator).side_value([value for _, value in asset_details])
+    return round(total), asset_details
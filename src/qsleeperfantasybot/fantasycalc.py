@@ -1,17 +1,38 @@
 """This module provides asynchronous utilities for fetching and processing player value data from the FantasyCalc API.
+Classes:
+    - FantasyCalcError: Raised when FantasyCalc values cannot be fetched.
+    - AssetMatch: Result of resolving one queried asset name.
 Functions:
     - create_lookup_dict(players): Builds a lookup dictionary of Player objects keyed by normalized player names.
     - get_cached_asset_names(force=False): Retrieves and caches the list of asset (player) names from
       the FantasyCalc API.
-    - fetch_asset_names(): Fetches and caches asset names from the FantasyCalc API if not already loaded.
+    - fetch_asset_names(force=False): Fetches and caches asset names and their autocomplete index from the
+      FantasyCalc API if not already loaded.
+    - get_asset_index(): Returns the autocomplete index built from the cached asset names.
+    - restore_snapshots(): Loads the persisted snapshots from disk into the snapshot cache off the event loop.
+    - get_value_snapshot(is_dynasty=False, num_qbs=1, num_teams=12, ppr=1): Returns the cached value snapshot for
+      the given league settings, fetching it from the FantasyCalc API when missing or expired.
+    - resolve_player(snapshot, player_name): Resolves one name against a snapshot and reports the match quality.
     - get_player_value(player_name, is_dynasty=False, num_qbs=1, num_teams=12, ppr=1): Fetches a Player object with
       value information from the FantasyCalc API based on player name and league settings.
+    - get_player_values(names, settings): Resolves a list of names against a single snapshot in one pass.
 Globals:
     - BASE_URL: The FantasyCalc API endpoint for current player values.
+    - ASSET_NAMES_KEY: The league settings whose snapshot feeds the asset names and autocomplete index.
+    - STALE_WHILE_REVALIDATE_SECONDS: How long past its TTL a snapshot is still served while it is reloaded.
+    - RESTORED_STALE_WHILE_REVALIDATE_SECONDS: The same for snapshots restored from disk at startup.
+    - STALE_TIMEOUT_SECONDS: How long a lookup waits for a reload before falling back to an older snapshot.
+    - circuit_breaker: Circuit breaker that stops calling FantasyCalc after repeated failures.
+    - snapshot_cache: Settings-keyed cache of parsed value snapshots shared by all lookups.
+    - snapshot_store: On-disk store every fetched payload is persisted to for warm restarts.
+    - value_history: Daily value time series recorded from every snapshot that enters the cache.
     - _cached_asset_names: Cached list of asset names from the API.
+    - _asset_index: Autocomplete index rebuilt whenever the cached asset names are refreshed.
     - _asset_names_loaded: Boolean flag indicating whether asset names have been loaded.
 Dependencies:
-    - aiohttp: For asynchronous HTTP requests.
+    - circuit_breaker: For failing fast while FantasyCalc is down.
+    - draft_picks: For resolving draft pick spellings.
+    - http_session: For the shared, pooled aiohttp session.
     - time: For performance measurement.
     - typing: For type annotations.
     - player_model: For Player model and creation utility.
@@ -21,20 +42,59 @@ Typical usage:
     applications, supporting customizable league settings.
 """
 
+import asyncio
+import json
 import time
+from dataclasses import dataclass
 from typing import Any, Dict, List
 
 import aiohttp
 
+from qsleeperfantasybot.circuit_breaker import CircuitBreaker, CircuitOpenError
+from qsleeperfantasybot.draft_picks import parse_pick
+from qsleeperfantasybot.http_session import get_session
 from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.name_index import AutocompleteIndex, MatchQuality
 from qsleeperfantasybot.player_model import Player, create_player_from_dict
+from qsleeperfantasybot.snapshot_cache import SettingsKey, SnapshotCache, ValueSnapshot
+from qsleeperfantasybot.snapshot_store import SnapshotStore
+from qsleeperfantasybot.value_history import ValueHistoryStore
 
 BASE_URL = "https://api.fantasycalc.com/values/current"
+ASSET_NAMES_KEY = SettingsKey.create(is_dynasty=True, num_qbs=1, num_teams=12, ppr=1)
+STALE_WHILE_REVALIDATE_SECONDS = 60
+RESTORED_STALE_WHILE_REVALIDATE_SECONDS = 7 * 24 * 60 * 60
+STALE_TIMEOUT_SECONDS = 3
+
+circuit_breaker = CircuitBreaker("FantasyCalc")
 
 _cached_asset_names: List[str] = []
+_asset_index = AutocompleteIndex([], [])
 _asset_names_loaded = False
 
 
+class FantasyCalcError(Exception):
+    """Raised when FantasyCalc values cannot be fetched: an error response, a network failure or an open circuit."""
+
+
+@dataclass
+class AssetMatch:
+    """
+    Result of resolving one queried asset name.
+
+    Attributes:
+        query (str): The name as it was queried.
+        player (Optional[Player]): The matched player, or None if nothing matched.
+        quality (MatchQuality): How the player was matched.
+        entry (Optional[int]): The matched entry of the snapshot, or None if nothing matched.
+    """
+
+    query: str
+    player: Player | None
+    quality: MatchQuality
+    entry: int | None = None
+
+
 def create_lookup_dict(players: List[Dict[str, Any]]) -> Dict[str, Player]:
     """
     Creates a lookup dictionary from a list of player dictionaries.
@@ -56,32 +116,183 @@ def create_lookup_dict(players: List[Dict[str, Any]]) -> Dict[str, Player]:
 async def get_cached_asset_names(force: bool = False) -> List[str]:
     global _cached_asset_names, _asset_names_loaded
     if not _asset_names_loaded or force:
-        await fetch_asset_names()
+        await fetch_asset_names(force=force)
     return _cached_asset_names
 
 
-async def fetch_asset_names() -> None:
-    global _cached_asset_names, _asset_names_loaded
-    if _asset_names_loaded:
+async def get_asset_index() -> AutocompleteIndex:
+    """Returns the autocomplete index over the cached asset names, loading the names first if needed."""
+    if not _asset_names_loaded:
+        await fetch_asset_names()
+    return _asset_index
+
+
+async def fetch_asset_names(force: bool = False) -> None:
+    if _asset_names_loaded and not force:
         return  # Already fetched
+    snapshot = await (snapshot_cache.refresh(ASSET_NAMES_KEY) if force else snapshot_cache.get(ASSET_NAMES_KEY))
+    _update_asset_names(snapshot)
+
+
+def _update_asset_names(snapshot: ValueSnapshot) -> None:
+    """Rebuilds the cached asset names and autocomplete index whenever the autocomplete snapshot is refreshed."""
+    global _cached_asset_names, _asset_index, _asset_names_loaded
+    if snapshot.key != ASSET_NAMES_KEY:
+        return
+    _cached_asset_names = list(snapshot.names)
+    _asset_index = AutocompleteIndex(_cached_asset_names, snapshot.values)
+    logger.debug(f"Cached {_cached_asset_names[:10]}... ({len(_cached_asset_names)} total)")
+    _asset_names_loaded = True
+
+
+async def fetch_values(key: SettingsKey) -> List[Dict[str, Any]]:
+    """Downloads the raw FantasyCalc values payload for the given league settings.
+    Calls go through the FantasyCalc circuit breaker, so after repeated failures they fail immediately until the
+    cooldown has passed instead of waiting on a dead endpoint. Only error responses, network errors and timeouts
+    count as failures; a cancelled call, e.g. on shutdown, leaves the circuit as it was.
+    Args:
+        key (SettingsKey): The league settings to fetch values for.
+    Returns:
+        List[Dict[str, Any]]: The raw list of asset dictionaries returned by the API.
+    Raises:
+        FantasyCalcError: If the API returns a non-200 status code, the request fails or the circuit is open.
+    """
     params = {
-        "isDynasty": __import__("json").dumps(True),
-        "numQbs": str(1),
-        "numTeams": str(12),
-        "ppr": str(1),
+        "isDynasty": json.dumps(key.is_dynasty),
+        "numQbs": str(key.num_qbs),
+        "numTeams": str(key.num_teams),
+        "ppr": f"{key.ppr:g}",
     }
-    async with aiohttp.ClientSession() as session:
+    try:
+        trial = circuit_breaker.before_call()
+    except CircuitOpenError as e:
+        raise FantasyCalcError(str(e)) from e
+    try:
+        session = await get_session()
         async with session.get(BASE_URL, params=params) as resp:
             if resp.status != 200:
                 text = await resp.text()
-                raise Exception(f"FantasyCalc API error {resp.status}: {text}")
-            response = await resp.json()
-            logger.debug(f"Fetched {len(response)} assets from FantasyCalc API")
-            _cached_asset_names = [
-                item["player"]["name"] for item in response if "player" in item and "name" in item["player"]
-            ]
-            logger.debug(f"Cached {_cached_asset_names[:10]}... ({len(_cached_asset_names)} total)")
-            _asset_names_loaded = True
+                raise FantasyCalcError(f"FantasyCalc API error {resp.status}: {text}")
+            response: List[Dict[str, Any]] = await resp.json()
+    except FantasyCalcError:
+        circuit_breaker.record_failure()
+        raise
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        circuit_breaker.record_failure()
+        raise FantasyCalcError(f"FantasyCalc request failed: {e!r}") from e
+    except BaseException:
+        circuit_breaker.release(trial)
+        raise
+    circuit_breaker.record_success()
+    logger.debug(f"Fetched {len(response)} assets from FantasyCalc API for {key}")
+    return response
+
+
+async def _load_snapshot(key: SettingsKey) -> ValueSnapshot:
+    fetched_at = time.time()
+    response = await fetch_values(key)
+    try:
+        await asyncio.to_thread(snapshot_store.save, key, fetched_at, response)
+    except OSError as e:
+        logger.warning(f"Could not persist value snapshot {key}: {e}")
+    return ValueSnapshot(key=key, assets=response, fetched_at=fetched_at)
+
+
+snapshot_store = SnapshotStore()
+value_history = ValueHistoryStore()
+snapshot_cache = SnapshotCache(
+    _load_snapshot,
+    stale_while_revalidate=STALE_WHILE_REVALIDATE_SECONDS,
+    restored_stale_while_revalidate=RESTORED_STALE_WHILE_REVALIDATE_SECONDS,
+    stale_if_error=True,
+    stale_timeout=STALE_TIMEOUT_SECONDS,
+)
+snapshot_cache.add_listener(_update_asset_names)
+snapshot_cache.add_listener(value_history.record_in_background)
+
+
+def _read_snapshots() -> List[ValueSnapshot]:
+    """Reads, parses and indexes every persisted snapshot and records it in the value history.
+    Runs in a worker thread, so the file I/O and parsing never block the event loop.
+    """
+    snapshots = []
+    for persisted in snapshot_store.load_all():
+        snapshot = ValueSnapshot(
+            key=persisted.key, assets=persisted.assets, fetched_at=persisted.fetched_at, restored=True
+        )
+        value_history.record(snapshot)
+        snapshots.append(snapshot)
+    return snapshots
+
+
+async def restore_snapshots() -> int:
+    """Loads every persisted snapshot from disk into the snapshot cache with its original fetch timestamp.
+    Restored snapshots are served immediately and, once expired, revalidated in the background for up to
+    RESTORED_STALE_WHILE_REVALIDATE_SECONDS. Snapshots fetched later only get the short STALE_WHILE_REVALIDATE_SECONDS
+    window, after which lookups wait for the reload and fall back to the old snapshot only if it fails.
+    The files are read and parsed in a worker thread; only inserting the parsed snapshots runs on the event loop.
+    Returns:
+        int: The number of restored snapshots.
+    """
+    start_time = time.perf_counter()
+    restored = 0
+    for snapshot in await asyncio.to_thread(_read_snapshots):
+        if snapshot.key in snapshot_cache:
+            continue
+        # The value history already has the snapshot's day, so its listener returns without starting a thread.
+        snapshot_cache.put(snapshot)
+        restored += 1
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"Restored {restored} value snapshots from disk in {elapsed:.6f} seconds")
+    return restored
+
+
+async def get_value_snapshot(
+    is_dynasty: bool = False,
+    num_qbs: int = 1,
+    num_teams: int = 12,
+    ppr: float = 1,
+) -> ValueSnapshot:
+    """Returns the value snapshot for the given league settings.
+    Snapshots are cached per settings combination, so repeated and concurrent lookups share one fetch and one
+    parsed lookup table until the snapshot expires.
+    Args:
+        is_dynasty (bool, optional): Whether the league is a dynasty league. Defaults to False.
+        num_qbs (int, optional): Number of starting quarterbacks in the league. Defaults to 1.
+        num_teams (int, optional): Number of teams in the league. Defaults to 12.
+        ppr (float, optional): Points per reception setting. Defaults to 1.
+    Returns:
+        ValueSnapshot: The parsed snapshot for the settings.
+    Raises:
+        FantasyCalcError: If FantasyCalc is unavailable and no earlier snapshot for the settings is cached.
+    """
+    return await snapshot_cache.get(SettingsKey.create(is_dynasty, num_qbs, num_teams, ppr))
+
+
+def resolve_player(snapshot: ValueSnapshot, player_name: str) -> AssetMatch:
+    """Resolves a player name against an already loaded snapshot using its prebuilt name index.
+    Only the matched asset is materialized into a Player object.
+    Args:
+        snapshot (ValueSnapshot): The snapshot to search.
+        player_name (str): The name of the player to search for.
+    Returns:
+        AssetMatch: The matched player and the match quality. Draft pick spellings such as "2026 1.05" or
+        "2027 Early 1st" resolve through the pick index first; a pick FantasyCalc does not list gets an interpolated
+        value and no entry. Otherwise exact name matches win, then names that are equal after normalizing accents,
+        punctuation and suffixes, then the best ranked substring match.
+    """
+    logger.debug(f"Searching for player: {player_name}")
+    pick = parse_pick(player_name)
+    found = None if pick is None else snapshot.pick_index.lookup(pick)
+    if found is not None:
+        if found.entry is None:
+            player = snapshot.derived_player(found.template, found.key.label, found.value)
+            return AssetMatch(player_name, player, MatchQuality.INTERPOLATED)
+        exact = snapshot.names[found.entry].lower() == player_name.strip().lower()
+        quality = MatchQuality.EXACT if exact else MatchQuality.NORMALIZED
+        return AssetMatch(player_name, snapshot.player(found.entry), quality, found.entry)
+    entry, quality = snapshot.name_index.match(player_name)
+    return AssetMatch(player_name, None if entry is None else snapshot.player(entry), quality, entry)
 
 
 async def get_player_value(
@@ -101,33 +312,24 @@ async def get_player_value(
         ppr (float, optional):
           Points per reception setting (0 for standard, 0.5 for half PPR, 1 for full PPR, etc.). Defaults to 1.
     Returns:
-        Player or None: The player object if found (exact or substring match), otherwise None.
+        Player or None: The player object if found (exact, normalized or substring match), otherwise None.
     Raises:
-        Exception: If the FantasyCalc API returns a non-200 status code.
+        FantasyCalcError: If FantasyCalc is unavailable and no earlier snapshot for the settings is cached.
     """
-    params = {
-        "isDynasty": __import__("json").dumps(is_dynasty),
-        "numQbs": str(num_qbs),
-        "numTeams": str(num_teams),
-        "ppr": str(ppr),
-    }
-
-    async with aiohttp.ClientSession() as session:
-        async with session.get(BASE_URL, params=params) as resp:
-            if resp.status != 200:
-                text = await resp.text()
-                raise Exception(f"FantasyCalc API error {resp.status}: {text}")
-            response = await resp.json()
-    player_lookup = create_lookup_dict(response)
-    # Try exact match first
-    normalized_query = player_name.lower()
-    logger.debug(f"Searching for player: {player_name}")
+    snapshot = await get_value_snapshot(is_dynasty=is_dynasty, num_qbs=num_qbs, num_teams=num_teams, ppr=ppr)
+    return resolve_player(snapshot, player_name).player
 
-    if normalized_query in player_lookup:
-        return player_lookup[normalized_query]
 
-    # Fallback to substring match
-    for name, player in player_lookup.items():
-        if normalized_query in name:
-            return player
-    return None
+async def get_player_values(names: List[str], settings: SettingsKey) -> List[AssetMatch]:
+    """Resolves a list of asset names against a single snapshot for the given league settings.
+    The snapshot is loaded (or taken from the cache) once, so resolving ten names costs about the same as one.
+    Args:
+        names (List[str]): Asset names to resolve.
+        settings (SettingsKey): The league settings to value the assets with.
+    Returns:
+        List[AssetMatch]: One match per queried name, in the same order as the input.
+    Raises:
+        FantasyCalcError: If FantasyCalc is unavailable and no earlier snapshot for the settings is cached.
+    """
+    snapshot = await snapshot_cache.get(settings)
+    return [resolve_player(snapshot, name) for name in names]
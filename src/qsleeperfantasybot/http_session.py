@@ -0,0 +1,97 @@
+"""Shared, pooled aiohttp session for all outbound HTTP from the bot.
+Opening a ClientSession per request pays for DNS, TCP and TLS setup on every call. Instead one session with a
+keep-alive connection pool is opened when the bot starts (or lazily on first use in scripts) and reused by every
+module that talks to FantasyCalc or Sleeper, which also caps the number of outbound sockets under burst load.
+Functions:
+    - open_session(): Opens the shared session if it is not already open and returns it.
+    - get_session(): Returns the shared session, opening it lazily if needed.
+    - close_session(): Closes the shared session and its connection pool.
+    - session_scope(): Async context manager that opens the shared session and closes it on exit.
+Environment Variables:
+    - HTTP_TOTAL_TIMEOUT: Total timeout in seconds for one request. Defaults to 15.
+    - HTTP_CONNECT_TIMEOUT: Timeout in seconds for acquiring a connection. Defaults to 5.
+    - HTTP_MAX_CONNECTIONS: Maximum number of open connections in the pool. Defaults to 100.
+    - HTTP_MAX_CONNECTIONS_PER_HOST: Maximum number of open connections per host. Defaults to 10.
+    - HTTP_KEEPALIVE_TIMEOUT: Seconds an idle connection is kept alive. Defaults to 30.
+"""
+
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Self
+
+import aiohttp
+
+from qsleeperfantasybot.logger import logger
+
+_session: aiohttp.ClientSession | None = None
+
+
+@dataclass(frozen=True)
+class HttpSettings:
+    """Connection pool and timeout settings for the shared session."""
+
+    total_timeout: float = 15.0
+    connect_timeout: float = 5.0
+    max_connections: int = 100
+    max_connections_per_host: int = 10
+    keepalive_timeout: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Create settings from environment variables, falling back to the defaults."""
+        return cls(
+            total_timeout=float(os.getenv("HTTP_TOTAL_TIMEOUT", cls.total_timeout)),
+            connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", cls.connect_timeout)),
+            max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", cls.max_connections)),
+            max_connections_per_host=int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", cls.max_connections_per_host)),
+            keepalive_timeout=float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", cls.keepalive_timeout)),
+        )
+
+
+async def open_session(settings: HttpSettings | None = None) -> aiohttp.ClientSession:
+    """Open the shared session if needed and return it.
+    Args:
+        settings (HttpSettings, optional): Pool and timeout settings. Defaults to HttpSettings.from_env().
+    Returns:
+        aiohttp.ClientSession: The shared session.
+    """
+    global _session
+    if _session is None or _session.closed:
+        settings = settings or HttpSettings.from_env()
+        connector = aiohttp.TCPConnector(
+            limit=settings.max_connections,
+            limit_per_host=settings.max_connections_per_host,
+            keepalive_timeout=settings.keepalive_timeout,
+            ttl_dns_cache=300,
+        )
+        timeout = aiohttp.ClientTimeout(total=settings.total_timeout, connect=settings.connect_timeout)
+        _session = aiohttp.ClientSession(connector=connector, timeout=timeout, raise_for_status=False)
+        logger.debug(f"Opened shared HTTP session with {settings}")
+    return _session
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared session, opening it lazily for callers outside the bot such as CLI scripts."""
+    if _session is None or _session.closed:
+        return await open_session()
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session and release its pooled connections."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.debug("Closed shared HTTP session")
+    _session = None
+
+
+@asynccontextmanager
+async def session_scope(settings: HttpSettings | None = None) -> AsyncIterator[aiohttp.ClientSession]:
+    """Open the shared session for the duration of the block and close it afterwards."""
+    session = await open_session(settings)
+    try:
+        yield session
+    finally:
+        await close_session()
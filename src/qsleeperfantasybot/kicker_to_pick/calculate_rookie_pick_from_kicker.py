@@ -1,5 +1,6 @@
 """Sleeper Kicker-to-Rookie Pick Converter."""
 
+import asyncio
 import json
 import time
 from datetime import datetime
@@ -7,75 +8,86 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from qsleeperfantasybot.logger import logger
-
-import requests
+from qsleeperfantasybot.sleeper.api.client import sleeper_client
 
 PLAYER_CACHE_FILE = "nfl_players.json"
 CACHE_EXPIRY = 86400  # 24 hours
 LOW_REMAINING_THRESHOLD = 5
-HTTP_OK = 200
 
 ROOT_PATH = Path(__file__).resolve().parents[3]
 
 
-def fetch_data(url: str) -> Optional[Dict[str, Any] | List[Any]]:
-    """Fetch JSON data from a given URL."""
+async def fetch_data(url: str) -> Optional[Dict[str, Any] | List[Any]]:
+    """Fetch JSON data from a given Sleeper URL.
+
+    Requests go through the shared async Sleeper client and its pooled session, so they take tokens from the Sleeper
+    rate limiter, honor Retry-After on 429, are bounded by the HttpSettings timeouts and are shared by scans running
+    at the same time. Returns None if the request fails.
+    """
+    data = await sleeper_client.get_json(url)
+    return data if isinstance(data, (dict, list)) else None
+
+
+def read_player_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Read the local player data if it is younger than 24 hours, or return None."""
+    if not cache_path.is_file() or time.time() - cache_path.stat().st_mtime >= CACHE_EXPIRY:
+        return None
     try:
-        response = requests.get(url)
-        return response.json() if response.status_code == HTTP_OK else None
-    except Exception as e:
-        logger.exception("Network error fetching %s: %s", url, e)
+        with cache_path.open("r", encoding="utf-8") as f:
+            return dict(json.load(f))
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Cache file corrupted or unreadable: {e}. Re-fetching...")
         return None
 
 
-def get_players() -> Dict[str, Any]:
+def write_player_cache(cache_path: Path, data: Dict[str, Any]) -> None:
+    """Write the player data to the local cache file."""
+    with cache_path.open("w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+async def get_players() -> Dict[str, Any]:
     """Integrated from sleeper_fetch_players logic.
 
-    Checks if local player data exists; if not or if old, fetches from Sleeper.
+    Checks if local player data exists; if not or if old, fetches from Sleeper. The player file is several MB, so it
+    is read and written off the event loop.
     """
 
     cache_path = ROOT_PATH / "sleeper_data" / PLAYER_CACHE_FILE
-    if cache_path.is_file():
-        # Check if file is older than 24 hours
-        file_age = time.time() - cache_path.stat().st_mtime
-        if file_age < CACHE_EXPIRY:
-            try:
-                with cache_path.open("r", encoding="utf-8") as f:
-                    return dict(json.load(f))
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Cache file corrupted or unreadable: {e}. Re-fetching...")
+    cached = await asyncio.to_thread(read_player_cache, cache_path)
+    if cached is not None:
+        return cached
 
     logger.info("Fetching fresh player data from Sleeper (this may take a moment)...")
-    data = fetch_data("https://api.sleeper.app/v1/players/nfl")
+    data = await fetch_data("https://api.sleeper.app/v1/players/nfl")
     if data and isinstance(data, dict):
-        with cache_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f)
+        await asyncio.to_thread(write_player_cache, cache_path, data)
         return data
     return {}
 
 
-def get_auto_draft_id(league_id: str) -> Optional[str]:
+async def get_auto_draft_id(league_id: str) -> Optional[str]:
     """Fetch the most recent draft ID for a given league."""
-    drafts = fetch_data(f"https://api.sleeper.app/v1/league/{league_id}/drafts")
+    drafts = await fetch_data(f"https://api.sleeper.app/v1/league/{league_id}/drafts")
     if isinstance(drafts, list) and len(drafts) > 0:
         draft_id = drafts[0]["draft_id"]
         return draft_id if isinstance(draft_id, str) else None
     return None
 
 
-def get_league_info(league_id: str) -> Optional[Dict[str, Any]]:
+async def get_league_info(league_id: str) -> Optional[Dict[str, Any]]:
     """Fetch general league settings and name."""
-    data = fetch_data(f"https://api.sleeper.app/v1/league/{league_id}")
+    data = await fetch_data(f"https://api.sleeper.app/v1/league/{league_id}")
     return data if isinstance(data, dict) else None
 
 
-def resolve_draft_id(league_id: str, draft_id: Optional[str]) -> Optional[str]:
+async def resolve_draft_id(league_id: str, draft_id: Optional[str]) -> Optional[str]:
     """Resolve the draft ID, fetching the latest if not provided."""
     if draft_id:
         return draft_id
 
     logger.info(f"Searching for latest draft in league {league_id}...")
-    draft_id = get_auto_draft_id(league_id)
+    draft_id = await get_auto_draft_id(league_id)
     if not draft_id:
         logger.error("Error: No drafts found for this league.")
         return None
@@ -83,12 +95,14 @@ def resolve_draft_id(league_id: str, draft_id: Optional[str]) -> Optional[str]:
     return draft_id
 
 
-def fetch_draft_data(
+async def fetch_draft_data(
     league_id: str, draft_id: str
 ) -> Tuple[Optional[Dict[str, Any] | List[Any]], Optional[Dict[str, Any] | List[Any]]]:
-    """Fetch users and draft picks data."""
-    users_data = fetch_data(f"https://api.sleeper.app/v1/league/{league_id}/users")
-    draft_picks = fetch_data(f"https://api.sleeper.app/v1/draft/{draft_id}/picks")
+    """Fetch users and draft picks data concurrently."""
+    users_data, draft_picks = await asyncio.gather(
+        fetch_data(f"https://api.sleeper.app/v1/league/{league_id}/users"),
+        fetch_data(f"https://api.sleeper.app/v1/draft/{draft_id}/picks"),
+    )
     return users_data, draft_picks
 
 
@@ -145,26 +159,25 @@ def write_log_file(final_name: str, final_text: str) -> None:
     except IOError as e:
         logger.error(f"Error writing to log file: {e}")
 
-def run_kicker_scan(league_id: str, draft_id: Optional[str], name: str, teams: int, rounds: int) -> str | None:
+async def run_kicker_scan(league_id: str, draft_id: Optional[str], name: str, teams: int, rounds: int) -> str | None:
     """Sleeper Kicker-to-Rookie Pick Converter.
 
     <League ID>: The numeric ID found in your Sleeper league URL.
 
     [Draft ID]: (Optional) The numeric ID for the draft. If omitted, the script finds the latest draft.
     """
-    league_data = get_league_info(league_id)
+    league_data = await get_league_info(league_id)
     if not league_data:
         logger.error("Error: Could not find league with that ID.")
         return None
 
     final_name = league_data.get("name", name)
 
-    draft_id = resolve_draft_id(league_id, draft_id)
+    draft_id = await resolve_draft_id(league_id, draft_id)
     if not draft_id:
         return None
 
-    players = get_players()
-    users_data, draft_picks = fetch_draft_data(league_id, draft_id)
+    players, (users_data, draft_picks) = await asyncio.gather(get_players(), fetch_draft_data(league_id, draft_id))
 
     if not users_data or not draft_picks:
         logger.error("Error: Failed to retrieve league users or draft picks.")
@@ -186,5 +199,5 @@ def run_kicker_scan(league_id: str, draft_id: Optional[str], name: str, teams: i
         final_name=final_name)
 
     logger.info(final_text)
-    write_log_file(final_name, final_text)
+    await asyncio.to_thread(write_log_file, final_name, final_text)
     return final_text
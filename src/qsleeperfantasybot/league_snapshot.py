@@ -0,0 +1,229 @@
+"""One consistent, joined view of a Sleeper league.
+League features need the league settings, rosters, users, traded picks, drafts and NFL state together. A
+LeagueSnapshot fetches all six concurrently through the async Sleeper client, parses them into typed models and joins
+them once by roster ID and owner ID, so commands look up a team's owner, a user's roster or the current owner of a
+traded pick with a dictionary lookup. Snapshots are cached per league for a short TTL and every snapshot carries a
+version, so commands that run at the same time share one view and derived results can tell when it was replaced.
+Concurrent loads of the same league share one fetch.
+Classes:
+    LeagueSnapshot: The parsed and joined resources of one league.
+    LeagueSnapshotCache: Loads and caches league snapshots.
+Functions:
+    build_league_snapshot(league_id, league, rosters, users, traded_picks, drafts, nfl_state): Parses and joins the
+        raw Sleeper responses of a league.
+Globals:
+    league_snapshots: Cache on the shared Sleeper client, used by the command handlers.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.single_flight import SingleFlight
+from qsleeperfantasybot.sleeper.api.client import SleeperClient, sleeper_client
+from qsleeperfantasybot.sleeper.model.draft import Draft, TradedPick
+from qsleeperfantasybot.sleeper.model.league import League, create_league_from_dict
+from qsleeperfantasybot.sleeper.model.nfl_state import NflState
+from qsleeperfantasybot.sleeper.model.roster import Roster
+from qsleeperfantasybot.sleeper.model.user import LeagueMember
+
+DEFAULT_TTL_SECONDS = 120
+DEFAULT_MAX_ENTRIES = 256
+
+_versions = count(1)
+
+
+@dataclass
+class LeagueSnapshot:
+    """
+    The parsed resources of one league, joined by roster ID and owner ID.
+
+    Attributes:
+        league_id (str): The Sleeper league ID.
+        league (League): The league and its settings.
+        league_data (Dict[str, Any]): The league as returned by the Sleeper API, for fields the model does not cover
+            such as scoring settings.
+        rosters (Dict[int, Roster]): Rosters by roster ID.
+        members (Dict[str, LeagueMember]): League users by user ID.
+        traded_picks (List[TradedPick]): Future draft picks that changed hands.
+        drafts (List[Draft]): Drafts of the league, the most recent first.
+        nfl_state (Optional[NflState]): The current NFL state, None if it could not be fetched.
+        fetched_at (float): Unix timestamp of when the resources were fetched.
+        version (int): Unique, increasing stamp of this snapshot.
+    """
+
+    league_id: str
+    league: League
+    league_data: Dict[str, Any]
+    rosters: Dict[int, Roster]
+    members: Dict[str, LeagueMember]
+    traded_picks: List[TradedPick] = field(default_factory=list)
+    drafts: List[Draft] = field(default_factory=list)
+    nfl_state: Optional[NflState] = None
+    fetched_at: float = field(default_factory=time.time)
+    version: int = field(default_factory=lambda: next(_versions))
+    _user_rosters: Dict[str, int] = field(init=False, repr=False, default_factory=dict)
+    _pick_owners: Dict[Tuple[str, int, int], int] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for roster in self.rosters.values():
+            for user_id in [roster.owner_id, *roster.co_owners]:
+                if user_id:
+                    self._user_rosters.setdefault(user_id, roster.roster_id)
+        for pick in self.traded_picks:
+            self._pick_owners[(pick.season, pick.round, pick.roster_id)] = pick.owner_id
+
+    def owner(self, roster_id: int) -> LeagueMember | None:
+        """Return the owner of a roster, or None for an orphaned or unknown roster."""
+        roster = self.rosters.get(roster_id)
+        return self.members.get(roster.owner_id) if roster is not None and roster.owner_id else None
+
+    def team_name(self, roster_id: int) -> str:
+        """Return the team name of a roster, its owner's display name, or "Roster <id>"."""
+        owner = self.owner(roster_id)
+        return owner.name if owner is not None and owner.name else f"Roster {roster_id}"
+
+    @property
+    def team_names(self) -> Dict[int, str]:
+        """Team names by roster ID."""
+        return {roster_id: self.team_name(roster_id) for roster_id in self.rosters}
+
+    def roster_of(self, user_id: str) -> Roster | None:
+        """Return the roster a user owns or co-owns, or None."""
+        roster_id = self._user_rosters.get(user_id)
+        return self.rosters.get(roster_id) if roster_id is not None else None
+
+    def pick_owner(self, season: str, round: int, roster_id: int) -> int:
+        """Return the roster ID that currently owns a roster's pick of a season and round."""
+        return self._pick_owners.get((str(season), round, roster_id), roster_id)
+
+    def picks_owned(self, roster_id: int, seasons: List[str], rounds: int) -> List[Tuple[str, int, int]]:
+        """Return the picks a roster currently owns as (season, round, original roster ID), in draft order."""
+        return [
+            (season, number, original)
+            for season in seasons
+            for number in range(1, rounds + 1)
+            for original in sorted(self.rosters)
+            if self.pick_owner(season, number, original) == roster_id
+        ]
+
+
+def _records(data: Any, parse: Callable[[Dict[str, Any]], Any], resource: str) -> List[Any]:
+    """Parse every entry of a list response, skipping the entries that do not parse."""
+    if not isinstance(data, list):
+        return []
+    records = []
+    for item in data:
+        try:
+            records.append(parse(item))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping malformed {resource} entry: {e!r}")
+    return records
+
+
+def build_league_snapshot(
+    league_id: str,
+    league: Any,
+    rosters: Any,
+    users: Any,
+    traded_picks: Any = None,
+    drafts: Any = None,
+    nfl_state: Any = None,
+) -> LeagueSnapshot | None:
+    """Parses and joins the Sleeper responses of a league.
+    Args:
+        league_id (str): The Sleeper league ID.
+        league (Any): The league resource.
+        rosters (Any): The league rosters resource.
+        users (Any): The league users resource.
+        traded_picks (Any): The league traded picks resource.
+        drafts (Any): The league drafts resource.
+        nfl_state (Any): The NFL state resource.
+    Returns:
+        LeagueSnapshot or None: The joined snapshot, or None if the league or its rosters are missing or malformed.
+        Missing users, traded picks, drafts or NFL state leave those parts empty.
+    """
+    if not isinstance(league, dict) or not isinstance(rosters, list):
+        return None
+    try:
+        parsed_league = create_league_from_dict(league)
+    except (KeyError, TypeError, ValueError) as e:
+        logger.warning(f"League {league_id} could not be parsed: {e!r}")
+        return None
+    parsed_drafts: List[Draft] = _records(drafts, Draft.from_dict, "draft")
+    return LeagueSnapshot(
+        league_id=league_id,
+        league=parsed_league,
+        league_data=league,
+        rosters={roster.roster_id: roster for roster in _records(rosters, Roster.from_dict, "roster")},
+        members={member.user_id: member for member in _records(users, LeagueMember.from_dict, "user")},
+        traded_picks=_records(traded_picks, TradedPick.from_dict, "traded pick"),
+        drafts=sorted(parsed_drafts, key=lambda draft: (draft.season, draft.start_time or 0), reverse=True),
+        nfl_state=NflState.from_dict(nfl_state) if isinstance(nfl_state, dict) else None,
+    )
+
+
+class LeagueSnapshotCache:
+    """Loads league snapshots and keeps an LRU cache of them per league.
+
+    Args:
+        client (SleeperClient): The client the resources are fetched with.
+        ttl (float): Seconds a snapshot is reused. Defaults to 2 minutes, the TTL of cached rosters.
+        max_entries (int): Maximum number of leagues kept in memory. Defaults to 256.
+        clock (Callable[[], float]): Time source, injectable for tests. Defaults to time.time.
+    """
+
+    def __init__(
+        self,
+        client: SleeperClient,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.client = client
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._snapshots: "OrderedDict[str, LeagueSnapshot]" = OrderedDict()
+        self._flights = SingleFlight()
+
+    async def get(self, league_id: str) -> LeagueSnapshot | None:
+        """Return the snapshot of a league, loading it if there is no cached snapshot younger than the TTL.
+        Returns:
+            LeagueSnapshot or None: The snapshot, or None if the league or its rosters cannot be loaded.
+        """
+        snapshot = self._snapshots.get(league_id)
+        if snapshot is not None and self._clock() - snapshot.fetched_at < self.ttl:
+            self._snapshots.move_to_end(league_id)
+            return snapshot
+        return await self._flights.do(league_id, lambda: self._load(league_id))
+
+    def invalidate(self, league_id: str) -> None:
+        """Drop the cached snapshot of a league, so the next get loads it again."""
+        self._snapshots.pop(league_id, None)
+
+    async def _load(self, league_id: str) -> LeagueSnapshot | None:
+        responses = await asyncio.gather(
+            self.client.get_specific_league(league_id),
+            self.client.get_rosters_in_a_league(league_id),
+            self.client.get_users_in_a_league(league_id),
+            self.client.get_traded_picks_in_league(league_id),
+            self.client.get_all_drafts_for_a_league(league_id),
+            self.client.get_nfl_state(),
+        )
+        snapshot = build_league_snapshot(league_id, *responses)
+        if snapshot is not None:
+            snapshot.fetched_at = self._clock()
+            self._snapshots[league_id] = snapshot
+            self._snapshots.move_to_end(league_id)
+            while len(self._snapshots) > self.max_entries:
+                self._snapshots.popitem(last=False)
+            logger.debug(f"Loaded league {league_id} snapshot version {snapshot.version}")
+        return snapshot
+
+
+league_snapshots = LeagueSnapshotCache(sleeper_client)
@@ -0,0 +1,127 @@
+"""League-level trade tools that join Sleeper rosters with FantasyCalc values.
+Leagues are read from the shared league snapshots, the FantasyCalc settings are derived from the league itself and
+the rosters' Sleeper player IDs are mapped to value snapshot entries, so the trade engines can run on plain arrays.
+Functions:
+    league_settings_key(league): Derives the FantasyCalc settings of a Sleeper league.
+    league_matrix(league_id): Returns the cached or freshly built value matrix of a league.
+    propose_trades(league_id, roster_a, roster_b, max_assets): Returns fair trade proposals between two rosters as a
+        message.
+    shop_asset(league_id, roster_id, asset_name): Returns the packages every other team could offer for an asset as a
+        message.
+"""
+
+import asyncio
+from typing import Any, Dict
+
+from qsleeperfantasybot.fantasycalc import resolve_player, snapshot_cache
+from qsleeperfantasybot.messages import construct_proposals_message, construct_shop_message
+from qsleeperfantasybot.league_snapshot import league_snapshots
+from qsleeperfantasybot.snapshot_cache import SettingsKey
+from qsleeperfantasybot.trade_finder import LeagueMatrix, build_league_matrix, trade_finder
+from qsleeperfantasybot.trade_proposals import proposal_generator, starter_slots
+
+snapshot_cache.add_listener(trade_finder.evict_replaced)
+
+
+def league_settings_key(league: Dict[str, Any]) -> SettingsKey:
+    """Derives the FantasyCalc settings of a Sleeper league from its type, roster positions and scoring.
+    Args:
+        league (Dict[str, Any]): The league as returned by the Sleeper API.
+    Returns:
+        SettingsKey: Dynasty or redraft, 2 QBs for superflex or 2QB leagues, the number of rosters and the PPR.
+    """
+    positions = league.get("roster_positions") or []
+    superflex = "SUPER_FLEX" in positions or positions.count("QB") > 1
+    return SettingsKey.create(
+        is_dynasty=(league.get("settings") or {}).get("type") == 2,
+        num_qbs=2 if superflex else 1,
+        num_teams=league.get("total_rosters") or 12,
+        ppr=(league.get("scoring_settings") or {}).get("rec", 1),
+    )
+
+
+async def propose_trades(league_id: str, roster_a: int, roster_b: int, max_assets: int = 3) -> str:
+    """Fetches a league and two of its rosters and returns fair trade proposals between them as a message.
+    Args:
+        league_id (str): The Sleeper league ID.
+        roster_a (int): The Sleeper roster ID of the first team.
+        roster_b (int): The Sleeper roster ID of the second team.
+        max_assets (int): Largest number of assets one side gives. Defaults to 3.
+    Returns:
+        str: The formatted proposals, or an error message if the league or rosters cannot be found.
+    Raises:
+        FantasyCalcError: If FantasyCalc is unavailable and no earlier snapshot for the settings is cached.
+    """
+    league = await league_snapshots.get(league_id)
+    if league is None:
+        return f"❌ Could not load league `{league_id}` from Sleeper."
+    if roster_a not in league.rosters or roster_b not in league.rosters:
+        return f"❌ League `{league_id}` has no roster {roster_a if roster_a not in league.rosters else roster_b}."
+
+    settings = league_settings_key(league.league_data)
+    snapshot = await snapshot_cache.get(settings)
+    slots = starter_slots(superflex=settings.num_qbs == 2)
+    entries_a = snapshot.entries_for_sleeper_ids(league.rosters[roster_a].players)
+    entries_b = snapshot.entries_for_sleeper_ids(league.rosters[roster_b].players)
+    proposals = await asyncio.to_thread(
+        proposal_generator.propose, snapshot, entries_a, entries_b, slots, max_assets=max_assets
+    )
+    return construct_proposals_message(roster_a, roster_b, proposals)
+
+
+async def league_matrix(league_id: str) -> LeagueMatrix | None:
+    """Returns the value matrix of a league, building it from the league snapshot only on a cache miss.
+    A cached matrix is reused while it is younger than the finder's TTL and was built from the current value snapshot
+    and league snapshot.
+    Args:
+        league_id (str): The Sleeper league ID.
+    Returns:
+        LeagueMatrix or None: The league's value matrix, or None if the league cannot be loaded from Sleeper.
+    Raises:
+        FantasyCalcError: If FantasyCalc is unavailable and no earlier snapshot for the settings is cached.
+    """
+    league = await league_snapshots.get(league_id)
+    if league is None:
+        return None
+    matrix = trade_finder.cached(league_id)
+    if (
+        matrix is not None
+        and matrix.league_version == league.version
+        and await snapshot_cache.get(matrix.snapshot.key) is matrix.snapshot
+    ):
+        return matrix
+    settings = league_settings_key(league.league_data)
+    snapshot = await snapshot_cache.get(settings)
+    slots = starter_slots(superflex=settings.num_qbs == 2)
+    matrix = build_league_matrix(league_id, snapshot, list(league.rosters.values()), league.team_names, slots)
+    matrix.league_version = league.version
+    trade_finder.store(matrix)
+    return matrix
+
+
+async def shop_asset(league_id: str, roster_id: int, asset_name: str, limit: int = 5) -> str:
+    """Scans every other roster of a league for the packages they could offer for an asset.
+    Args:
+        league_id (str): The Sleeper league ID.
+        roster_id (int): The Sleeper roster ID of the shopping team.
+        asset_name (str): Name of the shopped asset.
+        limit (int): Maximum number of teams listed. Defaults to 5.
+    Returns:
+        str: The formatted packages, or an error message if the league, roster or asset cannot be found or the roster
+            does not hold the asset.
+    Raises:
+        FantasyCalcError: If FantasyCalc is unavailable and no earlier snapshot for the settings is cached.
+    """
+    matrix = await league_matrix(league_id)
+    if matrix is None:
+        return f"❌ Could not load league `{league_id}` from Sleeper."
+    if roster_id not in matrix.roster_ids:
+        return f"❌ League `{league_id}` has no roster {roster_id}."
+    match = resolve_player(matrix.snapshot, asset_name)
+    if match.entry is None:
+        return f"❌ Could not find an asset named `{asset_name}`."
+    if not matrix.holds(roster_id, match.entry):
+        return f"❌ Roster {roster_id} does not hold {matrix.snapshot.names[match.entry]}."
+    targets = trade_finder.shop(matrix, roster_id, match.entry, limit=limit)
+    entry = match.entry
+    return construct_shop_message(matrix.snapshot.names[entry], matrix.snapshot.values[entry], targets)
@@ -6,10 +6,23 @@ Functions:
     construct_dynasty_trade_message(
         Constructs a formatted message comparing two sides of a dynasty trade,
         including detailed breakdowns and indicating which side has the advantage.
+    construct_risers_message(
+        Constructs a formatted message listing the biggest value gainers and losers over a window of days.
+    construct_no_history_message(
+        Constructs the message shown when too few days of values are recorded to list risers.
+    construct_proposals_message(
+        Constructs a formatted message listing proposed trades between two rosters.
+    construct_shop_message(
+        Constructs a formatted message listing the packages other teams could offer for an asset.
 """
 
 from typing import List, Tuple
 
+from qsleeperfantasybot.trade_balancer import BalanceSuggestion
+from qsleeperfantasybot.trade_finder import TradeTarget
+from qsleeperfantasybot.trade_proposals import TradeProposal
+from qsleeperfantasybot.value_history import Mover
+
 
 def format_side(details: List[Tuple[str, int]]) -> str:
     """
@@ -26,16 +39,53 @@ def format_side(details: List[Tuple[str, int]]) -> str:
     return "\n".join([f" - {name}: {val}" for name, val in details])
 
 
+def format_total(total: int, details: List[Tuple[str, int]]) -> str:
+    """Formats a side total, followed by the raw sum of its asset values if the total was adjusted."""
+    raw = sum(value for _, value in details)
+    return str(total) if total == raw else f"{total} (raw sum {raw})"
+
+
+def format_suggestions(suggestions: List[BalanceSuggestion]) -> str:
+    """Formats balancing suggestions as " - A + B (value, gap left)" lines."""
+    return "\n".join(
+        f" - {' + '.join(suggestion.names)} ({sum(suggestion.values)}, {suggestion.remaining_gap:+d} left)"
+        for suggestion in suggestions
+    )
+
+
+def format_age(seconds: float) -> str:
+    """Formats an age in seconds as a short human readable duration, e.g. "45 minutes" or "3 days"."""
+    for unit, size in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if seconds >= size:
+            count = int(seconds // size)
+            return f"{count} {unit}{'s' if count != 1 else ''}"
+    return "less than a minute"
+
+
 def construct_dynasty_trade_message(
-    total_a: int, details_a: List[Tuple[str, int]], total_b: int, details_b: List[Tuple[str, int]]
+    total_a: int,
+    details_a: List[Tuple[str, int]],
+    total_b: int,
+    details_b: List[Tuple[str, int]],
+    stale_age: float | None = None,
+    unresolved: List[str] | None = None,
+    suggestions: List[BalanceSuggestion] | None = None,
+    refreshing: bool = False,
 ) -> str:
     """Constructs a formatted message comparing two sides of a dynasty trade.
 
     Args:
-        total_a (int): The total value for Side A.
+        total_a (int): The total value for Side A. The raw sum is shown next to it if the two differ.
         details_a (List[Tuple[str, int]]): A list of tuples containing player/item names and their values for Side A.
-        total_b (int): The total value for Side B.
+        total_b (int): The total value for Side B. The raw sum is shown next to it if the two differ.
         details_b (List[Tuple[str, int]]): A list of tuples containing player/item names and their values for Side B.
+        stale_age (Optional[float]): Age in seconds of the values if they are older than usual, or None if they are
+            current.
+        unresolved (Optional[List[str]]): Queried assets that could not be resolved and were counted as 0.
+        suggestions (Optional[List[BalanceSuggestion]]): Filler assets that would even out the trade for the side
+            without the advantage.
+        refreshing (bool): Whether stale values are shown because newer ones are being fetched, rather than because
+            FantasyCalc could not be reached. Defaults to False.
 
     Returns:
         str: A formatted string summarizing the trade comparison, including totals, details for each side, and which
@@ -43,9 +93,107 @@ def construct_dynasty_trade_message(
     """
     advantage = "Side A" if total_a > total_b else "Side B"
     diff = abs(total_a - total_b)
-    return (
+    message = (
         f"🔁 Dynasty Trade Comparison\n\n"
-        f"🅰️ Side A Total: {total_a}\n{format_side(details_a)}\n\n"
-        f"🅱️ Side B Total: {total_b}\n{format_side(details_b)}\n\n"
+        f"🅰️ Side A Total: {format_total(total_a, details_a)}\n{format_side(details_a)}\n\n"
+        f"🅱️ Side B Total: {format_total(total_b, details_b)}\n{format_side(details_b)}\n\n"
         f"➡️ **Advantage:** {advantage} by {diff} points"
     )
+    if suggestions:
+        trailing = "Side B" if advantage == "Side A" else "Side A"
+        message += f"\n\n⚖️ To even it out, {trailing} could add:\n{format_suggestions(suggestions)}"
+    if unresolved:
+        message += f"\n\n❓ Not found, counted as 0: {', '.join(unresolved)}"
+    if stale_age is not None and refreshing:
+        message += f"\n\n🔄 FantasyCalc values are being refreshed, these are from {format_age(stale_age)} ago."
+    elif stale_age is not None:
+        message += f"\n\n⚠️ FantasyCalc is unreachable, values are from {format_age(stale_age)} ago."
+    return message
+
+
+def format_movers(movers: List[Mover]) -> str:
+    """Formats value movers as " - name: +change (start → end)" lines, or a placeholder if there are none."""
+    if not movers:
+        return " - No changes recorded"
+    return "\n".join(
+        f" - {mover.name}: {mover.change:+d} ({mover.start_value} → {mover.end_value})" for mover in movers
+    )
+
+
+def construct_risers_message(
+    days: int, gainers: List[Mover], losers: List[Mover], recorded_days: int | None = None
+) -> str:
+    """Constructs a formatted message with the top value gainers and losers over a window.
+
+    Args:
+        days (int): Window length in days.
+        gainers (List[Mover]): Assets that gained the most value, largest gain first.
+        losers (List[Mover]): Assets that lost the most value, largest loss first.
+        recorded_days (Optional[int]): Days actually compared if the recorded history is shorter than the window.
+
+    Returns:
+        str: A formatted string with one section for gainers and one for losers.
+    """
+    span = f"last {days} days"
+    if recorded_days is not None and recorded_days < days:
+        span = f"last {recorded_days} days recorded, {days} requested"
+    return (
+        f"📈 Value Risers ({span})\n\n⬆️ Top Gainers\n{format_movers(gainers)}\n\n⬇️ Top Losers\n{format_movers(losers)}"
+    )
+
+
+def construct_no_history_message(recorded_days: int) -> str:
+    """Constructs the message shown when the value history is too short to compare two days.
+
+    Args:
+        recorded_days (int): Number of days recorded for the settings, 0 or 1.
+
+    Returns:
+        str: A message explaining that risers need values from at least two days.
+    """
+    if recorded_days == 0:
+        return "📈 No value history is recorded for these settings yet. Risers need values from at least two days."
+    return "📈 Only one day of values is recorded for these settings so far. Risers need at least two days."
+
+
+def construct_proposals_message(roster_a: int, roster_b: int, proposals: List[TradeProposal]) -> str:
+    """Constructs a formatted message with proposed trades between two rosters.
+
+    Args:
+        roster_a (int): The Sleeper roster ID of the first team.
+        roster_b (int): The Sleeper roster ID of the second team.
+        proposals (List[TradeProposal]): The proposals, best first.
+
+    Returns:
+        str: One block per proposal with the assets each roster gives, the value gap and both lineup gains.
+    """
+    if not proposals:
+        return f"🤝 No fair trades found that improve both roster {roster_a} and roster {roster_b}."
+    blocks = [
+        f"{number}. Roster {roster_a} gives: {', '.join(proposal.give_names)}\n"
+        f"   Roster {roster_b} gives: {', '.join(proposal.receive_names)}\n"
+        f"   Value gap: {proposal.value_gap:+d}, lineup gain: {proposal.gain_a:+d} / {proposal.gain_b:+d}"
+        for number, proposal in enumerate(proposals, start=1)
+    ]
+    return f"🤝 Trade Proposals (roster {roster_a} ↔ roster {roster_b})\n\n" + "\n\n".join(blocks)
+
+
+def construct_shop_message(asset_name: str, asset_value: int, targets: List[TradeTarget]) -> str:
+    """Constructs a formatted message with the packages other teams could offer for an asset.
+
+    Args:
+        asset_name (str): Name of the shopped asset.
+        asset_value (int): Value of the shopped asset.
+        targets (List[TradeTarget]): At most one package per team, best first.
+
+    Returns:
+        str: One line per team with its package, the value gap and the lineup gain of both teams.
+    """
+    if not targets:
+        return f"🛒 No team has a fair package for {asset_name} ({asset_value}) that fills a need of yours."
+    lines = [
+        f"{number}. {target.owner}: {', '.join(target.names)} ({target.value_gap:+d})\n"
+        f"   Your lineup: {target.gain:+d}, their lineup: {target.interest:+d}"
+        for number, target in enumerate(targets, start=1)
+    ]
+    return f"🛒 Shopping {asset_name} ({asset_value})\n\n" + "\n".join(lines)
@@ -0,0 +1,212 @@
+"""Indexed asset name matching for FantasyCalc snapshots.
+Names are normalized once when a snapshot is built: accents, punctuation and generational suffixes such as
+Jr. or III are stripped, so "Ja'Marr Chase", "jamarr chase" and "Kenneth Walker" all find their asset. Substring
+queries are answered from an n-gram posting index instead of scanning every name, and candidates are ranked
+deterministically so the result no longer depends on dictionary order.
+Classes:
+    MatchQuality: How a queried name was matched.
+    NameIndex: Prebuilt exact, normalized and n-gram index over a list of asset names.
+    AutocompleteIndex: Prebuilt prefix and n-gram index that ranks autocomplete suggestions by relevance and value.
+Functions:
+    normalize_name(name): Returns the normalized matching key for a name.
+"""
+
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+from enum import Enum
+from typing import Dict, List, Sequence, Set, Tuple
+
+NGRAM_SIZE = 3
+NAME_SUFFIXES = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
+
+_PUNCTUATION = re.compile(r"['’`.,]")
+_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+class MatchQuality(Enum):
+    """How a queried asset name was matched against a snapshot."""
+
+    EXACT = "exact"
+    NORMALIZED = "normalized"
+    SUBSTRING = "substring"
+    INTERPOLATED = "interpolated"
+    NONE = "none"
+
+
+def normalize_name(name: str) -> str:
+    """Returns the matching key for a name.
+    The key is lowercase ASCII with accents and apostrophes/periods removed, other separators collapsed to single
+    spaces and a trailing generational suffix dropped (unless it is the only token).
+    Args:
+        name (str): The raw name.
+    Returns:
+        str: The normalized key, e.g. "Odell Beckham Jr." -> "odell beckham".
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = decomposed.encode("ascii", "ignore").decode("ascii").lower()
+    tokens = _SEPARATORS.sub(" ", _PUNCTUATION.sub("", ascii_name)).split()
+    if len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def _ngrams(text: str, size: int) -> Set[str]:
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+def _build_postings(keys: Sequence[str]) -> Dict[str, List[int]]:
+    """Map every 1..NGRAM_SIZE character gram to the sorted entries whose key contains it."""
+    postings: Dict[str, List[int]] = {}
+    for entry, key in enumerate(keys):
+        grams: Set[str] = set()
+        for size in range(1, NGRAM_SIZE + 1):
+            grams |= _ngrams(key, size)
+        for gram in grams:
+            postings.setdefault(gram, []).append(entry)
+    return postings
+
+
+def _substring_candidates(postings: Dict[str, List[int]], keys: Sequence[str], query: str) -> List[int]:
+    """Entries whose key contains `query`, found by intersecting its n-gram posting lists rarest first."""
+    size = min(len(query), NGRAM_SIZE)
+    lists = sorted((postings.get(gram, []) for gram in _ngrams(query, size)), key=len)
+    if not lists:
+        return []
+    candidates = set(lists[0])
+    for posting in lists[1:]:
+        if len(candidates) <= 1:
+            break
+        candidates.intersection_update(posting)
+    return [entry for entry in candidates if query in keys[entry]]
+
+
+class NameIndex:
+    """Prebuilt matching index over a list of asset names.
+
+    Entries are addressed by their position in the input sequences. Lookups go exact lowercase name first, then
+    the normalized key, then a substring search over normalized keys driven by n-gram posting lists.
+
+    Args:
+        names (Sequence[str]): Asset names, one per entry.
+        values (Sequence[int]): Asset values used to rank substring candidates, one per entry.
+    """
+
+    def __init__(self, names: Sequence[str], values: Sequence[int]) -> None:
+        self.names = list(names)
+        self.values = list(values)
+        self.keys = [normalize_name(name) for name in self.names]
+        self._exact: Dict[str, int] = {}
+        self._normalized: Dict[str, int] = {}
+        for entry, (name, key) in enumerate(zip(self.names, self.keys)):
+            self._exact[name.lower()] = entry
+            current = self._normalized.get(key)
+            if current is None or self._rank(entry) < self._rank(current):
+                self._normalized[key] = entry
+        self._postings = _build_postings(self.keys)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _rank(self, entry: int) -> Tuple[int, int, str]:
+        """Sort key for candidates: highest value first, then shortest name, then alphabetical."""
+        return (-(self.values[entry] or 0), len(self.keys[entry]), self.keys[entry])
+
+    def search(self, query: str, limit: int | None = None) -> List[int]:
+        """Return entries whose normalized key contains the normalized query, best ranked first.
+        Matches at the start of a word rank ahead of matches inside a word.
+        Args:
+            query (str): The substring to search for.
+            limit (int, optional): Maximum number of entries to return. Defaults to all.
+        Returns:
+            List[int]: Entry positions in rank order.
+        """
+        key = normalize_name(query)
+        if not key:
+            return []
+        candidates = _substring_candidates(self._postings, self.keys, key)
+
+        def word_start(entry: int) -> bool:
+            position = self.keys[entry].find(key)
+            return position == 0 or self.keys[entry][position - 1] == " "
+
+        candidates.sort(key=lambda entry: (not word_start(entry), self._rank(entry)))
+        return candidates if limit is None else candidates[:limit]
+
+    def match(self, query: str) -> Tuple[int | None, MatchQuality]:
+        """Find the best single entry for a query.
+        Args:
+            query (str): The queried asset name.
+        Returns:
+            Tuple[Optional[int], MatchQuality]: The matched entry position (or None) and how it was matched.
+        """
+        entry = self._exact.get(query.lower())
+        if entry is not None:
+            return entry, MatchQuality.EXACT
+        entry = self._normalized.get(normalize_name(query))
+        if entry is not None:
+            return entry, MatchQuality.NORMALIZED
+        found = self.search(query, limit=1)
+        if found:
+            return found[0], MatchQuality.SUBSTRING
+        return None, MatchQuality.NONE
+
+
+class AutocompleteIndex:
+    """Prebuilt index for autocompleting asset names on every keystroke.
+
+    Names are lowered once. Prefix queries bisect a sorted array of every word-start suffix of every name, infix
+    queries intersect n-gram posting lists, and suggestions are ranked by relevance (name prefix, then word
+    prefix, then infix) and then by value, so the cost of a keystroke does not grow with the full asset list.
+
+    Args:
+        names (Sequence[str]): Asset names, one per entry.
+        values (Sequence[int]): Asset values used to rank suggestions, one per entry.
+    """
+
+    def __init__(self, names: Sequence[str], values: Sequence[int]) -> None:
+        self.names = list(names)
+        self.values = [value or 0 for value in values]
+        self.lowered = [name.lower() for name in self.names]
+        self._word_prefixes: List[Tuple[str, int]] = sorted(
+            (lowered[start:], entry)
+            for entry, lowered in enumerate(self.lowered)
+            for start in range(len(lowered))
+            if start == 0 or lowered[start - 1] == " "
+        )
+        self._prefix_keys = [suffix for suffix, _ in self._word_prefixes]
+        self._postings = _build_postings(self.lowered)
+        self._by_value = sorted(range(len(self.names)), key=self._rank)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _rank(self, entry: int) -> Tuple[int, str]:
+        return (-self.values[entry], self.lowered[entry])
+
+    def complete(self, query: str, limit: int = 25) -> List[str]:
+        """Return up to `limit` asset names containing the query, best suggestions first.
+        Args:
+            query (str): The text typed so far (case-insensitive).
+            limit (int): Maximum number of suggestions. Defaults to 25, Discord's choice limit.
+        Returns:
+            List[str]: Matching asset names in rank order.
+        """
+        needle = query.strip().lower()
+        if not needle:
+            return [self.names[entry] for entry in self._by_value[:limit]]
+
+        tiers: Dict[int, int] = {}
+        position = bisect_left(self._prefix_keys, needle)
+        while position < len(self._word_prefixes) and self._prefix_keys[position].startswith(needle):
+            suffix, entry = self._word_prefixes[position]
+            tier = 0 if len(suffix) == len(self.lowered[entry]) else 1
+            tiers[entry] = min(tier, tiers.get(entry, tier))
+            position += 1
+        if len(tiers) < limit:
+            for entry in _substring_candidates(self._postings, self.lowered, needle):
+                tiers.setdefault(entry, 2)
+
+        best = heapq.nsmallest(limit, tiers, key=lambda entry: (tiers[entry], self._rank(entry)))
+        return [self.names[entry] for entry in best]
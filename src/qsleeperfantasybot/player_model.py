@@ -8,13 +8,16 @@ Functions:
     create_player_from_dict(data: dict) -> Player:
     Creates a Player instance from a dictionary, parsing nested player information and mapping dictionary fields to
     dataclass attributes.
+Both classes are slotted to keep the many Player objects held across value snapshots small, and string fields of
+Info are interned so that names, teams and IDs repeated across snapshots share one string object.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, fields
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Info:
     """
     Data class representing player information.
@@ -52,7 +55,7 @@ class Info:
     fleaflickerId: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """
     Represents a fantasy football player with associated metadata and statistics.
@@ -98,6 +101,10 @@ class Player:
     maybeTradeFrequency: Optional[int]
 
 
+_INFO_FIELDS = frozenset(field.name for field in fields(Info))
+_PLAYER_FIELDS = frozenset(field.name for field in fields(Player) if field.name != "info")
+
+
 def create_player_from_dict(data: Dict[str, Any]) -> Player:
     """
     Create a Player instance from a dictionary.
@@ -110,9 +117,10 @@ def create_player_from_dict(data: Dict[str, Any]) -> Player:
 
     Raises:
         KeyError: If the "player" key is missing in the input dictionary.
-        TypeError: If the dictionary fields do not match the expected dataclass fields.
+        TypeError: If required dataclass fields are missing from the dictionary. Unknown keys are ignored.
     """
-    player_info = Info(**data["player"])
-    player_fields = {field for field in Player.__dataclass_fields__ if field != "player"}
-    player_kwargs = {k: v for k, v in data.items() if k in player_fields}
-    return Player(info=player_info, **player_kwargs)
+    info_kwargs: Dict[str, Any] = {
+        k: sys.intern(v) if isinstance(v, str) else v for k, v in data["player"].items() if k in _INFO_FIELDS
+    }
+    player_kwargs = {k: v for k, v in data.items() if k in _PLAYER_FIELDS}
+    return Player(info=Info(**info_kwargs), **player_kwargs)
@@ -0,0 +1,195 @@
+"""Client-side rate limiting with backoff for an upstream API.
+Every request takes a token from a token bucket that refills at the allowed rate, so bursts up to the bucket size go
+out at once and sustained fan-out is smoothed to the rate instead of tripping the upstream limit. An empty bucket does
+not reject a request: the request reserves the next token and waits for it, so waiting callers are served in the
+order they arrived. When upstream still answers 429 Too Many Requests, its Retry-After is respected and pauses every
+caller, not only the one that was throttled; other retryable answers without Retry-After are retried after an
+exponential backoff with jitter, so concurrent callers do not retry in lockstep.
+Classes:
+    RateLimitSettings: Rate, burst and retry settings.
+    RateLimitMetrics: Counters of throttled, rate limited and retried requests.
+    TokenBucket: Token bucket that hands out reservations.
+    RateLimiter: Paces requests and decides how long to back off before a retry.
+Functions:
+    parse_retry_after(value): Parses a Retry-After header into seconds.
+Environment Variables:
+    - SLEEPER_CALLS_PER_MINUTE: Sustained Sleeper API calls per minute. Defaults to 900.
+    - SLEEPER_BURST: Sleeper API calls that may go out at once. Defaults to 20.
+    - SLEEPER_MAX_RETRIES: Retries of a rate limited Sleeper API call. Defaults to 3.
+    - SLEEPER_BACKOFF_BASE: Seconds of the first backoff. Defaults to 0.5.
+    - SLEEPER_BACKOFF_MAX: Longest backoff or Retry-After in seconds that is waited out. Defaults to 30.
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Self
+
+from qsleeperfantasybot.logger import logger
+
+
+@dataclass(frozen=True)
+class RateLimitSettings:
+    """Rate, burst and retry settings of a rate limiter."""
+
+    calls_per_minute: float = 900.0
+    burst: int = 20
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Create Sleeper API settings from environment variables, falling back to the defaults."""
+        return cls(
+            calls_per_minute=float(os.getenv("SLEEPER_CALLS_PER_MINUTE", cls.calls_per_minute)),
+            burst=int(os.getenv("SLEEPER_BURST", cls.burst)),
+            max_retries=int(os.getenv("SLEEPER_MAX_RETRIES", cls.max_retries)),
+            backoff_base=float(os.getenv("SLEEPER_BACKOFF_BASE", cls.backoff_base)),
+            backoff_max=float(os.getenv("SLEEPER_BACKOFF_MAX", cls.backoff_max)),
+        )
+
+
+@dataclass
+class RateLimitMetrics:
+    """
+    Counters of a rate limiter since it was created.
+
+    Attributes:
+        requests (int): Requests that took a token.
+        throttled (int): Requests that had to wait for a token or a pause.
+        wait_seconds (float): Total seconds requests waited for tokens or pauses.
+        rate_limited (int): 429 responses from upstream.
+        retries (int): Requests retried after a backoff.
+        gave_up (int): Requests that failed after the last retry or because Retry-After was too long.
+    """
+
+    requests: int = 0
+    throttled: int = 0
+    wait_seconds: float = 0.0
+    rate_limited: int = 0
+    retries: int = 0
+    gave_up: int = 0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a Retry-After header, given either as seconds or as an HTTP date.
+    Returns:
+        float or None: Seconds to wait, never negative, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Token bucket that refills continuously and lets takers go into debt. Reservations are locked, so a bucket may
+    be shared by callers on different threads and event loops.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (int): Largest number of tokens the bucket holds, i.e. the burst size.
+        clock (Callable[[], float]): Monotonic time source, injectable for tests. Defaults to time.monotonic.
+    """
+
+    def __init__(self, rate: float, capacity: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available; negative while earlier reservations are still waiting."""
+        return min(self.capacity, self._tokens + (self._clock() - self._updated) * self.rate)
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait until it is actually available."""
+        with self._lock:
+            self._tokens = self.tokens - 1
+            self._updated = self._clock()
+            return max(0.0, -self._tokens / self.rate)
+
+
+class RateLimiter:
+    """Paces the requests to one upstream API and backs off when it reports being overloaded.
+
+    Args:
+        name (str): Name of the upstream API, used in logs.
+        settings (RateLimitSettings, optional): Rate, burst and retry settings. Defaults to the environment.
+        clock (Callable[[], float]): Monotonic time source, injectable for tests. Defaults to time.monotonic.
+        sleep (Callable[[float], Awaitable[None]]): Sleep function, injectable for tests. Defaults to asyncio.sleep.
+        jitter (Callable[[], float]): Random source in [0, 1), injectable for tests. Defaults to random.random.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        settings: RateLimitSettings | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self.name = name
+        self.settings = settings or RateLimitSettings.from_env()
+        self.bucket = TokenBucket(self.settings.calls_per_minute / 60, self.settings.burst, clock)
+        self.metrics = RateLimitMetrics()
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+        self._paused_until = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent: a token is available and no Retry-After pause is running."""
+        wait = max(self.bucket.reserve(), self._paused_until - self._clock())
+        self.metrics.requests += 1
+        if wait > 0:
+            self.metrics.throttled += 1
+            self.metrics.wait_seconds += wait
+            await self._sleep(wait)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff of a retry with equal jitter: between half and all of base * 2^attempt, capped."""
+        delay = min(self.settings.backoff_max, self.settings.backoff_base * 2.0**attempt)
+        return delay / 2 + self._jitter() * delay / 2
+
+    async def backoff(self, attempt: int, status: int, retry_after: float | None = None) -> bool:
+        """Wait before retrying a request upstream rejected as overloaded.
+        A 429 pauses every request for the Retry-After time, or the backoff delay if upstream sent none.
+        Args:
+            attempt (int): Number of retries of this request so far.
+            status (int): HTTP status of the rejected request.
+            retry_after (float, optional): Seconds upstream asked to wait.
+        Returns:
+            bool: True after waiting if the request should be retried, False if retries are exhausted or
+            upstream asked to wait longer than the largest backoff.
+        """
+        delay = retry_after if retry_after is not None else self.backoff_delay(attempt)
+        if status == 429:
+            self.metrics.rate_limited += 1
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+        if attempt >= self.settings.max_retries or delay > self.settings.backoff_max:
+            self.metrics.gave_up += 1
+            logger.warning(f"{self.name} returned {status}, giving up after {attempt} retries")
+            return False
+        self.metrics.retries += 1
+        logger.info(f"{self.name} returned {status}, retrying in {delay:.1f}s")
+        await self._sleep(delay)
+        return True
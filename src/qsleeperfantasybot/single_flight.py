@@ -0,0 +1,89 @@
+"""Single-flight coalescing of identical concurrent requests.
+When a burst of commands asks for the same upstream URL at once, only the first caller sends the request; everyone
+who asks for the same key while it is in flight waits for that one request and shares its decoded result, including
+its exception. Nothing is kept after the request completes, so this only cuts duplicate work during bursts and never
+serves stale data; caching is left to the callers.
+Coroutines on the event loop, such as the Sleeper client used by the kicker scan, use SingleFlight. Blocking code in
+worker threads, such as the synchronous Sleeper parser, uses BlockingSingleFlight.
+Classes:
+    SingleFlight: Coalesces concurrent coroutine calls per key.
+    BlockingSingleFlight: Coalesces concurrent blocking calls per key across threads.
+Globals:
+    url_flights: Blocking group shared by the synchronous Sleeper HTTP helpers, keyed by URL.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent coroutine calls with the same key into one call.
+    Calls are grouped per event loop, so a group can be shared by code that runs its own loops in worker threads.
+    A caller that is cancelled stops waiting without cancelling the shared call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of fn(), or of the call already in flight for the key."""
+        flight = (asyncio.get_running_loop(), key)
+        task = self._calls.get(flight)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[flight] = task
+            task.add_done_callback(lambda _: self._calls.pop(flight, None))
+        else:
+            self.coalesced += 1
+        result: T = await asyncio.shield(task)
+        return result
+
+
+class BlockingSingleFlight:
+    """Coalesces concurrent blocking calls with the same key, made from any thread, into one call."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Return the result of fn(), or block until the call already in flight for the key returns."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            shared: T = future.result()
+            return shared
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+url_flights = BlockingSingleFlight()
@@ -0,0 +1,266 @@
+"""Response cache for the Sleeper API with per-endpoint TTL policies.
+Sleeper data changes at very different speeds: the NFL state changes a few times a week, rosters and matchups change
+during games, and a league or draft whose status is "complete" never changes again. Every endpoint URL is matched
+against ENDPOINT_POLICIES for the time its responses may be reused; completed leagues and drafts are kept forever.
+Responses live in a bounded in-memory LRU. If a cache directory is configured, long-lived responses are also
+written to disk, so completed seasons and the player map survive restarts. Cached responses are shared between
+callers and must not be mutated. The in-memory LRU is locked, so the synchronous parser may use it from threads;
+the async client uses get_async and put_async, which read and write the on-disk tier in worker threads.
+Classes:
+    CachePolicy: How long the responses of one endpoint may be reused.
+    CacheSettings: Size and disk settings of the response cache.
+    CacheStats: Hit and miss counters.
+    ResponseStore: On-disk tier, one JSON file per URL.
+    ResponseCache: Bounded LRU of responses in front of the optional on-disk tier.
+Functions:
+    policy_for(url): Returns the cache policy of an endpoint URL, or None if it is not cached.
+Globals:
+    ENDPOINT_POLICIES: URL patterns and the cache policies of their endpoints.
+Environment Variables:
+    - SLEEPER_CACHE_MAX_ENTRIES: Largest number of responses kept in memory. Defaults to 2048.
+    - SLEEPER_CACHE_DIR: Directory of the on-disk tier. Disabled if unset.
+    - SLEEPER_CACHE_PERSIST_TTL: Smallest TTL in seconds of a response that is written to disk. Defaults to 3600.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, List, NamedTuple, Self, Tuple
+
+from qsleeperfantasybot.logger import logger
+
+FOREVER = math.inf
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+FORMAT_VERSION = 1
+
+
+def _complete(data: Any) -> bool:
+    """True if the league or draft, or every league or draft of a list, has status "complete"."""
+    items = data if isinstance(data, list) else [data]
+    return bool(items) and all(isinstance(item, dict) and item.get("status") == "complete" for item in items)
+
+
+class CachePolicy(NamedTuple):
+    """Time the responses of an endpoint may be reused, and a test for responses that never change again."""
+
+    ttl: float
+    final: Callable[[Any], bool] | None = None
+
+    def ttl_for(self, data: Any) -> float:
+        """Return the TTL of one response: forever if it is final, the endpoint TTL otherwise."""
+        return FOREVER if self.final is not None and self.final(data) else self.ttl
+
+
+ENDPOINT_POLICIES: List[Tuple[re.Pattern[str], CachePolicy]] = [
+    (re.compile(r"/state/[^/]+$"), CachePolicy(5 * MINUTE)),
+    (re.compile(r"/user/[^/]+/(leagues|drafts)/"), CachePolicy(10 * MINUTE, _complete)),
+    (re.compile(r"/user/[^/]+$"), CachePolicy(HOUR)),
+    (re.compile(r"/league/[^/]+$"), CachePolicy(10 * MINUTE, _complete)),
+    (re.compile(r"/league/[^/]+/(rosters|matchups/[^/]+|transactions/[^/]+)$"), CachePolicy(2 * MINUTE)),
+    (re.compile(r"/league/[^/]+/users$"), CachePolicy(10 * MINUTE)),
+    (re.compile(r"/league/[^/]+/(winners|losers)_bracket$"), CachePolicy(5 * MINUTE)),
+    (re.compile(r"/league/[^/]+/drafts$"), CachePolicy(10 * MINUTE, _complete)),
+    (re.compile(r"/draft/[^/]+$"), CachePolicy(5 * MINUTE, _complete)),
+    (re.compile(r"/draft/[^/]+/picks$"), CachePolicy(MINUTE)),
+    (re.compile(r"/(draft|league)/[^/]+/traded_picks$"), CachePolicy(5 * MINUTE)),
+    (re.compile(r"/players/[^/]+/trending/"), CachePolicy(10 * MINUTE)),
+    (re.compile(r"/sleeper_data_latest\.json$"), CachePolicy(12 * HOUR)),
+]
+
+
+def policy_for(url: str) -> CachePolicy | None:
+    """Return the cache policy of an endpoint URL, or None if its responses are not cached."""
+    path = url.split("?", 1)[0]
+    for pattern, policy in ENDPOINT_POLICIES:
+        if pattern.search(path):
+            return policy
+    return None
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    """Size and disk settings of the response cache."""
+
+    max_entries: int = 2048
+    directory: Path | None = None
+    persist_ttl: float = HOUR
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Create settings from environment variables, falling back to the defaults."""
+        directory = os.getenv("SLEEPER_CACHE_DIR")
+        return cls(
+            max_entries=int(os.getenv("SLEEPER_CACHE_MAX_ENTRIES", cls.max_entries)),
+            directory=Path(directory) if directory else None,
+            persist_ttl=float(os.getenv("SLEEPER_CACHE_PERSIST_TTL", cls.persist_ttl)),
+        )
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a response cache since it was created.
+
+    Attributes:
+        hits (int): Lookups answered from memory.
+        disk_hits (int): Lookups answered from the on-disk tier.
+        misses (int): Lookups of cacheable URLs that had to go to Sleeper.
+        evictions (int): Responses dropped from memory to stay within max_entries.
+    """
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from either tier."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+class ResponseStore:
+    """Handles storing and loading cached responses, one JSON file per URL."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the store with the given directory."""
+        self.directory = directory
+
+    def path_for(self, url: str) -> Path:
+        """Return the file path used for a URL."""
+        return self.directory / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def save(self, url: str, expires_at: float, data: Any) -> None:
+        """Write a response atomically; forever-valid responses are stored without an expiry."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(url)
+        expiry = None if math.isinf(expires_at) else expires_at
+        document = {"version": FORMAT_VERSION, "url": url, "expires_at": expiry, "data": data}
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(document, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except (IOError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write cached response {path}: {e}")
+
+    def load(self, url: str) -> Tuple[float, Any] | None:
+        """Load the expiry and response stored for a URL, or None if there is no usable file."""
+        path = self.path_for(url)
+        if not path.is_file():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                document = json.load(f)
+            if document.get("version") != FORMAT_VERSION or document.get("url") != url:
+                return None
+            expiry = document["expires_at"]
+            return (FOREVER if expiry is None else float(expiry)), document["data"]
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Cached response {path} corrupted or unreadable: {e}")
+            return None
+
+
+class ResponseCache:
+    """Bounded LRU of Sleeper responses with per-endpoint TTLs and an optional on-disk tier.
+
+    Args:
+        settings (CacheSettings, optional): Size and disk settings. Defaults to CacheSettings.from_env().
+        clock (Callable[[], float]): Time source, injectable for tests. Defaults to time.time.
+    """
+
+    def __init__(self, settings: CacheSettings | None = None, clock: Callable[[], float] = time.time) -> None:
+        self.settings = settings or CacheSettings.from_env()
+        self.store = ResponseStore(self.settings.directory) if self.settings.directory else None
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str) -> Any | None:
+        """Return the cached response of a URL if it has not expired, or None on a miss or for uncached endpoints."""
+        if policy_for(url) is None:
+            return None
+        now = self._clock()
+        data = self._get_memory(url, now)
+        if data is not None:
+            return data
+        return self._get_stored(url, now, self.store.load(url) if self.store is not None else None)
+
+    async def get_async(self, url: str) -> Any | None:
+        """Like get, but the on-disk tier is read in a worker thread, so a miss never blocks the event loop."""
+        if policy_for(url) is None:
+            return None
+        now = self._clock()
+        data = self._get_memory(url, now)
+        if data is not None:
+            return data
+        stored = await asyncio.to_thread(self.store.load, url) if self.store is not None else None
+        return self._get_stored(url, now, stored)
+
+    def put(self, url: str, data: Any) -> None:
+        """Cache a response for the TTL of its endpoint and write it to disk if it lives long enough."""
+        expires_at = self._put_memory(url, data)
+        if expires_at is not None and self.store is not None:
+            self.store.save(url, expires_at, data)
+
+    async def put_async(self, url: str, data: Any) -> None:
+        """Like put, but the on-disk tier is written in a worker thread, so large responses never block the loop."""
+        expires_at = self._put_memory(url, data)
+        if expires_at is not None and self.store is not None:
+            await asyncio.to_thread(self.store.save, url, expires_at, data)
+
+    def clear(self) -> None:
+        """Drop every response from memory. The on-disk tier is kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def _get_memory(self, url: str, now: float) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(url)
+                self.stats.hits += 1
+                return entry[1]
+        return None
+
+    def _get_stored(self, url: str, now: float, stored: Tuple[float, Any] | None) -> Any | None:
+        if stored is not None and stored[0] > now:
+            self._remember(url, *stored)
+            self.stats.disk_hits += 1
+            return stored[1]
+        self.stats.misses += 1
+        return None
+
+    def _put_memory(self, url: str, data: Any) -> float | None:
+        """Cache a response in memory and return its expiry if it should also be written to disk."""
+        policy = policy_for(url)
+        if policy is None or data is None:
+            return None
+        ttl = policy.ttl_for(data)
+        if ttl <= 0:
+            return None
+        expires_at = self._clock() + ttl
+        self._remember(url, expires_at, data)
+        return expires_at if ttl >= self.settings.persist_ttl else None
+
+    def _remember(self, url: str, expires_at: float, data: Any) -> None:
+        with self._lock:
+            self._entries[url] = (expires_at, data)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.settings.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
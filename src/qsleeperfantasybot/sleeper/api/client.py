@@ -0,0 +1,222 @@
+"""Asynchronous client for the Sleeper API.
+
+https://docs.sleeper.com/#introduction
+
+Requests go through the shared, pooled aiohttp session with its connect and total timeouts, so a slow Sleeper
+response only suspends the command waiting for it instead of blocking the event loop for every guild. All clients,
+including the synchronous parser, share one rate limiter that keeps the bot under Sleeper's limit of about 1000 calls
+per minute and backs off on 429 Too Many Requests, so league-wide features can fan out freely. They also share one
+response cache with per-endpoint TTLs, so repeated commands do not fetch the same user or league again, and
+concurrent requests for the same URL share one in-flight request. Every endpoint of the synchronous SleeperAPIParser
+is covered; the parser is now a thin wrapper around this client for scripts, see it for the response formats.
+Classes:
+    SleeperClient: Fetches Sleeper API resources as parsed JSON.
+Globals:
+    SLEEPER_ERROR_MESSAGES: Log messages for the HTTP errors documented by Sleeper.
+    RETRY_STATUSES: HTTP statuses that are retried after a backoff.
+    sleeper_rate_limiter: Rate limiter shared by every Sleeper API request, see its metrics for throttling counts.
+    sleeper_response_cache: Response cache shared by every client, see its stats for hit and miss counts.
+    sleeper_flights: Single-flight group that coalesces concurrent requests for the same URL.
+    sleeper_client: Client on the shared HTTP session, used by the command handlers.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from qsleeperfantasybot.http_session import get_session
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.rate_limiter import RateLimiter, parse_retry_after
+from qsleeperfantasybot.single_flight import SingleFlight
+from qsleeperfantasybot.sleeper.api.cache import ResponseCache
+
+BASE_URL = "https://api.sleeper.app/v1"
+AVATAR_URL = "https://sleepercdn.com/avatars"
+PLAYERS_URL = (
+    "https://raw.githubusercontent.com/qubone/sleeper_fetch_players/refs/heads/main/data/sleeper_data_latest.json"
+)
+
+SLEEPER_ERROR_MESSAGES = {
+    400: "Bad Request -- Your request is invalid..",
+    404: "Not Found -- The specified kitten could not be found.",
+    429: "Too Many Requests -- You're requesting too many kittens! Slow down!.",
+    500: "Internal Server Error -- We had a problem with our server. Try again later.",
+    503: "Service Unavailable -- We're temporarily offline for maintenance. Please try again later.",
+}
+
+sleeper_rate_limiter = RateLimiter("Sleeper")
+sleeper_response_cache = ResponseCache()
+sleeper_flights = SingleFlight()
+
+RETRY_STATUSES = frozenset({429, 503})
+
+JsonResponse = Optional[Dict[str, Any] | List[Dict[str, Any]] | Any]
+
+
+class SleeperClient:
+    """Asynchronous Sleeper API client.
+
+    Args:
+        session (aiohttp.ClientSession, optional): Session to send requests with. Defaults to the shared session.
+        base_url (str): Sleeper API base URL. Defaults to https://api.sleeper.app/v1.
+        limiter (RateLimiter, optional): Rate limiter the requests are paced by. Defaults to sleeper_rate_limiter.
+        cache (ResponseCache, optional): Cache responses are served from. Defaults to sleeper_response_cache.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None = None,
+        base_url: str = BASE_URL,
+        limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        self._session = session
+        self.base_url = base_url
+        self.limiter = limiter or sleeper_rate_limiter
+        self.cache = cache if cache is not None else sleeper_response_cache
+        self.sport = "nfl"
+        self.season = datetime.now().strftime("%Y")
+
+    async def get_json(self, url: str) -> JsonResponse:
+        """Returns the JSON object or list at a URL, or None if the request fails or the response is not JSON.
+        Responses are served from the cache while their endpoint's TTL allows and cached after a successful request.
+        Concurrent requests for the same URL are coalesced into one.
+        """
+        cached = await self.cache.get_async(url)
+        if cached is not None:
+            return cached
+        return await sleeper_flights.do(url, lambda: self._fetch_and_cache(url))
+
+    async def _fetch_and_cache(self, url: str) -> JsonResponse:
+        data = await self._fetch(url)
+        await self.cache.put_async(url, data)
+        return data
+
+    async def _fetch(self, url: str) -> JsonResponse:
+        """Requests a URL, paced by the rate limiter; 429 and 503 responses are retried after its backoff."""
+        session = self._session or await get_session()
+        attempt = 0
+        try:
+            while True:
+                await self.limiter.acquire()
+                logger.debug(f"Making GET request to URL: {url}")
+                async with session.get(url) as response:
+                    if response.status == 200:
+                        data = await response.json(content_type=None)
+                        break
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if response.status not in RETRY_STATUSES or not await self.limiter.backoff(
+                    attempt, response.status, retry_after
+                ):
+                    logger.info(
+                        SLEEPER_ERROR_MESSAGES.get(
+                            response.status, f"An unexpected HTTP error occurred: {response.status}"
+                        )
+                    )
+                    return None
+                attempt += 1
+        except asyncio.TimeoutError:
+            logger.warning(f"The request to {url} timed out.")
+            return None
+        except (aiohttp.ClientError, ValueError) as e:
+            logger.warning(f"Request to {url} failed: {e!r}")
+            return None
+        if isinstance(data, (dict, list)):
+            return data
+        logger.error("Expected a JSON object (dict or list), but got: %s", type(data))
+        return None
+
+    async def get_user(self, user_id: Optional[str] = None, user_name: Optional[str] = None) -> JsonResponse:
+        """GET /user/<username or user_id>.
+        Raises:
+            ValueError: If neither user_id nor user_name is given.
+        """
+        if not user_id and not user_name:
+            raise ValueError("Either user_id or user_name must be provided.")
+        return await self.get_json(f"{self.base_url}/user/{user_name or user_id}")
+
+    async def get_avatars(self, avatar_id: str) -> Tuple[JsonResponse, JsonResponse]:
+        """GET the full size and thumbnail avatar from the Sleeper CDN."""
+        full_size, thumbnail = await asyncio.gather(
+            self.get_json(f"{AVATAR_URL}/{avatar_id}"), self.get_json(f"{AVATAR_URL}/thumbs/{avatar_id}")
+        )
+        return full_size, thumbnail
+
+    async def get_all_leagues_for_user(self, user_id: str, season: Optional[str] = None) -> JsonResponse:
+        """GET /user/<user_id>/leagues/<sport>/<season>."""
+        return await self.get_json(f"{self.base_url}/user/{user_id}/leagues/{self.sport}/{season or self.season}")
+
+    async def get_specific_league(self, league_id: str) -> JsonResponse:
+        """GET /league/<league_id>."""
+        return await self.get_json(f"{self.base_url}/league/{league_id}")
+
+    async def get_rosters_in_a_league(self, league_id: str) -> JsonResponse:
+        """GET /league/<league_id>/rosters."""
+        return await self.get_json(f"{self.base_url}/league/{league_id}/rosters")
+
+    async def get_users_in_a_league(self, league_id: str) -> JsonResponse:
+        """GET /league/<league_id>/users."""
+        return await self.get_json(f"{self.base_url}/league/{league_id}/users")
+
+    async def get_matchups_in_league(self, league_id: str, week: str) -> JsonResponse:
+        """GET /league/<league_id>/matchups/<week>."""
+        return await self.get_json(f"{self.base_url}/league/{league_id}/matchups/{week}")
+
+    async def get_playoff_bracket(
+        self, league_id: str
+    ) -> Tuple[Dict[str, Any] | List[Dict[str, Any]], Dict[str, Any] | List[Dict[str, Any]]]:
+        """GET /league/<league_id>/winners_bracket and /losers_bracket, empty if unavailable."""
+        winners_bracket, losers_bracket = await asyncio.gather(
+            self.get_json(f"{self.base_url}/league/{league_id}/winners_bracket"),
+            self.get_json(f"{self.base_url}/league/{league_id}/losers_bracket"),
+        )
+        return winners_bracket or {}, losers_bracket or {}
+
+    async def get_transactions(self, league_id: str, round: str) -> JsonResponse:
+        """GET /league/<league_id>/transactions/<round>."""
+        return await self.get_json(f"{self.base_url}/league/{league_id}/transactions/{round}")
+
+    async def get_traded_picks_in_league(self, league_id: str) -> JsonResponse:
+        """GET /league/<league_id>/traded_picks."""
+        return await self.get_json(f"{self.base_url}/league/{league_id}/traded_picks")
+
+    async def get_nfl_state(self) -> JsonResponse:
+        """GET /state/<sport>."""
+        return await self.get_json(f"{self.base_url}/state/{self.sport}")
+
+    async def get_all_drafts_for_user(self, user_id: str, season: Optional[str] = None) -> JsonResponse:
+        """GET /user/<user_id>/drafts/<sport>/<season>."""
+        return await self.get_json(f"{self.base_url}/user/{user_id}/drafts/{self.sport}/{season or self.season}")
+
+    async def get_all_drafts_for_a_league(self, league_id: str) -> JsonResponse:
+        """GET /league/<league_id>/drafts."""
+        return await self.get_json(f"{self.base_url}/league/{league_id}/drafts")
+
+    async def get_specific_draft(self, draft_id: str) -> JsonResponse:
+        """GET /draft/<draft_id>."""
+        return await self.get_json(f"{self.base_url}/draft/{draft_id}")
+
+    async def get_all_picks_in_draft(self, draft_id: str) -> JsonResponse:
+        """GET /draft/<draft_id>/picks."""
+        return await self.get_json(f"{self.base_url}/draft/{draft_id}/picks")
+
+    async def get_traded_picks_in_draft(self, draft_id: str) -> JsonResponse:
+        """GET /draft/<draft_id>/traded_picks."""
+        return await self.get_json(f"{self.base_url}/draft/{draft_id}/traded_picks")
+
+    async def fetch_all_players(self) -> JsonResponse:
+        """GET the daily player map, mirrored on GitHub because the Sleeper endpoint is about 5MB."""
+        return await self.get_json(PLAYERS_URL)
+
+    async def get_trending_players(
+        self, trend_type: str, lookback_hours: Optional[str] = "24", limit: Optional[str] = "25"
+    ) -> JsonResponse:
+        """GET /players/<sport>/trending/<type>?lookback_hours=<hours>&limit=<int>."""
+        return await self.get_json(
+            f"{self.base_url}/players/{self.sport}/trending/{trend_type}?lookback_hours={lookback_hours}&limit={limit}"
+        )
+
+
+sleeper_client = SleeperClient()
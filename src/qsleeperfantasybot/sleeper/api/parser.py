@@ -1,17 +1,26 @@
 """Parser for Sleeper API.
 
 https://docs.sleeper.com/#introduction
+
+Synchronous wrapper around SleeperClient for scripts. Every call runs the async client on a private aiohttp session
+with the connect and total timeouts of HttpSettings, so a hung request can no longer block forever. Code running on
+the bot's event loop, including every command handler, must await sleeper_client from
+qsleeperfantasybot.sleeper.api.client instead.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Any, Dict, Optional, Tuple, List
-from qsleeperfantasybot.logger import logger
 
-import requests
+import aiohttp
+
+from qsleeperfantasybot.http_session import HttpSettings
+from qsleeperfantasybot.single_flight import url_flights
+from qsleeperfantasybot.sleeper.api.client import BASE_URL, SleeperClient
 
 
 class SleeperAPIParser:
-    """Parses data from Sleeper API with HTTP GET using requests library.
+    """Parses data from Sleeper API with blocking HTTP GET requests.
 
     user_id (str): The numerical ID of the user.
     sport (str): We only support "nfl" right now.
@@ -22,49 +31,24 @@ class SleeperAPIParser:
     """
 
     def __init__(self) -> None:
-        self.base_url = "https://api.sleeper.app/v1"
+        self.base_url = BASE_URL
         self.sport = "nfl"
         self.season = datetime.now().strftime("%Y")
 
     @staticmethod
     def _http_get_response_data_json(url: str) -> Optional[Dict[str, Any] | List[Dict[str, Any]] | Any]:
-        """Returns HTTP GET in JSON format."""
-        error_messages = {
-            400: "Bad Request -- Your request is invalid..",
-            404: "Not Found -- The specified kitten could not be found.",
-            429: "Too Many Requests -- You're requesting too many kittens! Slow down!.",
-            500: "Internal Server Error -- We had a problem with our server. Try again later.",
-            503: "Service Unavailable -- We're temporarily offline for maintenance. Please try again later.",
-        }
-        try:
-            logger.debug(f"Making GET request to URL: {url}")
-            response = requests.get(url, timeout=None)
-            response.raise_for_status()
-            data = response.json()
-            logger.debug(f"Response JSON data: {data}")
-            if isinstance(data, dict) or isinstance(data, list):
-                return data
-            else:
-                logger.error("Expected a JSON object (dict or list), but got: %s", type(data))
-                return None
-        except requests.exceptions.HTTPError as http_err:
-            message = error_messages.get(response.status_code, f"An unexpected HTTP error occurred: {http_err}")
-            logger.info(message)
-        except requests.exceptions.Timeout:
-            logger.exception("The request timed out.")
-        except requests.exceptions.ConnectionError:
-            logger.exception("Network problem or server is unreachable.")
-        except requests.exceptions.TooManyRedirects:
-            logger.exception("Too many redirects occurred.")
-        except requests.exceptions.MissingSchema:
-            logger.exception("The URL is missing a scheme (e.g., 'http://').")
-        except requests.exceptions.InvalidURL:
-            logger.exception("The provided URL is invalid.")
-        except requests.exceptions.JSONDecodeError:
-            logger.exception("Invalid JSON reponse.")
-        except requests.exceptions.RequestException as req_err:
-            logger.exception(f"A non-HTTP error occurred: {req_err}")
-        return None
+        """Returns HTTP GET in JSON format.
+        Concurrent calls for the same URL from other threads wait for the first one and share its result.
+        Must not be called from a running event loop; await SleeperClient.get_json there instead.
+        """
+
+        async def fetch() -> Optional[Dict[str, Any] | List[Dict[str, Any]] | Any]:
+            settings = HttpSettings.from_env()
+            timeout = aiohttp.ClientTimeout(total=settings.total_timeout, connect=settings.connect_timeout)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                return await SleeperClient(session).get_json(url)
+
+        return url_flights.do(url, lambda: asyncio.run(fetch()))
 
     def get_user(
         self, user_id: Optional[str] = None, user_name: Optional[str] = None
@@ -226,7 +210,7 @@ class SleeperAPIParser:
         ]
 
         """
-        return self._http_get_response_data_json(f"{self.base_url}/league/{league_id}/rosters")
+        return self._http_get_response_data_json(f"{self.base_url}/league/{league_id}/users")
 
     def get_matchups_in_league(self, league_id: str, week: str) -> Optional[Dict[str, Any] | List[Dict[str, Any]]]:
         """This endpoint retrieves all matchups in a league for a given week. Each object in
@@ -369,6 +353,26 @@ class SleeperAPIParser:
         """
         return self._http_get_response_data_json(f"{self.base_url}/league/{league_id}/transactions/{round}")
 
+    def get_traded_picks_in_league(self, league_id: str) -> Optional[Dict[str, Any] | List[Dict[str, Any]]]:
+        """This endpoint retrieves all traded picks in a league, including future picks.
+
+        GET https://api.sleeper.app/v1/league/<league_id>/traded_picks
+
+        Args:
+            league_id (str): The ID of the league to retrieve traded picks for
+
+        [
+            {
+                "season": "2026",
+                "round": 1,              // which round the pick is
+                "roster_id": 1,          // roster_id of ORIGINAL owner
+                "previous_owner_id": 1,  // roster_id of the previous owner
+                "owner_id": 2,           // roster_id of current owner
+            }
+        ]
+        """
+        return self._http_get_response_data_json(f"{self.base_url}/league/{league_id}/traded_picks")
+
     def get_nfl_state(self) -> Optional[Dict[str, Any] | List[Dict[str, Any]]]:
         """This endpoint returns information about the current state for any sport.
 
@@ -0,0 +1,72 @@
+"""Data models for Sleeper drafts and traded draft picks."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Self
+
+
+@dataclass
+class Draft:
+    """
+    A draft of a league, as returned by the league drafts resource.
+
+    Attributes:
+        draft_id (str): Draft ID.
+        season (str): Season year as a string.
+        status (str): Draft status, e.g. "pre_draft", "drafting" or "complete".
+        type (str): Draft type, e.g. "snake" or "linear".
+        rounds (int): Number of rounds.
+        start_time (Optional[int]): Start time in milliseconds since the epoch, if scheduled.
+        draft_order (Dict[str, int]): Draft slot of every user ID, empty until the order is set.
+    """
+
+    draft_id: str
+    season: str
+    status: str
+    type: str = "snake"
+    rounds: int = 0
+    start_time: Optional[int] = None
+    draft_order: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Self:
+        """Creates a Draft from a league drafts entry."""
+        return cls(
+            draft_id=str(data["draft_id"]),
+            season=str(data.get("season") or ""),
+            status=data.get("status") or "",
+            type=data.get("type") or "snake",
+            rounds=int((data.get("settings") or {}).get("rounds") or 0),
+            start_time=data.get("start_time"),
+            draft_order=dict(data.get("draft_order") or {}),
+        )
+
+
+@dataclass(frozen=True)
+class TradedPick:
+    """
+    A future draft pick that changed hands.
+
+    Attributes:
+        season (str): Season of the draft.
+        round (int): Round of the pick.
+        roster_id (int): Roster ID of the original owner.
+        previous_owner_id (int): Roster ID of the previous owner.
+        owner_id (int): Roster ID of the current owner.
+    """
+
+    season: str
+    round: int
+    roster_id: int
+    previous_owner_id: int
+    owner_id: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Self:
+        """Creates a TradedPick from a traded picks entry."""
+        return cls(
+            season=str(data["season"]),
+            round=int(data["round"]),
+            roster_id=int(data["roster_id"]),
+            previous_owner_id=int(data.get("previous_owner_id") or data["roster_id"]),
+            owner_id=int(data["owner_id"]),
+        )
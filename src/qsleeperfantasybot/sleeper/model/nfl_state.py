@@ -0,0 +1,35 @@
+"""Data model for the state of the NFL season."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Self
+
+
+@dataclass
+class NflState:
+    """
+    The current state of the NFL, as returned by the state resource.
+
+    Attributes:
+        season (str): Current season year.
+        season_type (str): "pre", "regular" or "post".
+        week (int): Current week.
+        display_week (int): Week to display in the UI.
+        league_season (str): Season leagues are currently running in.
+    """
+
+    season: str
+    season_type: str
+    week: int
+    display_week: int
+    league_season: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Self:
+        """Creates an NflState from the state resource."""
+        return cls(
+            season=str(data.get("season") or ""),
+            season_type=data.get("season_type") or "",
+            week=int(data.get("week") or 0),
+            display_week=int(data.get("display_week") or data.get("week") or 0),
+            league_season=str(data.get("league_season") or data.get("season") or ""),
+        )
@@ -0,0 +1,57 @@
+"""Data model for Sleeper league rosters."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Self
+
+
+@dataclass
+class Roster:
+    """
+    A team of a league, as returned by the league rosters resource.
+
+    Attributes:
+        roster_id (int): Roster ID, unique within the league.
+        owner_id (Optional[str]): User ID of the owner, None for an orphaned team.
+        players (List[str]): Sleeper player IDs of every player on the roster.
+        starters (List[str]): Sleeper player IDs of the starters.
+        reserve (List[str]): Sleeper player IDs on injured reserve.
+        taxi (List[str]): Sleeper player IDs on the taxi squad.
+        co_owners (List[str]): User IDs of the co-owners.
+        wins (int): Wins this season.
+        losses (int): Losses this season.
+        ties (int): Ties this season.
+        points_for (float): Fantasy points scored this season.
+    """
+
+    roster_id: int
+    owner_id: Optional[str] = None
+    players: List[str] = field(default_factory=list)
+    starters: List[str] = field(default_factory=list)
+    reserve: List[str] = field(default_factory=list)
+    taxi: List[str] = field(default_factory=list)
+    co_owners: List[str] = field(default_factory=list)
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    points_for: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Self:
+        """Creates a Roster from a league rosters entry.
+        Raises:
+            KeyError: If the entry has no roster_id.
+        """
+        settings = data.get("settings") or {}
+        return cls(
+            roster_id=int(data["roster_id"]),
+            owner_id=data.get("owner_id"),
+            players=list(data.get("players") or []),
+            starters=[player for player in data.get("starters") or [] if player and player != "0"],
+            reserve=list(data.get("reserve") or []),
+            taxi=list(data.get("taxi") or []),
+            co_owners=list(data.get("co_owners") or []),
+            wins=int(settings.get("wins") or 0),
+            losses=int(settings.get("losses") or 0),
+            ties=int(settings.get("ties") or 0),
+            points_for=(settings.get("fpts") or 0) + (settings.get("fpts_decimal") or 0) / 100,
+        )
@@ -0,0 +1,53 @@
+"""Data model for Sleeper league transactions."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Self
+
+
+@dataclass
+class Transaction:
+    """
+    A trade, waiver claim or free agent move, as returned by the league transactions resource.
+
+    Attributes:
+        transaction_id (str): Transaction ID, unique across Sleeper.
+        type (str): "trade", "waiver" or "free_agent".
+        status (str): "complete", "failed" or "pending".
+        week (int): Week (leg) the transaction belongs to.
+        created (int): Creation time in milliseconds since the epoch.
+        roster_ids (List[int]): Rosters involved.
+        adds (Dict[str, int]): Roster ID that received every added Sleeper player ID.
+        drops (Dict[str, int]): Roster ID that dropped every dropped Sleeper player ID.
+        draft_picks (List[Dict[str, Any]]): Draft picks that changed hands in a trade.
+        waiver_bid (int): FAAB bid of a waiver claim, 0 otherwise.
+    """
+
+    transaction_id: str
+    type: str
+    status: str
+    week: int
+    created: int = 0
+    roster_ids: List[int] = field(default_factory=list)
+    adds: Dict[str, int] = field(default_factory=dict)
+    drops: Dict[str, int] = field(default_factory=dict)
+    draft_picks: List[Dict[str, Any]] = field(default_factory=list)
+    waiver_bid: int = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Self:
+        """Creates a Transaction from a league transactions entry.
+        Raises:
+            KeyError: If the entry has no transaction_id.
+        """
+        return cls(
+            transaction_id=str(data["transaction_id"]),
+            type=data.get("type") or "",
+            status=data.get("status") or "",
+            week=int(data.get("leg") or 0),
+            created=int(data.get("created") or 0),
+            roster_ids=[int(roster_id) for roster_id in data.get("roster_ids") or []],
+            adds=dict(data.get("adds") or {}),
+            drops=dict(data.get("drops") or {}),
+            draft_picks=list(data.get("draft_picks") or []),
+            waiver_bid=int((data.get("settings") or {}).get("waiver_bid") or 0),
+        )
@@ -1,6 +1,7 @@
 """Handling of Sleeper user data."""
 
-from typing import Dict, Any, Self
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Self
 from qsleeperfantasybot.sleeper.model.avatar import Avatar
 
 
@@ -51,3 +52,39 @@ class User:
     def avatar(self) -> Avatar:
         """Sleeper avatar."""
         return self._avatar
+
+
+@dataclass
+class LeagueMember:
+    """
+    A user of a league, as returned by the league users resource.
+
+    Attributes:
+        user_id (str): Sleeper user ID.
+        display_name (str): Sleeper display name.
+        team_name (Optional[str]): Team name set for the league, if any.
+        avatar (Optional[str]): Avatar ID, if any.
+        is_owner (bool): True for the commissioners of the league.
+    """
+
+    user_id: str
+    display_name: str
+    team_name: Optional[str] = None
+    avatar: Optional[str] = None
+    is_owner: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Self:
+        """Creates a LeagueMember from a league users entry."""
+        return cls(
+            user_id=str(data["user_id"]),
+            display_name=data.get("display_name") or "",
+            team_name=(data.get("metadata") or {}).get("team_name") or None,
+            avatar=data.get("avatar"),
+            is_owner=bool(data.get("is_owner")),
+        )
+
+    @property
+    def name(self) -> str:
+        """Team name, falling back to the display name."""
+        return self.team_name or self.display_name
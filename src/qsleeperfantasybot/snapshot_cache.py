@@ -0,0 +1,312 @@
+"""In-process cache of FantasyCalc value snapshots keyed by league settings.
+A snapshot is the full FantasyCalc values payload for one combination of league settings, parsed once into
+value columns and a name index. The cache keeps a bounded number of snapshots in least-recently-used order,
+expires them after a TTL and makes sure that concurrent requests for the same settings share a single upstream fetch.
+Classes:
+    SettingsKey: Named tuple of the league settings that identify a FantasyCalc payload.
+    ValueSnapshot: A parsed FantasyCalc payload together with its settings key and fetch timestamp.
+    SnapshotStatus: Why a lookup returned the snapshot it did: fresh, expired while refreshing, or as a fallback.
+    SnapshotLookup: A snapshot returned by a lookup together with its status.
+    SnapshotCache: TTL + LRU cache of ValueSnapshot objects with single-flight loading.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from itertools import count
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Set
+
+from qsleeperfantasybot.draft_picks import PickIndex
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.name_index import NameIndex
+from qsleeperfantasybot.player_model import Player, create_player_from_dict
+
+DEFAULT_TTL_SECONDS = 15 * 60
+DEFAULT_MAX_ENTRIES = 64
+
+_snapshot_versions = count(1)
+
+
+class SettingsKey(NamedTuple):
+    """League settings that select a FantasyCalc values payload."""
+
+    is_dynasty: bool
+    num_qbs: int
+    num_teams: int
+    ppr: float
+
+    @classmethod
+    def create(cls, is_dynasty: bool, num_qbs: int, num_teams: int, ppr: float) -> "SettingsKey":
+        """Create a normalized key so that e.g. ppr=1 and ppr=1.0 map to the same snapshot."""
+        return cls(bool(is_dynasty), int(num_qbs), int(num_teams), float(ppr))
+
+
+@dataclass
+class ValueSnapshot:
+    """
+    A FantasyCalc values payload for one settings key.
+
+    Only the columns needed for indexing and ranking are parsed when the snapshot is built. Full Player objects are
+    created on first access through `player()` and memoized, so a refresh no longer allocates a Player for every
+    asset when a trade only touches a handful.
+
+    Attributes:
+        key (SettingsKey): The league settings the payload was fetched for.
+        assets (List[Dict[str, Any]]): The raw asset dictionaries returned by the API.
+        fetched_at (float): Unix timestamp of when the payload was fetched.
+        names (List[str]): Asset names, one per entry. Assets without a name are skipped and of assets sharing a
+            lowercase name the last one wins, as in `create_lookup_dict`.
+        ids (List[int]): FantasyCalc asset IDs, one per entry.
+        values (List[int]): Asset values, one per entry (0 when the payload has none).
+        positions (List[str]): Asset positions, one per entry.
+        sleeper_ids (List[Optional[str]]): Sleeper player IDs, one per entry (None for draft picks and unmapped
+            assets).
+        name_index (NameIndex): Prebuilt name matching index over the entries.
+        restored (bool): True if the snapshot was restored from disk instead of fetched by this process.
+        version (int): Number that is unique to this snapshot within the process and grows with every snapshot
+            built, so results derived from a snapshot can be keyed by it.
+    """
+
+    key: SettingsKey
+    assets: List[Dict[str, Any]] = field(repr=False)
+    fetched_at: float
+    restored: bool = False
+    names: List[str] = field(init=False, repr=False)
+    ids: List[int] = field(init=False, repr=False)
+    values: List[int] = field(init=False, repr=False)
+    positions: List[str] = field(init=False, repr=False)
+    sleeper_ids: List[str | None] = field(init=False, repr=False)
+    name_index: NameIndex = field(init=False, repr=False)
+    version: int = field(init=False, default_factory=lambda: next(_snapshot_versions))
+    _rows: List[int] = field(init=False, repr=False)
+    _players: Dict[int, Player] = field(init=False, repr=False, default_factory=dict)
+    _sleeper_entries: Dict[str, int] | None = field(init=False, repr=False, default=None)
+    _pick_index: PickIndex | None = field(init=False, repr=False, default=None)
+
+    def __post_init__(self) -> None:
+        rows: Dict[str, int] = {}
+        for row, asset in enumerate(self.assets):
+            name = (asset.get("player") or {}).get("name")
+            if name:
+                rows[name.lower()] = row
+        self._rows = list(rows.values())
+        infos = [self.assets[row]["player"] for row in self._rows]
+        self.names = [info["name"] for info in infos]
+        self.ids = [info.get("id") for info in infos]
+        self.positions = [info.get("position") for info in infos]
+        self.sleeper_ids = [info.get("sleeperId") for info in infos]
+        self.values = [self.assets[row].get("value") or 0 for row in self._rows]
+        self.name_index = NameIndex(self.names, self.values)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def player(self, entry: int) -> Player:
+        """Return the Player for an entry, creating it from the raw payload on first access."""
+        player = self._players.get(entry)
+        if player is None:
+            player = self._players[entry] = create_player_from_dict(self.assets[self._rows[entry]])
+        return player
+
+    def derived_player(self, entry: int, name: str, value: int) -> Player:
+        """Return a new Player from an entry's payload with another name and value, e.g. an interpolated pick."""
+        asset = self.assets[self._rows[entry]]
+        return create_player_from_dict({**asset, "value": value, "player": {**asset["player"], "name": name}})
+
+    @property
+    def pick_index(self) -> PickIndex:
+        """The draft pick index of the snapshot, built on first access."""
+        if self._pick_index is None:
+            self._pick_index = PickIndex(self.names, self.values, self.positions, self.key.num_teams)
+        return self._pick_index
+
+    def entries_for_sleeper_ids(self, sleeper_ids: Iterable[str]) -> List[int]:
+        """Return the entries of the given Sleeper player IDs, skipping IDs FantasyCalc does not value."""
+        if self._sleeper_entries is None:
+            self._sleeper_entries = {sid: entry for entry, sid in enumerate(self.sleeper_ids) if sid}
+        entries = self._sleeper_entries
+        return [entries[sid] for sid in sleeper_ids if sid in entries]
+
+    def age(self, now: float | None = None) -> float:
+        """Return the age of the snapshot in seconds."""
+        return (time.time() if now is None else now) - self.fetched_at
+
+
+class SnapshotStatus(Enum):
+    """Why a lookup returned the snapshot it did: FRESH if it is younger than the TTL, REFRESHING if it expired and
+    is reloaded in the background within the stale-while-revalidate window, FALLBACK if it expired and its reload
+    failed or timed out."""
+
+    FRESH = "fresh"
+    REFRESHING = "refreshing"
+    FALLBACK = "fallback"
+
+
+class SnapshotLookup(NamedTuple):
+    """A snapshot returned by SnapshotCache.lookup and why it was returned."""
+
+    snapshot: ValueSnapshot
+    status: SnapshotStatus
+
+
+SnapshotLoader = Callable[[SettingsKey], Awaitable[ValueSnapshot]]
+SnapshotListener = Callable[[ValueSnapshot], None]
+
+
+class SnapshotCache:
+    """TTL + LRU cache of value snapshots with single-flight loading.
+
+    Args:
+        loader (SnapshotLoader): Coroutine function that fetches and parses a snapshot for a settings key.
+        ttl (float): Seconds a snapshot stays fresh. Defaults to 15 minutes.
+        max_entries (int): Maximum number of settings combinations kept in memory. Defaults to 64.
+        clock (Callable[[], float]): Time source, injectable for tests. Defaults to time.time.
+        stale_while_revalidate (float): Seconds past the TTL during which an expired snapshot is still returned
+            immediately while a fresh one is loaded in the background. Defaults to 0 (always wait for a reload).
+        restored_stale_while_revalidate (float, optional): The stale-while-revalidate window of snapshots restored
+            from disk, so a restart can answer from disk long after their TTL. Defaults to stale_while_revalidate.
+        stale_if_error (bool): When a reload of an expired snapshot fails, return the expired snapshot instead of
+            raising. Defaults to False.
+        stale_timeout (float, optional): With stale_if_error, the seconds to wait for a reload before returning the
+            expired snapshot while the reload continues in the background. Defaults to no limit.
+    """
+
+    def __init__(
+        self,
+        loader: SnapshotLoader,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+        stale_while_revalidate: float = 0,
+        restored_stale_while_revalidate: float | None = None,
+        stale_if_error: bool = False,
+        stale_timeout: float | None = None,
+    ) -> None:
+        self._loader = loader
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self.restored_stale_while_revalidate = (
+            stale_while_revalidate if restored_stale_while_revalidate is None else restored_stale_while_revalidate
+        )
+        self.stale_if_error = stale_if_error
+        self.stale_timeout = stale_timeout
+        self._clock = clock
+        self._entries: "OrderedDict[SettingsKey, ValueSnapshot]" = OrderedDict()
+        self._inflight: Dict[SettingsKey, "asyncio.Task[ValueSnapshot]"] = {}
+        self._failed: Set[SettingsKey] = set()
+        self._listeners: List[SnapshotListener] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def peek(self, key: SettingsKey) -> ValueSnapshot | None:
+        """Return the cached snapshot for a key regardless of its age, without loading or touching LRU order."""
+        return self._entries.get(key)
+
+    def is_fresh(self, snapshot: ValueSnapshot) -> bool:
+        """Return True if the snapshot is younger than the TTL."""
+        return snapshot.age(self._clock()) < self.ttl
+
+    def add_listener(self, listener: SnapshotListener) -> None:
+        """Register a callback that is called with every snapshot put into the cache."""
+        self._listeners.append(listener)
+
+    def put(self, snapshot: ValueSnapshot) -> None:
+        """Insert or replace a snapshot and evict the least recently used entries above max_entries.
+        Replacing is atomic for readers: callers that already hold the previous snapshot keep a consistent view.
+        """
+        self._entries[snapshot.key] = snapshot
+        self._entries.move_to_end(snapshot.key)
+        self._failed.discard(snapshot.key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            logger.debug(f"Evicted value snapshot {evicted}")
+        for listener in self._listeners:
+            listener(snapshot)
+
+    def invalidate(self, key: SettingsKey | None = None) -> None:
+        """Drop one snapshot, or all snapshots if no key is given."""
+        if key is None:
+            self._entries.clear()
+            self._failed.clear()
+        else:
+            self._entries.pop(key, None)
+            self._failed.discard(key)
+
+    async def get(self, key: SettingsKey) -> ValueSnapshot:
+        """Return a fresh snapshot for the key, loading it if missing or expired. See lookup."""
+        return (await self.lookup(key)).snapshot
+
+    async def lookup(self, key: SettingsKey) -> SnapshotLookup:
+        """Return a fresh snapshot for the key, loading it if missing or expired, and why it was returned.
+
+        Concurrent callers for the same key await the same in-flight load. Within the stale-while-revalidate
+        window, which is longer for snapshots restored from disk, an expired snapshot is returned right away and
+        reloaded in the background. Past it, with stale_if_error the expired snapshot is still returned if the reload
+        fails or exceeds stale_timeout. A snapshot returned within the window counts as a fallback instead of
+        refreshing if the previous reload of the key failed.
+        """
+        snapshot = self._entries.get(key)
+        if snapshot is not None:
+            age = snapshot.age(self._clock())
+            if age < self.ttl:
+                self._entries.move_to_end(key)
+                return SnapshotLookup(snapshot, SnapshotStatus.FRESH)
+            window = self.restored_stale_while_revalidate if snapshot.restored else self.stale_while_revalidate
+            if age < self.ttl + window:
+                self._entries.move_to_end(key)
+                self.revalidate(key)
+                status = SnapshotStatus.FALLBACK if key in self._failed else SnapshotStatus.REFRESHING
+                return SnapshotLookup(snapshot, status)
+        if snapshot is None or not self.stale_if_error:
+            return SnapshotLookup(await self.refresh(key), SnapshotStatus.FRESH)
+        try:
+            return SnapshotLookup(await asyncio.wait_for(self.refresh(key), self.stale_timeout), SnapshotStatus.FRESH)
+        except Exception as e:
+            logger.warning(f"Serving stale value snapshot {key} ({snapshot.age(self._clock()):.0f}s old): {e!r}")
+            return SnapshotLookup(snapshot, SnapshotStatus.FALLBACK)
+
+    def _start_load(self, key: SettingsKey) -> "asyncio.Task[ValueSnapshot]":
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key))
+            self._inflight[key] = task
+        return task
+
+    def revalidate(self, key: SettingsKey) -> None:
+        """Start a background reload for the key unless one is already in flight. Failures are only logged."""
+        if key in self._inflight:
+            return
+        task = self._start_load(key)
+
+        def log_failure(done: "asyncio.Task[ValueSnapshot]") -> None:
+            if not done.cancelled() and done.exception() is not None:
+                logger.warning(f"Background revalidation of value snapshot {key} failed: {done.exception()}")
+
+        task.add_done_callback(log_failure)
+
+    async def refresh(self, key: SettingsKey) -> ValueSnapshot:
+        """Load a new snapshot for the key, joining an in-flight load if one exists."""
+        task = self._start_load(key)
+        # Shield the shared load so one cancelled caller does not cancel it for everyone else.
+        return await asyncio.shield(task)
+
+    async def _load(self, key: SettingsKey) -> ValueSnapshot:
+        try:
+            start_time = time.perf_counter()
+            snapshot = await self._loader(key)
+            elapsed = time.perf_counter() - start_time
+            logger.debug(f"Loaded value snapshot {key} with {len(snapshot)} assets in {elapsed:.6f} seconds")
+            self.put(snapshot)
+            return snapshot
+        except Exception:
+            self._failed.add(key)
+            raise
+        finally:
+            self._inflight.pop(key, None)
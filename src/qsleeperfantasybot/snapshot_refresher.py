@@ -0,0 +1,126 @@
+"""Background refresher that keeps FantasyCalc value snapshots warm for common league settings.
+Without it only the settings used for autocomplete are fetched at startup and every other configuration is
+fetched cold inside a user's command. The refresher reloads a configurable matrix of settings on a jittered
+schedule that is shorter than the snapshot TTL, so lookups for those settings are always served from memory.
+New snapshots replace old ones atomically in the cache; callers holding the previous snapshot keep using it.
+Classes:
+    SnapshotRefresher: Periodically refreshes a list of settings keys in a SnapshotCache.
+Functions:
+    default_prewarm_matrix(): Returns the default matrix of settings to keep warm.
+"""
+
+import asyncio
+import random
+from itertools import product
+from typing import Iterable, List
+
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.snapshot_cache import SettingsKey, SnapshotCache
+
+DEFAULT_REFRESH_INTERVAL_SECONDS = 10 * 60
+DEFAULT_JITTER = 0.1
+DEFAULT_SPACING_SECONDS = 0.5
+
+
+def default_prewarm_matrix(
+    dynasty: Iterable[bool] = (True, False),
+    num_qbs: Iterable[int] = (1, 2),
+    num_teams: Iterable[int] = (10, 12, 14),
+    ppr: Iterable[float] = (0, 0.5, 1),
+) -> List[SettingsKey]:
+    """Returns every combination of the given settings as cache keys.
+    Args:
+        dynasty (Iterable[bool]): Dynasty and/or redraft. Defaults to both.
+        num_qbs (Iterable[int]): 1QB and/or superflex. Defaults to both.
+        num_teams (Iterable[int]): League sizes. Defaults to 10, 12 and 14 teams.
+        ppr (Iterable[float]): PPR settings. Defaults to 0, 0.5 and 1.
+    Returns:
+        List[SettingsKey]: The settings keys to keep warm.
+    """
+    return [SettingsKey.create(*combination) for combination in product(dynasty, num_qbs, num_teams, ppr)]
+
+
+class SnapshotRefresher:
+    """Keeps a matrix of settings warm in a snapshot cache.
+
+    Args:
+        cache (SnapshotCache): The cache to refresh.
+        keys (List[SettingsKey]): The settings to keep warm.
+        interval (float): Seconds between refresh rounds. Must be shorter than the cache TTL. Defaults to 10 minutes.
+        jitter (float): Fraction of the interval by which each round is randomly shifted. Defaults to 0.1.
+        spacing (float): Seconds to wait between two fetches of one round, to avoid bursting upstream.
+    """
+
+    def __init__(
+        self,
+        cache: SnapshotCache,
+        keys: List[SettingsKey],
+        interval: float = DEFAULT_REFRESH_INTERVAL_SECONDS,
+        jitter: float = DEFAULT_JITTER,
+        spacing: float = DEFAULT_SPACING_SECONDS,
+    ) -> None:
+        if interval * (1 + jitter) >= cache.ttl:
+            logger.warning(f"Refresh interval {interval}s is not shorter than the snapshot TTL {cache.ttl}s")
+        if len(keys) > cache.max_entries:
+            logger.warning(f"Pre-warming {len(keys)} settings but the cache only holds {cache.max_entries}")
+        self.cache = cache
+        self.keys = keys
+        self.interval = interval
+        self.jitter = jitter
+        self.spacing = spacing
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    def next_delay(self) -> float:
+        """Seconds until the next refresh round, with random jitter applied."""
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    async def refresh_once(self, force: bool = True) -> int:
+        """Refresh every key once and return how many refreshes succeeded. Failures are logged and skipped.
+        Args:
+            force (bool): Reload every key. If False, only keys that are missing or expired are loaded, which also
+                replaces stale snapshots restored from disk.
+        """
+        refreshed = 0
+        fetched = 0
+        for key in self.keys:
+            snapshot = self.cache.peek(key)
+            if not force and snapshot is not None and self.cache.is_fresh(snapshot):
+                refreshed += 1
+                continue
+            if fetched and self.spacing:
+                await asyncio.sleep(self.spacing)
+            fetched += 1
+            try:
+                await self.cache.refresh(key)
+                refreshed += 1
+            except Exception as e:
+                logger.warning(f"Failed to refresh value snapshot {key}: {e}")
+        logger.info(f"Refreshed {refreshed}/{len(self.keys)} value snapshots")
+        return refreshed
+
+    async def _run(self) -> None:
+        # The first round only fills gaps and replaces stale snapshots restored from disk.
+        await self.refresh_once(force=False)
+        while True:
+            await asyncio.sleep(self.next_delay())
+            await self.refresh_once()
+
+    def start(self) -> None:
+        """Start the background refresh task if it is not already running."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="snapshot-refresher")
+
+    async def stop(self) -> None:
+        """Cancel the background refresh task and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,88 @@
+"""On-disk persistence of FantasyCalc value snapshots for warm bot startup.
+Every fetched FantasyCalc payload is written to one compact JSON file per settings key, together with its fetch
+timestamp. On startup the bot restores these files into the snapshot cache so it can answer commands from the last
+good snapshot right away, even if FantasyCalc is down, while fresh data is fetched in the background.
+Classes:
+    PersistedSnapshot: The raw payload of a stored snapshot with its settings key and fetch timestamp.
+    SnapshotStore: Reads and atomically writes persisted snapshots in a directory.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.snapshot_cache import SettingsKey
+
+FORMAT_VERSION = 1
+
+
+@dataclass
+class PersistedSnapshot:
+    """
+    A FantasyCalc payload as stored on disk.
+
+    Attributes:
+        key (SettingsKey): The league settings the payload was fetched for.
+        fetched_at (float): Unix timestamp of when the payload was fetched.
+        assets (List[Dict[str, Any]]): The raw list of asset dictionaries returned by the API.
+    """
+
+    key: SettingsKey
+    fetched_at: float
+    assets: List[Dict[str, Any]]
+
+
+class SnapshotStore:
+    """Handles storing and loading FantasyCalc snapshots, one JSON file per settings key."""
+
+    def __init__(self, directory: Path = Path("sleeper_data/fantasycalc")) -> None:
+        """Initialize the store with the given directory."""
+        self.directory = directory
+
+    def path_for(self, key: SettingsKey) -> Path:
+        """Return the file path used for a settings key."""
+        kind = "dynasty" if key.is_dynasty else "redraft"
+        return self.directory / f"{kind}_{key.num_qbs}qb_{key.num_teams}teams_{key.ppr:g}ppr.json"
+
+    def save(self, key: SettingsKey, fetched_at: float, assets: List[Dict[str, Any]]) -> None:
+        """Write a payload atomically, so a crash mid-write never leaves a truncated snapshot behind."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        document = {"version": FORMAT_VERSION, "settings": key._asdict(), "fetched_at": fetched_at, "assets": assets}
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(document, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def _read(self, path: Path) -> PersistedSnapshot | None:
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                document = json.load(f)
+            if document.get("version") != FORMAT_VERSION:
+                logger.info(f"Ignoring snapshot {path} with unsupported format version")
+                return None
+            return PersistedSnapshot(
+                key=SettingsKey.create(**document["settings"]),
+                fetched_at=float(document["fetched_at"]),
+                assets=list(document["assets"]),
+            )
+        except (json.JSONDecodeError, IOError, KeyError, TypeError) as e:
+            logger.warning(f"Snapshot file {path} corrupted or unreadable: {e}")
+            return None
+
+    def load(self, key: SettingsKey) -> PersistedSnapshot | None:
+        """Load the stored snapshot for a settings key, or None if there is no usable file."""
+        path = self.path_for(key)
+        return self._read(path) if path.is_file() else None
+
+    def load_all(self) -> Iterator[PersistedSnapshot]:
+        """Yield every usable stored snapshot."""
+        if not self.directory.is_dir():
+            return
+        for path in sorted(self.directory.glob("*.json")):
+            persisted = self._read(path)
+            if persisted is not None:
+                yield persisted
@@ -0,0 +1,219 @@
+"""Trade balancer that suggests the assets which close the value gap of a trade.
+For every recently used settings key the balancer keeps the snapshot's assets as an array sorted by value. A side's
+adjusted value is a p-norm (see trade_valuation), so in p-space, where each asset contributes v^p, adding assets is
+additive again: the contribution needed from k filler assets is known up front and the best single asset, pair or
+triple is found by bisecting the sorted array instead of trying every combination. Candidates are then re-scored
+exactly with the trade valuator and the ones that bring the gap within the tolerance are returned, which takes a few
+milliseconds and can be appended to every trade result.
+Classes:
+    BalanceSuggestion: A set of filler assets and the gap that remains after adding them.
+    TradeBalancer: Finds filler assets over a value snapshot.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Collection, FrozenSet, List, Sequence, Set, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.snapshot_cache import DEFAULT_MAX_ENTRIES, SettingsKey, ValueSnapshot
+from qsleeperfantasybot.trade_valuation import TradeValuator
+
+DEFAULT_TOLERANCE = 0.05
+DEFAULT_TRIPLE_POOL = 120
+
+IntArray = npt.NDArray[np.intp]
+
+
+@dataclass
+class BalanceSuggestion:
+    """
+    Filler assets that even out a trade.
+
+    Attributes:
+        entries (List[int]): Snapshot entries of the suggested assets.
+        names (List[str]): Names of the suggested assets.
+        values (List[int]): Values of the suggested assets.
+        remaining_gap (int): Leading side value minus trailing side value after adding the assets.
+    """
+
+    entries: List[int]
+    names: List[str]
+    values: List[int]
+    remaining_gap: int
+
+
+class TradeBalancer:
+    """Suggests 1-3 filler assets for the trailing side of a trade.
+
+    Args:
+        valuator (TradeValuator): The engine that values trade sides.
+        max_assets (int): Largest number of filler assets in one suggestion, at most 3. Defaults to 3.
+        triple_pool (int): Number of most valuable candidates considered as the first two assets of a triple.
+            Defaults to 120.
+        max_entries (int): Maximum number of settings keys whose sorted assets are kept. Defaults to 64, the size of
+            the snapshot cache.
+    """
+
+    def __init__(
+        self,
+        valuator: TradeValuator,
+        max_assets: int = 3,
+        triple_pool: int = DEFAULT_TRIPLE_POOL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if not 1 <= max_assets <= 3:
+            raise ValueError(f"max_assets must be between 1 and 3, got {max_assets}")
+        self.valuator = valuator
+        self.max_assets = max_assets
+        self.triple_pool = triple_pool
+        self.max_entries = max_entries
+        self._tables: "OrderedDict[SettingsKey, Tuple[ValueSnapshot, IntArray]]" = OrderedDict()
+
+    def value_order(self, snapshot: ValueSnapshot) -> IntArray:
+        """Return the snapshot's valued entries sorted by ascending value, built once per snapshot.
+        Tables are kept in an LRU of max_entries settings keys.
+        """
+        cached = self._tables.get(snapshot.key)
+        if cached is not None and cached[0] is snapshot:
+            self._tables.move_to_end(snapshot.key)
+            return cached[1]
+        values = np.asarray(snapshot.values, dtype=np.float64)
+        order = np.argsort(values, kind="stable")
+        order = order[values[order] > 0]
+        self._tables[snapshot.key] = (snapshot, order)
+        self._tables.move_to_end(snapshot.key)
+        while len(self._tables) > self.max_entries:
+            self._tables.popitem(last=False)
+        return order
+
+    def evict_replaced(self, snapshot: ValueSnapshot) -> None:
+        """Drop the table of an earlier snapshot with the same settings, so that snapshot can be freed.
+        Intended as a snapshot cache listener, called when a new snapshot lands.
+        """
+        cached = self._tables.get(snapshot.key)
+        if cached is not None and cached[0] is not snapshot:
+            del self._tables[snapshot.key]
+            logger.debug(f"Dropped the sorted assets of a replaced snapshot for {snapshot.key}")
+
+    def suggest(
+        self,
+        snapshot: ValueSnapshot,
+        leading: Sequence[int],
+        trailing: Sequence[int],
+        exclude: Collection[int] = (),
+        roster: Collection[int] | None = None,
+        tolerance: float | None = None,
+        limit: int = 3,
+    ) -> List[BalanceSuggestion]:
+        """Find filler assets for the trailing side that bring the gap within the tolerance.
+        Args:
+            snapshot (ValueSnapshot): The snapshot to pick assets from.
+            leading (Sequence[int]): Asset values of the side with the higher value.
+            trailing (Sequence[int]): Asset values of the side that should add assets.
+            exclude (Collection[int]): Snapshot entries that may not be suggested, e.g. assets already in the trade.
+            roster (Collection[int], optional): Only suggest these snapshot entries, e.g. the trailing manager's
+                roster. Defaults to every asset in the snapshot.
+            tolerance (float, optional): Largest acceptable remaining gap in either direction. Defaults to 5% of
+                the leading side's value.
+            limit (int): Maximum number of suggestions. Defaults to 3.
+        Returns:
+            List[BalanceSuggestion]: The suggestions with the fewest assets first, then the smallest remaining gap.
+                Empty if the trade is already balanced or nothing fits.
+        """
+        lead_value = self.valuator.side_value(leading)
+        trail_value = self.valuator.side_value(trailing)
+        tolerance = DEFAULT_TOLERANCE * lead_value if tolerance is None else tolerance
+        if lead_value - trail_value <= tolerance:
+            return []
+
+        pool = self._pool(snapshot, exclude, roster)
+        values = np.asarray(snapshot.values, dtype=np.float64)[pool]
+        combos = self._candidates(values, trailing, lead_value)
+        if not len(combos):
+            return []
+
+        filler = np.where(combos >= 0, values[combos], 0.0)
+        current = np.broadcast_to(np.asarray(trailing, dtype=np.float64), (len(combos), len(trailing)))
+        gaps = lead_value - self.valuator.side_values(np.concatenate([current, filler], axis=1))
+        within = np.flatnonzero(np.abs(gaps) <= tolerance)
+        sizes = np.count_nonzero(combos >= 0, axis=1)
+        ranked = within[np.lexsort((-filler.sum(axis=1)[within], np.abs(gaps[within]), sizes[within]))]
+
+        suggestions: List[BalanceSuggestion] = []
+        seen: Set[FrozenSet[int]] = set()
+        for row in ranked:
+            combo = combos[row][combos[row] >= 0]
+            entries = [int(pool[i]) for i in combo[np.argsort(-values[combo], kind="stable")]]
+            if frozenset(entries) in seen:
+                continue
+            seen.add(frozenset(entries))
+            suggestions.append(
+                BalanceSuggestion(
+                    entries=entries,
+                    names=[snapshot.names[entry] for entry in entries],
+                    values=[snapshot.values[entry] for entry in entries],
+                    remaining_gap=round(float(gaps[row])),
+                )
+            )
+            if len(suggestions) == limit:
+                break
+        return suggestions
+
+    def _pool(self, snapshot: ValueSnapshot, exclude: Collection[int], roster: Collection[int] | None) -> IntArray:
+        """The entries that may be suggested, in ascending value order."""
+        order = self.value_order(snapshot)
+        allowed = np.ones(len(snapshot), dtype=bool)
+        if roster is not None:
+            allowed[:] = False
+            allowed[np.fromiter(roster, dtype=np.intp)] = True
+        if exclude:
+            allowed[np.fromiter(exclude, dtype=np.intp)] = False
+        return order[allowed[order]]
+
+    def _candidates(self, values: npt.NDArray[np.float64], trailing: Sequence[int], lead_value: float) -> IntArray:
+        """Candidate filler sets of 1 to max_assets pool positions, padded with -1 to (candidates, max_assets)."""
+        if not len(values):
+            return np.empty((0, self.max_assets), dtype=np.intp)
+        exponent = self.valuator.settings.consolidation_exponent
+        cost = self.valuator.settings.roster_spot_cost
+        powered = values**exponent
+        filled = [value for value in trailing if value > 0]
+        base = float(np.sum(np.asarray(filled, dtype=np.float64) ** exponent))
+        groups = []
+        for size in range(1, self.max_assets + 1):
+            # Contribution in p-space that makes the trailing side worth exactly the leading side.
+            needed = (lead_value + cost * (len(filled) + size - 1)) ** exponent - base
+            if needed > 0:
+                group = self._closest(powered, needed, size)
+                padding = np.full((len(group), self.max_assets - size), -1, dtype=np.intp)
+                groups.append(np.concatenate([group, padding], axis=1))
+        return np.concatenate(groups) if groups else np.empty((0, self.max_assets), dtype=np.intp)
+
+    def _closest(self, powered: npt.NDArray[np.float64], needed: float, size: int) -> IntArray:
+        """Pool positions of `size` distinct assets whose p-space contributions sum closest to `needed`.
+        Every asset (size 2) or pair of the most valuable assets (size 3) is a prefix that is completed with the two
+        assets around the bisected remainder. Returns an array of shape (candidates, size) that may hold the same set
+        in different orders.
+        """
+        count = len(powered)
+        if size == 1:
+            prefixes = np.empty((1, 0), dtype=np.intp)
+        elif size == 2:
+            prefixes = np.arange(count, dtype=np.intp)[:, None]
+        else:
+            top = np.arange(max(0, count - self.triple_pool), count, dtype=np.intp)
+            first, second = np.triu_indices(len(top), k=1)
+            prefixes = np.stack([top[first], top[second]], axis=1)
+        remaining = needed - powered[prefixes].sum(axis=1)
+        position = np.searchsorted(powered, remaining)
+        combos = []
+        for offset in (-1, 0):
+            last = position + offset
+            in_range = (last >= 0) & (last < count)
+            last = np.clip(last, 0, count - 1)
+            valid = in_range & ~np.any(prefixes == last[:, None], axis=1)
+            combos.append(np.concatenate([prefixes[valid], last[valid, None]], axis=1))
+        return np.concatenate(combos)
@@ -0,0 +1,139 @@
+"""Memoized dynasty trade results keyed by canonical trade.
+Popular trades are compared again and again. A trade is identified by the lowercased asset names of each side in
+sorted order, with the two sides themselves in sorted order, together with the settings and the version of the value
+snapshot it was valued with. Asking for the same trade again, with the assets or the sides in another order, skips
+name resolution and valuation, and the message of each side order is formatted only once. A new snapshot has a new
+version, so results of a replaced snapshot are never served and are dropped when the new snapshot lands.
+Classes:
+    TradeKey: Canonical key of a trade under one value snapshot.
+    TradeResult: The valued sides of a trade and their formatted messages.
+    TradeResultCache: LRU cache of trade results.
+Functions:
+    canonical_trade(snapshot, side_a, side_b): Returns the canonical key of a trade and whether its sides are swapped.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.messages import construct_dynasty_trade_message
+from qsleeperfantasybot.snapshot_cache import SettingsKey, ValueSnapshot
+from qsleeperfantasybot.trade_balancer import BalanceSuggestion
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class TradeKey(NamedTuple):
+    """A trade with sorted assets per side and sorted sides, valued with one snapshot."""
+
+    settings: SettingsKey
+    version: int
+    side_a: Tuple[str, ...]
+    side_b: Tuple[str, ...]
+
+
+def canonical_trade(snapshot: ValueSnapshot, side_a: Sequence[str], side_b: Sequence[str]) -> Tuple[TradeKey, bool]:
+    """Returns the canonical key of a trade.
+    Args:
+        snapshot (ValueSnapshot): The snapshot the trade is valued with.
+        side_a (Sequence[str]): Queried asset names of side A.
+        side_b (Sequence[str]): Queried asset names of side B.
+    Returns:
+        Tuple[TradeKey, bool]: The key and True if side A of the query is side B of the key.
+    """
+    first = tuple(sorted(name.strip().lower() for name in side_a))
+    second = tuple(sorted(name.strip().lower() for name in side_b))
+    swapped = second < first
+    if swapped:
+        first, second = second, first
+    return TradeKey(snapshot.key, snapshot.version, first, second), swapped
+
+
+@dataclass
+class TradeResult:
+    """
+    The valued sides of a trade in canonical side order.
+
+    Attributes:
+        total_a (int): Adjusted total value of side A.
+        details_a (List[Tuple[str, int]]): Asset names and values of side A.
+        total_b (int): Adjusted total value of side B.
+        details_b (List[Tuple[str, int]]): Asset names and values of side B.
+        unresolved (List[str]): Queried assets that could not be resolved and were counted as 0.
+        suggestions (List[BalanceSuggestion]): Filler assets for the side without the advantage.
+    """
+
+    total_a: int
+    details_a: List[Tuple[str, int]]
+    total_b: int
+    details_b: List[Tuple[str, int]]
+    unresolved: List[str]
+    suggestions: List[BalanceSuggestion]
+    _messages: Dict[bool, str] = field(init=False, repr=False, default_factory=dict)
+
+    def swap(self) -> "TradeResult":
+        """Return the same result with side A and side B exchanged."""
+        return TradeResult(
+            self.total_b, self.details_b, self.total_a, self.details_a, self.unresolved, self.suggestions
+        )
+
+    def message(self, swapped: bool = False, stale_age: float | None = None, refreshing: bool = False) -> str:
+        """Return the comparison message, with the sides exchanged if swapped.
+        Each side order is formatted once; messages that report the age of stale values are formatted every time.
+        """
+        message = self._messages.get(swapped) if stale_age is None else None
+        if message is None:
+            result = self.swap() if swapped else self
+            message = construct_dynasty_trade_message(
+                result.total_a,
+                result.details_a,
+                result.total_b,
+                result.details_b,
+                stale_age=stale_age,
+                unresolved=result.unresolved,
+                suggestions=result.suggestions,
+                refreshing=refreshing,
+            )
+            if stale_age is None:
+                self._messages[swapped] = message
+        return message
+
+
+class TradeResultCache:
+    """LRU cache of trade results keyed by canonical trade.
+
+    Args:
+        max_entries (int): Maximum number of trades kept in memory. Defaults to 1024.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[TradeKey, TradeResult]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: TradeKey) -> TradeResult | None:
+        """Return the cached result of a trade and mark it as recently used, or None if it is not cached."""
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: TradeKey, result: TradeResult) -> None:
+        """Cache the result of a trade and evict the least recently used trades above max_entries."""
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def evict_replaced(self, snapshot: ValueSnapshot) -> None:
+        """Drop the results of earlier snapshots with the same settings.
+        Intended as a snapshot cache listener, called when a new snapshot lands.
+        """
+        replaced = [key for key in self._entries if key.settings == snapshot.key and key.version != snapshot.version]
+        for key in replaced:
+            del self._entries[key]
+        if replaced:
+            logger.debug(f"Dropped {len(replaced)} cached trades of replaced snapshots for {snapshot.key}")
@@ -0,0 +1,342 @@
+"""League-wide trade finder for an asset a manager is shopping.
+All rosters of a league are joined with a value snapshot into one team x position x depth matrix of asset values,
+sorted so the starters of every team come first. Starter value, positional need (distance to the league median
+starter value) and surplus (the best bench asset) of every team follow from that matrix in a few array operations.
+To shop an asset, the bench assets of every other team at the positions the shopping team needs are combined into
+packages of up to two assets, all packages of the whole league are valued in one call to the trade valuator, and
+for every team the fair package that improves the shopping team's lineup the most is returned. A 12- or 14-team
+scan is one pass over the matrix instead of one trade calculation per team. The most recently used league matrices
+are cached and dropped when their value snapshot is replaced.
+Classes:
+    LeagueMatrix: Team x position value matrix of one league.
+    TradeTarget: The package one team could offer for the shopped asset.
+    TradeFinder: Builds, caches and scans league matrices.
+Functions:
+    build_league_matrix(league_id, snapshot, rosters, owners, slots): Joins Sleeper rosters with a snapshot.
+Globals:
+    trade_finder: Finder with the default valuation, tolerance and cache TTL.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Callable, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.sleeper.model.roster import Roster
+from qsleeperfantasybot.snapshot_cache import DEFAULT_TTL_SECONDS, ValueSnapshot
+from qsleeperfantasybot.trade_proposals import lineup_values
+from qsleeperfantasybot.trade_valuation import TradeValuator
+
+DEFAULT_TOLERANCE = 0.1
+DEFAULT_BENCH_POOL = 8
+DEFAULT_MAX_ENTRIES = 64
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.intp]
+
+
+@dataclass
+class LeagueMatrix:
+    """
+    Asset values of every roster of a league by position.
+
+    Attributes:
+        league_id (str): The Sleeper league ID.
+        snapshot (ValueSnapshot): The snapshot the values were taken from.
+        roster_ids (List[int]): Sleeper roster IDs, one per team.
+        owners (List[str]): Team or owner names, one per team.
+        positions (List[str]): Positions with starting slots, one per matrix column.
+        slots (IntArray): Starters per position, shape (positions,).
+        values (FloatArray): Asset values sorted from best to worst, shape (teams, positions, depth), 0 padded.
+        entries (IntArray): Snapshot entries matching `values`, -1 padded.
+        built_at (float): Unix timestamp of when the matrix was built.
+        league_version (int): Version of the league snapshot the rosters were taken from, 0 if unknown.
+    """
+
+    league_id: str
+    snapshot: ValueSnapshot
+    roster_ids: List[int]
+    owners: List[str]
+    positions: List[str]
+    slots: IntArray
+    values: FloatArray
+    entries: IntArray
+    built_at: float = field(default_factory=time.time)
+    league_version: int = 0
+
+    @property
+    def starting(self) -> npt.NDArray[np.bool_]:
+        """starting[p, i] is True if the i-th best asset at position p starts, shape (positions, depth)."""
+        return np.arange(self.values.shape[2]) < self.slots[:, None]
+
+    def holds(self, roster_id: int, entry: int) -> bool:
+        """Return True if a roster of the league holds a snapshot entry at one of the matrix positions."""
+        if roster_id not in self.roster_ids:
+            return False
+        return bool(np.any(self.entries[self.roster_ids.index(roster_id)] == entry))
+
+    @property
+    def starters(self) -> FloatArray:
+        """Starting lineup value of every team per position, shape (teams, positions)."""
+        starters: FloatArray = np.sum(self.values * self.starting, axis=2)
+        return starters
+
+    @property
+    def needs(self) -> FloatArray:
+        """How far every team's starters trail the league median per position, shape (teams, positions)."""
+        starters = self.starters
+        needs: FloatArray = np.maximum(np.median(starters, axis=0) - starters, 0.0)
+        return needs
+
+    @property
+    def surplus(self) -> FloatArray:
+        """Value of every team's best bench asset per position, shape (teams, positions)."""
+        bench = np.where(self.starting, 0.0, self.values)
+        surplus: FloatArray = bench.max(axis=2, initial=0.0)
+        return surplus
+
+
+@dataclass
+class TradeTarget:
+    """
+    A package one team could offer for the shopped asset.
+
+    Attributes:
+        roster_id (int): The Sleeper roster ID of the offering team.
+        owner (str): Team or owner name of the offering team.
+        entries (List[int]): Snapshot entries of the package.
+        names (List[str]): Names of the assets in the package.
+        value_gap (int): Adjusted value of the package minus the value of the shopped asset.
+        gain (int): Change of the shopping team's starting lineup value after the trade.
+        interest (int): Change of the offering team's starting lineup value after the trade.
+    """
+
+    roster_id: int
+    owner: str
+    entries: List[int]
+    names: List[str]
+    value_gap: int
+    gain: int
+    interest: int
+
+
+def build_league_matrix(
+    league_id: str,
+    snapshot: ValueSnapshot,
+    rosters: Sequence[Roster],
+    owners: Mapping[int, str],
+    slots: Dict[str, int],
+) -> LeagueMatrix:
+    """Joins the rosters of a Sleeper league with a value snapshot.
+    Args:
+        league_id (str): The Sleeper league ID.
+        snapshot (ValueSnapshot): The snapshot to take values from.
+        rosters (Sequence[Roster]): The rosters of the league.
+        owners (Mapping[int, str]): Team names by roster ID. Rosters without one are named "Roster <id>".
+        slots (Dict[str, int]): Starters per position. Assets at other positions are left out.
+    Returns:
+        LeagueMatrix: The league's value matrix.
+    """
+    positions = list(slots)
+    columns = {position: column for column, position in enumerate(positions)}
+    grouped: List[List[List[int]]] = []
+    for roster in rosters:
+        by_position: List[List[int]] = [[] for _ in positions]
+        for entry in snapshot.entries_for_sleeper_ids(roster.players):
+            column = columns.get(snapshot.positions[entry])
+            if column is not None and snapshot.values[entry] > 0:
+                by_position[column].append(entry)
+        for group in by_position:
+            group.sort(key=lambda entry: -snapshot.values[entry])
+        grouped.append(by_position)
+    depth = max((len(group) for by_position in grouped for group in by_position), default=0)
+    depth = max(depth, *slots.values(), 1)
+    entries = np.full((len(rosters), len(positions), depth), -1, dtype=np.intp)
+    for team, by_position in enumerate(grouped):
+        for column, group in enumerate(by_position):
+            entries[team, column, : len(group)] = group
+    values = np.where(entries >= 0, np.asarray(snapshot.values, dtype=np.float64)[entries], 0.0)
+    return LeagueMatrix(
+        league_id=league_id,
+        snapshot=snapshot,
+        roster_ids=[roster.roster_id for roster in rosters],
+        owners=[owners.get(roster.roster_id) or f"Roster {roster.roster_id}" for roster in rosters],
+        positions=positions,
+        slots=np.asarray([slots[position] for position in positions], dtype=np.intp),
+        values=values,
+        entries=entries,
+    )
+
+
+class TradeFinder:
+    """Scans a whole league for the teams that could offer a fair package for an asset.
+
+    Args:
+        valuator (TradeValuator): The engine that values packages.
+        tolerance (float): Largest accepted value gap as a fraction of the shopped asset's value. Defaults to 0.1.
+        max_assets (int): Largest number of assets in one package. Defaults to 2.
+        bench_pool (int): Number of most valuable bench assets per team combined into packages. Defaults to 8.
+        ttl (float): Seconds a league matrix stays cached. Defaults to 15 minutes.
+        max_entries (int): Maximum number of league matrices kept in memory. Defaults to 64.
+        clock (Callable[[], float]): Time source, injectable for tests. Defaults to time.time.
+    """
+
+    def __init__(
+        self,
+        valuator: TradeValuator,
+        tolerance: float = DEFAULT_TOLERANCE,
+        max_assets: int = 2,
+        bench_pool: int = DEFAULT_BENCH_POOL,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.valuator = valuator
+        self.tolerance = tolerance
+        self.max_assets = max_assets
+        self.bench_pool = bench_pool
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._matrices: "OrderedDict[str, LeagueMatrix]" = OrderedDict()
+
+    def cached(self, league_id: str) -> LeagueMatrix | None:
+        """Return the cached matrix of a league if it is younger than the TTL and mark it as recently used."""
+        matrix = self._matrices.get(league_id)
+        if matrix is None or self._clock() - matrix.built_at >= self.ttl:
+            return None
+        self._matrices.move_to_end(league_id)
+        return matrix
+
+    def store(self, matrix: LeagueMatrix) -> None:
+        """Cache a league matrix, replacing an earlier one of the same league and evicting the least recently used
+        leagues above max_entries.
+        """
+        matrix.built_at = self._clock()
+        self._matrices[matrix.league_id] = matrix
+        self._matrices.move_to_end(matrix.league_id)
+        while len(self._matrices) > self.max_entries:
+            self._matrices.popitem(last=False)
+
+    def evict_replaced(self, snapshot: ValueSnapshot) -> None:
+        """Drop the matrices built from earlier snapshots with the same settings, so those snapshots can be freed.
+        Intended as a snapshot cache listener, called when a new snapshot lands.
+        """
+        replaced = [
+            league_id
+            for league_id, matrix in self._matrices.items()
+            if matrix.snapshot.key == snapshot.key and matrix.snapshot is not snapshot
+        ]
+        for league_id in replaced:
+            del self._matrices[league_id]
+        if replaced:
+            logger.debug(f"Dropped {len(replaced)} league matrices of replaced snapshots for {snapshot.key}")
+
+    def shop(self, matrix: LeagueMatrix, roster_id: int, entry: int, limit: int = 5) -> List[TradeTarget]:
+        """Find the fairest package every other team could offer for an asset.
+        Args:
+            matrix (LeagueMatrix): The league to scan.
+            roster_id (int): The Sleeper roster ID of the shopping team.
+            entry (int): Snapshot entry of the shopped asset.
+            limit (int): Maximum number of teams returned. Defaults to 5.
+        Returns:
+            List[TradeTarget]: At most one package per team, the largest lineup gain for the shopping team first.
+        Raises:
+            ValueError: If the roster is not part of the league or does not hold the shopped asset.
+        """
+        if roster_id not in matrix.roster_ids:
+            raise ValueError(f"League {matrix.league_id} has no roster {roster_id}")
+        if not matrix.holds(roster_id, entry):
+            raise ValueError(f"Roster {roster_id} does not hold {matrix.snapshot.names[entry]}")
+        me = matrix.roster_ids.index(roster_id)
+        snapshot = matrix.snapshot
+        value = float(snapshot.values[entry])
+        members, teams = self._packages(matrix, me)
+        if not len(members):
+            return []
+
+        values = np.asarray(snapshot.values, dtype=np.float64)
+        gaps = self.valuator.side_values(np.where(members >= 0, values[members], 0.0)) - value
+        fair = np.flatnonzero(np.abs(gaps) <= self.tolerance * value)
+        members, teams, gaps = members[fair], teams[fair], gaps[fair]
+
+        starting = matrix.starting
+        # The shopping team's lineup without the shopped asset, kept sorted so starters stay in front.
+        kept = -np.sort(-np.where(matrix.entries[me] == entry, 0.0, matrix.values[me]), axis=1)
+        column = {position: column for column, position in enumerate(matrix.positions)}
+        given = np.zeros((len(members), len(matrix.positions), self.max_assets), dtype=np.float64)
+        for row, package in enumerate(members):
+            for slot, member in enumerate(package[package >= 0]):
+                given[row, column[snapshot.positions[member]], slot] = values[member]
+        gains = lineup_values(kept[None], given, starting) - matrix.starters[me].sum()
+        interest = self._interest(matrix, entry)
+        improving = np.flatnonzero(gains > 0)
+        members, teams, gaps, gains = members[improving], teams[improving], gaps[improving], gains[improving]
+
+        # Best package per team: largest gain, then smallest gap.
+        order = np.lexsort((np.abs(gaps), -gains, teams))
+        _, first = np.unique(teams[order], return_index=True)
+        best = order[first]
+        best = best[np.argsort(-gains[best], kind="stable")][:limit]
+        targets = []
+        for row in best:
+            team = int(teams[row])
+            package = [int(member) for member in members[row] if member >= 0]
+            targets.append(
+                TradeTarget(
+                    roster_id=matrix.roster_ids[team],
+                    owner=matrix.owners[team],
+                    entries=package,
+                    names=[snapshot.names[member] for member in package],
+                    value_gap=round(float(gaps[row])),
+                    gain=round(float(gains[row])),
+                    interest=round(float(interest[team])),
+                )
+            )
+        return targets
+
+    def _packages(self, matrix: LeagueMatrix, me: int) -> Tuple[IntArray, IntArray]:
+        """Packages of bench assets the other teams hold at the positions the shopping team needs.
+        Returns the snapshot entries of every package, padded with -1 to (packages, max_assets), and its team.
+        """
+        needs = matrix.needs[me] > 0
+        if not needs.any():
+            needs[:] = matrix.slots > 0
+        bench = np.where(~matrix.starting[None] & needs[None, :, None], matrix.entries, -1)
+        members: List[IntArray] = []
+        teams: List[IntArray] = []
+        for team in range(len(matrix.roster_ids)):
+            if team == me:
+                continue
+            candidates = bench[team][bench[team] >= 0]
+            candidates = candidates[np.argsort(-matrix.values[team][bench[team] >= 0], kind="stable")]
+            candidates = candidates[: self.bench_pool]
+            for size in range(1, self.max_assets + 1):
+                combos = np.asarray(list(combinations(candidates, size)), dtype=np.intp).reshape(-1, size)
+                members.append(np.pad(combos, ((0, 0), (0, self.max_assets - size)), constant_values=-1))
+                teams.append(np.full(len(combos), team, dtype=np.intp))
+        if not members:
+            return np.empty((0, self.max_assets), dtype=np.intp), np.empty(0, dtype=np.intp)
+        return np.concatenate(members), np.concatenate(teams)
+
+    @staticmethod
+    def _interest(matrix: LeagueMatrix, entry: int) -> FloatArray:
+        """Lineup gain of every team from adding the shopped asset, shape (teams,)."""
+        position = matrix.snapshot.positions[entry]
+        if position not in matrix.positions:
+            return np.zeros(len(matrix.roster_ids), dtype=np.float64)
+        column = matrix.positions.index(position)
+        slots = int(matrix.slots[column])
+        current = matrix.values[:, column, :]
+        added = np.full((len(current), 1), float(matrix.snapshot.values[entry]))
+        best = -np.sort(-np.concatenate([current, added], axis=1), axis=1)[:, :slots]
+        interest: FloatArray = best.sum(axis=1) - current[:, :slots].sum(axis=1)
+        return interest
+
+
+trade_finder = TradeFinder(TradeValuator())
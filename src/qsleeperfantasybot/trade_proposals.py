@@ -0,0 +1,277 @@
+"""Trade proposal generator over two Sleeper rosters.
+Two rosters of a league, joined with FantasyCalc values as snapshot entries, are searched for trades of up to three
+assets per side that are fair within a tolerance and raise the starting lineup value of both teams, i.e. that fill a
+positional need on each side.
+The search is a meet-in-the-middle: all give-subsets of each roster are enumerated and valued once (vectorized), the
+subsets of one roster are sorted by adjusted value, and each subset of the other roster is paired only with the
+window of subsets whose value is within the tolerance, found by bisection. Pairs are pruned with an upper bound on
+the lineup gain of both teams (branch and bound), and the search stops at a latency budget with the best proposals
+found so far. It is CPU bound, so callers run it in a worker thread.
+Classes:
+    TradeProposal: One proposed trade with its value gap and lineup gains.
+    Lineup: Starting lineup value of one roster, with the change caused by a trade.
+    ProposalGenerator: Searches two rosters for fair trades that help both teams.
+Functions:
+    starter_slots(superflex): Returns the starting slots per position.
+    lineup_values(kept, added, starting): Vectorized lineup values of rosters after a trade.
+Globals:
+    proposal_generator: Generator with the default valuation, tolerance and latency budget.
+"""
+
+import heapq
+import time
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.snapshot_cache import ValueSnapshot
+from qsleeperfantasybot.trade_valuation import FloatArray, TradeValuator
+
+STARTER_SLOTS = {"QB": 1, "RB": 2, "WR": 3, "TE": 1}
+DEFAULT_TOLERANCE = 0.05
+DEFAULT_BUDGET_SECONDS = 1.0
+
+IntArray = npt.NDArray[np.intp]
+
+
+def starter_slots(superflex: bool) -> Dict[str, int]:
+    """Returns the number of starters per position; superflex leagues start a second QB."""
+    return {**STARTER_SLOTS, "QB": 2} if superflex else dict(STARTER_SLOTS)
+
+
+@dataclass
+class TradeProposal:
+    """
+    A proposed trade between roster A and roster B.
+
+    Attributes:
+        give (List[int]): Snapshot entries roster A gives.
+        give_names (List[str]): Names of the assets roster A gives.
+        receive (List[int]): Snapshot entries roster A receives from roster B.
+        receive_names (List[str]): Names of the assets roster A receives.
+        value_gap (int): Adjusted value roster A gives minus the value it receives.
+        gain_a (int): Change of roster A's starting lineup value.
+        gain_b (int): Change of roster B's starting lineup value.
+    """
+
+    give: List[int]
+    give_names: List[str]
+    receive: List[int]
+    receive_names: List[str]
+    value_gap: int
+    gain_a: int
+    gain_b: int
+
+
+class Lineup:
+    """Starting lineup value of one roster.
+
+    Args:
+        snapshot (ValueSnapshot): The snapshot the roster entries refer to.
+        entries (Iterable[int]): The roster's snapshot entries.
+        slots (Dict[str, int]): Starters per position. Positions without slots, such as picks, never start.
+    """
+
+    def __init__(self, snapshot: ValueSnapshot, entries: Iterable[int], slots: Dict[str, int]) -> None:
+        self.snapshot = snapshot
+        self.slots = slots
+        self.by_position: Dict[str, List[int]] = {}
+        for entry in entries:
+            self.by_position.setdefault(snapshot.positions[entry], []).append(snapshot.values[entry])
+        for values in self.by_position.values():
+            values.sort(reverse=True)
+
+    def _starters(self, position: str, values: Iterable[int]) -> int:
+        return sum(heapq.nlargest(self.slots.get(position, 0), values))
+
+    def value(self) -> int:
+        """The summed value of the best starters at every position."""
+        return sum(self._starters(position, values) for position, values in self.by_position.items())
+
+    def change(self, remove: Sequence[int], add: Sequence[int]) -> int:
+        """Change of the lineup value after removing and adding the given snapshot entries."""
+        positions = self.snapshot.positions
+        values = self.snapshot.values
+        delta = 0
+        for position in {positions[entry] for entry in (*remove, *add)}:
+            if not self.slots.get(position):
+                continue
+            current = list(self.by_position.get(position, []))
+            before = self._starters(position, current)
+            for entry in remove:
+                if positions[entry] == position:
+                    current.remove(values[entry])
+            current.extend(values[entry] for entry in add if positions[entry] == position)
+            delta += self._starters(position, current) - before
+        return delta
+
+
+@dataclass
+class _Subsets:
+    """The give-subsets of one roster.
+
+    members holds the snapshot entries of every subset padded with -1, adjusted and raw their trade value, kept the
+    best remaining values per position after giving the subset away (subsets, positions, depth), given the values
+    of the subset per position (subsets, positions, max_assets) and base the lineup value of the full roster.
+    """
+
+    members: IntArray
+    adjusted: npt.NDArray[np.float64]
+    raw: npt.NDArray[np.float64]
+    kept: npt.NDArray[np.float64]
+    given: npt.NDArray[np.float64]
+    base: int
+
+
+class ProposalGenerator:
+    """Searches two rosters for fair trades that improve both starting lineups.
+
+    Args:
+        valuator (TradeValuator): The engine that values trade sides.
+        max_assets (int): Largest number of assets one side gives. Defaults to 3.
+        tolerance (float): Largest accepted value gap as a fraction of the side roster A gives. Defaults to 0.05.
+        budget (float): Seconds the search may take before it returns the best proposals found. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        valuator: TradeValuator,
+        max_assets: int = 3,
+        tolerance: float = DEFAULT_TOLERANCE,
+        budget: float = DEFAULT_BUDGET_SECONDS,
+    ) -> None:
+        self.valuator = valuator
+        self.max_assets = max_assets
+        self.tolerance = tolerance
+        self.budget = budget
+
+    def _subsets(self, snapshot: ValueSnapshot, roster: Sequence[int], lineup: Lineup, max_assets: int) -> _Subsets:
+        """Enumerate the give-subsets of a roster and precompute everything the pair search needs."""
+        valued = [entry for entry in roster if snapshot.values[entry] > 0]
+        combos = [combo for size in range(1, max_assets + 1) for combo in combinations(valued, size)]
+        members = np.full((len(combos), max_assets), -1, dtype=np.intp)
+        positions = list(lineup.slots)
+        depth = max(lineup.slots.values(), default=0)
+        kept = np.zeros((len(combos), len(positions), depth), dtype=np.float64)
+        given = np.zeros((len(combos), len(positions), max_assets), dtype=np.float64)
+        for row, combo in enumerate(combos):
+            members[row, : len(combo)] = combo
+            for column, position in enumerate(positions):
+                remaining = list(lineup.by_position.get(position, []))
+                traded = sorted((snapshot.values[e] for e in combo if snapshot.positions[e] == position), reverse=True)
+                for value in traded:
+                    remaining.remove(value)
+                kept[row, column, : min(depth, len(remaining))] = remaining[:depth]
+                given[row, column, : len(traded)] = traded
+        values = np.asarray(snapshot.values, dtype=np.float64)
+        matrix = np.where(members >= 0, values[members], 0.0)
+        return _Subsets(members, self.valuator.side_values(matrix), matrix.sum(axis=1), kept, given, lineup.value())
+
+    def propose(
+        self,
+        snapshot: ValueSnapshot,
+        roster_a: Sequence[int],
+        roster_b: Sequence[int],
+        slots: Dict[str, int] | None = None,
+        limit: int = 5,
+        max_assets: int | None = None,
+    ) -> List[TradeProposal]:
+        """Find fair trades between two rosters that raise both starting lineups.
+        Args:
+            snapshot (ValueSnapshot): The snapshot the roster entries refer to.
+            roster_a (Sequence[int]): Snapshot entries of roster A.
+            roster_b (Sequence[int]): Snapshot entries of roster B.
+            slots (Dict[str, int], optional): Starters per position. Defaults to a 1QB lineup.
+            limit (int): Maximum number of proposals. Defaults to 5.
+            max_assets (int, optional): Largest number of assets one side gives. Defaults to the generator's.
+        Returns:
+            List[TradeProposal]: Proposals with the largest smaller lineup gain first, then the smallest value gap.
+        """
+        deadline = time.perf_counter() + self.budget
+        slots = slots or starter_slots(False)
+        lineup_a, lineup_b = Lineup(snapshot, roster_a, slots), Lineup(snapshot, roster_b, slots)
+        max_assets = max_assets or self.max_assets
+        side_a = self._subsets(snapshot, roster_a, lineup_a, max_assets)
+        side_b = self._subsets(snapshot, roster_b, lineup_b, max_assets)
+        if not len(side_a.members) or not len(side_b.members):
+            return []
+        depth = side_a.kept.shape[2]
+        # starting[p, i] is True if the i-th best player at position p starts.
+        starting = np.arange(depth) < np.asarray([slots[position] for position in slots])[:, None]
+        loss_a = side_a.base - np.sum(side_a.kept * starting, axis=(1, 2))
+        loss_b = side_b.base - np.sum(side_b.kept * starting, axis=(1, 2))
+        order = np.argsort(side_b.adjusted, kind="stable")
+        sorted_b = side_b.adjusted[order]
+
+        # Min-heap of (score, -gap, a, b) holding the best `limit` pairs; its root is the bar to beat.
+        best: List[Tuple[float, float, int, int]] = []
+        searched = 0
+        for a in np.argsort(-side_a.adjusted, kind="stable"):
+            if time.perf_counter() > deadline:
+                logger.info(f"Trade proposal search hit its {self.budget}s budget after {searched} subsets")
+                break
+            searched += 1
+            value = side_a.adjusted[a]
+            low, high = np.searchsorted(sorted_b, [value * (1 - self.tolerance), value * (1 + self.tolerance)])
+            candidates = order[low:high]
+            # Receiving assets can raise a lineup by at most their raw value.
+            bounds = np.minimum(side_b.raw[candidates] - loss_a[a], side_a.raw[a] - loss_b[candidates])
+            bar = best[0][0] if len(best) == limit else 0
+            candidates = candidates[bounds > bar]
+            if not len(candidates):
+                continue
+            gain_a = lineup_values(side_a.kept[a][None], side_b.given[candidates], starting) - side_a.base
+            gain_b = lineup_values(side_b.kept[candidates], side_a.given[a][None], starting) - side_b.base
+            scores = np.minimum(gain_a, gain_b)
+            gaps = -np.abs(value - side_b.adjusted[candidates])
+            for index in np.flatnonzero(scores > bar):
+                item = (float(scores[index]), float(gaps[index]), int(a), int(candidates[index]))
+                if len(best) < limit:
+                    heapq.heappush(best, item)
+                elif item > best[0]:
+                    heapq.heapreplace(best, item)
+
+        proposals = []
+        for _, _, a, b in sorted(best, reverse=True):
+            give = [int(e) for e in side_a.members[a] if e >= 0]
+            receive = [int(e) for e in side_b.members[b] if e >= 0]
+            proposals.append(
+                TradeProposal(
+                    give=give,
+                    give_names=[snapshot.names[e] for e in give],
+                    receive=receive,
+                    receive_names=[snapshot.names[e] for e in receive],
+                    value_gap=round(float(side_a.adjusted[a] - side_b.adjusted[b])),
+                    gain_a=lineup_a.change(give, receive),
+                    gain_b=lineup_b.change(receive, give),
+                )
+            )
+        return proposals
+
+
+def lineup_values(
+    kept: npt.NDArray[np.float64], added: npt.NDArray[np.float64], starting: npt.NDArray[np.bool_]
+) -> npt.NDArray[np.float64]:
+    """Vectorized lineup values of rosters that keep some players and add others.
+    Args:
+        kept (NDArray[float64]): Values each roster keeps, shape (rosters or 1, positions, players), 0 padded.
+        added (NDArray[float64]): Values each roster adds, shape (rosters or 1, positions, players), 0 padded.
+        starting (NDArray[bool_]): starting[p, i] is True if the i-th best player at position p starts.
+    Returns:
+        NDArray[float64]: The summed value of the starters of every roster, shape (rosters,).
+    """
+    rosters = max(len(kept), len(added))
+    pool = np.concatenate(
+        [np.broadcast_to(kept, (rosters, *kept.shape[1:])), np.broadcast_to(added, (rosters, *added.shape[1:]))],
+        axis=2,
+    )
+    best = -np.sort(-pool, axis=2)[:, :, : starting.shape[1]]
+    values: FloatArray = np.sum(best * starting, axis=(1, 2))
+    return values
+
+
+proposal_generator = ProposalGenerator(TradeValuator())
@@ -0,0 +1,102 @@
+"""Vectorized trade valuation with a consolidation adjustment.
+Summing asset values overrates quantity-for-quality trades: two 4000 value players are rarely worth one 8000 value
+star, and every extra asset costs the receiving team a roster spot. A side is therefore valued as the p-norm of its
+asset values, (sum v^p)^(1/p), minus a fixed cost for every asset beyond the first. With p = 1 and no roster spot cost
+this is the plain sum; a larger p moves the side value towards its best asset.
+Trades are scored on padded NumPy matrices, one row per candidate trade and one column per asset slot (padding is 0),
+so thousands of candidates are valued in one call, which lets trade-search features reuse the same engine.
+Classes:
+    ValuationSettings: Consolidation exponent and roster spot cost.
+    TradeValuator: Values trade sides and scores candidate trades.
+Functions:
+    pad_sides(sides): Packs ragged lists of asset values into a zero-padded matrix.
+Environment Variables:
+    - TRADE_CONSOLIDATION_EXPONENT: The p of the p-norm. Defaults to 1.5.
+    - TRADE_ROSTER_SPOT_COST: Value subtracted for every asset beyond the first on a side. Defaults to 250.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Self, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class ValuationSettings:
+    """Consolidation exponent and roster spot cost used to value a trade side."""
+
+    consolidation_exponent: float = 1.5
+    roster_spot_cost: float = 250.0
+
+    def __post_init__(self) -> None:
+        if self.consolidation_exponent < 1:
+            raise ValueError(f"consolidation_exponent must be at least 1, got {self.consolidation_exponent}")
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Create settings from environment variables, falling back to the defaults."""
+        return cls(
+            consolidation_exponent=float(os.getenv("TRADE_CONSOLIDATION_EXPONENT", cls.consolidation_exponent)),
+            roster_spot_cost=float(os.getenv("TRADE_ROSTER_SPOT_COST", cls.roster_spot_cost)),
+        )
+
+
+def pad_sides(sides: Sequence[Sequence[float]], width: int | None = None) -> FloatArray:
+    """Packs ragged lists of asset values into a zero-padded matrix.
+    Args:
+        sides (Sequence[Sequence[float]]): Asset values of each side.
+        width (int, optional): Number of columns. Defaults to the size of the largest side.
+    Returns:
+        FloatArray: Matrix of shape (len(sides), width).
+    """
+    width = max((len(side) for side in sides), default=0) if width is None else width
+    matrix = np.zeros((len(sides), width), dtype=np.float64)
+    for row, side in enumerate(sides):
+        matrix[row, : len(side)] = side
+    return matrix
+
+
+class TradeValuator:
+    """Values trade sides with the consolidation adjustment.
+
+    Args:
+        settings (ValuationSettings, optional): Valuation settings. Defaults to ValuationSettings.from_env().
+    """
+
+    def __init__(self, settings: ValuationSettings | None = None) -> None:
+        self.settings = settings or ValuationSettings.from_env()
+
+    def side_values(self, sides: npt.ArrayLike) -> FloatArray:
+        """Value many sides at once.
+        Args:
+            sides (ArrayLike): Asset values of shape (sides, slots). Empty slots are 0; negative values count as 0.
+        Returns:
+            FloatArray: The adjusted value of every side, shape (sides,).
+        """
+        values = np.clip(np.atleast_2d(np.asarray(sides, dtype=np.float64)), 0, None)
+        exponent = self.settings.consolidation_exponent
+        counts = np.count_nonzero(values, axis=1)
+        # Scale by the best asset before raising to the power so large exponents cannot overflow.
+        best = values.max(axis=1, initial=0.0)
+        scale = np.where(best > 0, best, 1.0)
+        norms: FloatArray = scale * np.sum((values / scale[:, None]) ** exponent, axis=1) ** (1 / exponent)
+        costs: FloatArray = self.settings.roster_spot_cost * np.maximum(counts - 1, 0)
+        return norms - costs
+
+    def side_value(self, values: Sequence[float]) -> float:
+        """Value a single side from its asset values."""
+        return float(self.side_values(pad_sides([values], width=max(len(values), 1)))[0])
+
+    def score_trades(self, side_a: npt.ArrayLike, side_b: npt.ArrayLike) -> FloatArray:
+        """Score candidate trades as the adjusted value of side A minus that of side B.
+        Args:
+            side_a (ArrayLike): Asset values of side A, shape (trades, slots).
+            side_b (ArrayLike): Asset values of side B, shape (trades, slots), row-aligned with side_a.
+        Returns:
+            FloatArray: One score per trade; positive means side A holds more adjusted value.
+        """
+        return self.side_values(side_a) - self.side_values(side_b)
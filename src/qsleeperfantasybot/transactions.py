@@ -0,0 +1,166 @@
+"""Incremental crawl of a league's transaction history with local persistence.
+Sleeper serves transactions one week at a time. The crawler fetches every week of a season concurrently, paced by the
+shared Sleeper rate limiter, and stores the transactions in one compact JSON file per league keyed by transaction ID,
+together with the weeks that are closed. A week is closed once the league has moved past it or the league is complete.
+Later crawls only fetch the weeks that are still open or new, and a finished season loads from disk without any
+request. Weeks that could not be fetched stay open and are retried on the next crawl.
+Classes:
+    TransactionHistory: The transactions of a league and the weeks that are closed.
+    TransactionStore: Reads and atomically writes transaction histories in a directory.
+    TransactionCrawler: Fetches the open weeks of a league and merges them into its stored history.
+Globals:
+    transaction_crawler: Crawler on the shared Sleeper client and the default store.
+"""
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.sleeper.api.client import SleeperClient, sleeper_client
+from qsleeperfantasybot.sleeper.model.transaction import Transaction
+
+FORMAT_VERSION = 1
+MAX_WEEKS = 18
+
+
+@dataclass
+class TransactionHistory:
+    """
+    The transactions of one league.
+
+    Attributes:
+        league_id (str): The Sleeper league ID.
+        transactions (Dict[str, Dict[str, Any]]): Raw transactions as returned by the API, by transaction ID.
+        closed_weeks (Set[int]): Weeks whose transactions can no longer change.
+    """
+
+    league_id: str
+    transactions: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    closed_weeks: Set[int] = field(default_factory=set)
+
+    def parsed(self) -> List[Transaction]:
+        """Return every transaction as a model, oldest first."""
+        parsed = [Transaction.from_dict(data) for data in self.transactions.values()]
+        return sorted(parsed, key=lambda transaction: (transaction.created, transaction.transaction_id))
+
+    def of_type(self, kind: str) -> List[Transaction]:
+        """Return the completed transactions of one type, e.g. "trade" or "waiver", oldest first."""
+        return [t for t in self.parsed() if t.type == kind and t.status == "complete"]
+
+
+class TransactionStore:
+    """Handles storing and loading transaction histories, one JSON file per league."""
+
+    def __init__(self, directory: Path = Path("sleeper_data/transactions")) -> None:
+        """Initialize the store with the given directory."""
+        self.directory = directory
+
+    def path_for(self, league_id: str) -> Path:
+        """Return the file path used for a league."""
+        return self.directory / f"{league_id}.json"
+
+    def save(self, history: TransactionHistory) -> None:
+        """Write a history atomically, so a crash mid-write never leaves a truncated file behind."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(history.league_id)
+        document = {
+            "version": FORMAT_VERSION,
+            "league_id": history.league_id,
+            "closed_weeks": sorted(history.closed_weeks),
+            "transactions": history.transactions,
+        }
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(document, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def load(self, league_id: str) -> TransactionHistory:
+        """Load the stored history of a league, or an empty history if there is no usable file."""
+        path = self.path_for(league_id)
+        if not path.is_file():
+            return TransactionHistory(league_id)
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                document = json.load(f)
+            if document.get("version") != FORMAT_VERSION:
+                logger.info(f"Ignoring transactions {path} with unsupported format version")
+                return TransactionHistory(league_id)
+            return TransactionHistory(
+                league_id=league_id,
+                transactions=dict(document["transactions"]),
+                closed_weeks={int(week) for week in document["closed_weeks"]},
+            )
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Transactions file {path} corrupted or unreadable: {e}")
+            return TransactionHistory(league_id)
+
+
+class TransactionCrawler:
+    """Keeps the stored transaction histories of leagues up to date.
+
+    Args:
+        client (SleeperClient): The client the weeks are fetched with.
+        store (TransactionStore): The store the histories are persisted in.
+    """
+
+    def __init__(self, client: SleeperClient, store: TransactionStore) -> None:
+        self.client = client
+        self.store = store
+
+    async def crawl(self, league_id: str) -> TransactionHistory:
+        """Fetch the open and new weeks of a league and merge them into its stored history.
+        Args:
+            league_id (str): The Sleeper league ID.
+        Returns:
+            TransactionHistory: The updated history. If the league or NFL state cannot be fetched, the stored
+            history is returned unchanged.
+        """
+        history = await asyncio.to_thread(self.store.load, league_id)
+        if history.closed_weeks.issuperset(range(1, MAX_WEEKS + 1)):
+            return history
+        league, state = await asyncio.gather(self.client.get_specific_league(league_id), self.client.get_nfl_state())
+        if not isinstance(league, dict) or not isinstance(state, dict):
+            logger.warning(f"Could not load league {league_id} or the NFL state, using stored transactions")
+            return history
+        finished = self.is_finished(league, state)
+        current = MAX_WEEKS if finished else self.current_week(state)
+        weeks = [week for week in range(1, current + 1) if week not in history.closed_weeks]
+        if not weeks:
+            return history
+
+        responses = await asyncio.gather(*(self.client.get_transactions(league_id, str(week)) for week in weeks))
+        fetched = 0
+        for week, transactions in zip(weeks, responses):
+            if not isinstance(transactions, list):
+                continue
+            fetched += 1
+            for transaction in transactions:
+                if isinstance(transaction, dict) and transaction.get("transaction_id"):
+                    history.transactions[str(transaction["transaction_id"])] = transaction
+            if finished or week < current:
+                history.closed_weeks.add(week)
+        await asyncio.to_thread(self.store.save, history)
+        logger.info(
+            f"Fetched {fetched} of {len(weeks)} open weeks of league {league_id}, "
+            f"{len(history.transactions)} transactions stored"
+        )
+        return history
+
+    @staticmethod
+    def is_finished(league: Dict[str, Any], state: Dict[str, Any]) -> bool:
+        """True if the league is complete or belongs to an earlier season than the current one."""
+        season = str(league.get("season") or "")
+        current_season = str(state.get("league_season") or state.get("season") or "")
+        return league.get("status") == "complete" or (bool(season) and season < current_season)
+
+    @staticmethod
+    def current_week(state: Dict[str, Any]) -> int:
+        """The current NFL leg, the last week of a running league that can hold transactions."""
+        return min(max(int(state.get("leg") or state.get("week") or 0), 1), MAX_WEEKS)
+
+
+transaction_crawler = TransactionCrawler(sleeper_client, TransactionStore())
@@ -0,0 +1,330 @@
+"""Historical FantasyCalc value time series for Value Riser Alerts.
+Each settings key has an append-only JSONL file with at most one line per day, holding the value of every asset
+in that day's snapshot. When queried, the file is loaded into a day x player NumPy matrix, so range queries are a
+bisect over the day axis and gainers/losers over any window are one vectorized difference, without touching
+the network. Code on the event loop loads histories with `load` and records snapshots with `record_in_background`,
+so the file I/O runs in worker threads.
+Classes:
+    Mover: One asset's value change over a window.
+    ValueHistory: Array-backed value history for one settings key.
+    ValueHistoryStore: Records daily snapshots to disk and serves loaded histories per settings key.
+"""
+
+import asyncio
+import json
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Set, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from qsleeperfantasybot.logger import logger
+from qsleeperfantasybot.snapshot_cache import SettingsKey, ValueSnapshot
+
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+@dataclass
+class Mover:
+    """
+    Value change of one asset over a window.
+
+    Attributes:
+        player_id (int): FantasyCalc asset ID.
+        name (str): Asset name.
+        start_value (int): Value at the start of the window.
+        end_value (int): Value at the end of the window.
+    """
+
+    player_id: int
+    name: str
+    start_value: int
+    end_value: int
+
+    @property
+    def change(self) -> int:
+        """Value gained (positive) or lost (negative) over the window."""
+        return self.end_value - self.start_value
+
+
+class ValueHistory:
+    """Day x player value matrix for one settings key.
+
+    Rows are days in ascending order and columns are FantasyCalc asset IDs in first-seen order. Missing values
+    (assets that were not listed on a day) are NaN. Rows and columns grow with amortized doubling.
+    """
+
+    def __init__(self, key: SettingsKey) -> None:
+        self.key = key
+        self.days: List[int] = []
+        self.player_ids: List[int] = []
+        self.names: Dict[int, str] = {}
+        self._columns: Dict[int, int] = {}
+        self._values: npt.NDArray[np.float32] = np.full((4, 64), np.nan, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    @property
+    def values(self) -> npt.NDArray[np.float32]:
+        """The filled part of the matrix, shape (days, players)."""
+        return self._values[: len(self.days), : len(self.player_ids)]
+
+    def _grow(self, rows: int, columns: int) -> None:
+        capacity_rows, capacity_columns = self._values.shape
+        if rows <= capacity_rows and columns <= capacity_columns:
+            return
+        grown = np.full((max(rows, capacity_rows * 2), max(columns, capacity_columns * 2)), np.nan, dtype=np.float32)
+        grown[:capacity_rows, :capacity_columns] = self._values
+        self._values = grown
+
+    def copy(self) -> "ValueHistory":
+        """Return an independent copy that can be appended to without affecting this history."""
+        history = ValueHistory(self.key)
+        history.days = list(self.days)
+        history.player_ids = list(self.player_ids)
+        history.names = dict(self.names)
+        history._columns = dict(self._columns)
+        history._values = self._values.copy()
+        return history
+
+    def append(self, day: date, values: Mapping[int, int], names: Mapping[int, str]) -> None:
+        """Append one day of values. Days must be appended in strictly increasing order.
+        Args:
+            day (date): The day the values were observed.
+            values (Mapping[int, int]): Asset value per FantasyCalc asset ID.
+            names (Mapping[int, str]): Asset name per FantasyCalc asset ID.
+        Raises:
+            ValueError: If the day is not later than the last appended day.
+        """
+        ordinal = day.toordinal()
+        if self.days and ordinal <= self.days[-1]:
+            raise ValueError(f"Value history for {self.key} already has {date.fromordinal(self.days[-1])}")
+        for player_id in values:
+            if player_id not in self._columns:
+                self._columns[player_id] = len(self.player_ids)
+                self.player_ids.append(player_id)
+        self._grow(len(self.days) + 1, len(self.player_ids))
+        row = len(self.days)
+        columns = np.fromiter((self._columns[player_id] for player_id in values), dtype=np.intp, count=len(values))
+        self._values[row, columns] = np.fromiter(values.values(), dtype=np.float32, count=len(values))
+        self.days.append(ordinal)
+        self.names.update(names)
+
+    def row_at(self, day: date) -> int | None:
+        """Return the row of the last recorded day on or before `day`, or None if there is none."""
+        position = bisect_right(self.days, day.toordinal())
+        return position - 1 if position else None
+
+    def series(self, player_id: int, start: date, end: date) -> List[Tuple[date, int]]:
+        """Return the recorded (day, value) points of one asset between two days, inclusive."""
+        column = self._columns.get(player_id)
+        if column is None:
+            return []
+        first = bisect_right(self.days, start.toordinal() - 1)
+        last = bisect_right(self.days, end.toordinal())
+        points = self.values[first:last, column]
+        return [
+            (date.fromordinal(day), int(value))
+            for day, value in zip(self.days[first:last], points)
+            if not np.isnan(value)
+        ]
+
+    def rows_between(self, start: date, end: date) -> Tuple[int, int] | None:
+        """Return the rows on or before `start` and `end`, or None if nothing is recorded on or before `end`.
+        If nothing is recorded on or before `start`, the earliest recorded row is used instead.
+        """
+        end_row = self.row_at(end)
+        if end_row is None:
+            return None
+        start_row = self.row_at(start)
+        return (0 if start_row is None else start_row), end_row
+
+    def window(self, days: int, end: date | None = None) -> Tuple[date, date] | None:
+        """Return the recorded days that `movers` compares for a window, or None if nothing is recorded.
+        The first day is later than the window start if the history is shorter than the window.
+        """
+        if not self.days:
+            return None
+        end = end or date.fromordinal(self.days[-1])
+        rows = self.rows_between(date.fromordinal(end.toordinal() - days), end)
+        if rows is None:
+            return None
+        return date.fromordinal(self.days[rows[0]]), date.fromordinal(self.days[rows[1]])
+
+    def changes(self, start: date, end: date) -> Tuple[npt.NDArray[np.float32], npt.NDArray[np.float32]]:
+        """Return the start and end value of every asset for the rows on or before `start` and `end`.
+        If the history starts after `start`, its earliest row is used. Assets without a value on either day are NaN.
+        """
+        columns = len(self.player_ids)
+        rows = self.rows_between(start, end)
+        if rows is None:
+            empty = np.full(columns, np.nan, dtype=np.float32)
+            return empty, empty.copy()
+        return self.values[rows[0]], self.values[rows[1]]
+
+    def movers(self, days: int, count: int, end: date | None = None) -> Tuple[List[Mover], List[Mover]]:
+        """Return the top gainers and losers over the last `days` days.
+        If the history is shorter than the window, the changes since the earliest recorded day are returned; see
+        `window` for the days that are actually compared.
+        Args:
+            days (int): Window length in days.
+            count (int): Number of gainers and of losers to return.
+            end (date, optional): Last day of the window. Defaults to the last recorded day.
+        Returns:
+            Tuple[List[Mover], List[Mover]]: Gainers sorted by largest gain, losers sorted by largest loss.
+        """
+        if not self.days:
+            return [], []
+        end = end or date.fromordinal(self.days[-1])
+        start_values, end_values = self.changes(date.fromordinal(end.toordinal() - days), end)
+        delta = end_values - start_values
+        valid = np.flatnonzero(~np.isnan(delta))
+        if not len(valid) or count <= 0:
+            return [], []
+        # Sort by change, then by column so ties are deterministic.
+        ordered = valid[np.lexsort((valid, delta[valid]))]
+
+        def to_mover(column: np.intp) -> Mover:
+            player_id = self.player_ids[column]
+            return Mover(
+                player_id,
+                self.names.get(player_id, str(player_id)),
+                int(start_values[column]),
+                int(end_values[column]),
+            )
+
+        gainers = [to_mover(column) for column in ordered[::-1][:count] if delta[column] > 0]
+        losers = [to_mover(column) for column in ordered[:count] if delta[column] < 0]
+        return gainers, losers
+
+
+class ValueHistoryStore:
+    """Append-only on-disk store of daily value snapshots, one JSONL file per settings key.
+    Reads and writes are locked, so the store may be used from worker threads. Loaded histories are never modified;
+    recording a day replaces the cached history with an extended copy. Malformed lines are logged and skipped.
+    """
+
+    def __init__(self, directory: Path = Path("sleeper_data/value_history")) -> None:
+        """Initialize the store with the given directory."""
+        self.directory = directory
+        self._histories: Dict[SettingsKey, ValueHistory] = {}
+        self._last_recorded: Dict[SettingsKey, int] = {}
+        self._lock = threading.RLock()
+        self._pending: Set["asyncio.Future[Any]"] = set()
+
+    def path_for(self, key: SettingsKey) -> Path:
+        """Return the file path used for a settings key."""
+        kind = "dynasty" if key.is_dynasty else "redraft"
+        return self.directory / f"{kind}_{key.num_qbs}qb_{key.num_teams}teams_{key.ppr:g}ppr.jsonl"
+
+    def _read_last_day(self, path: Path) -> int | None:
+        """Read the day of the last line without loading the whole file."""
+        with path.open("rb") as f:
+            size = f.seek(0, 2)
+            block = _TAIL_BLOCK_SIZE
+            while True:
+                f.seek(max(0, size - block))
+                lines = f.read().splitlines()
+                if len(lines) > 1 or block >= size:
+                    break
+                block *= 2
+        last = next((line for line in reversed(lines) if line.strip()), None)
+        return None if last is None else date.fromisoformat(json.loads(last)["date"]).toordinal()
+
+    def last_recorded_day(self, key: SettingsKey) -> int | None:
+        """Return the ordinal of the last recorded day for a key, or None if nothing was recorded yet."""
+        with self._lock:
+            if key not in self._last_recorded:
+                path = self.path_for(key)
+                last = self._read_last_day(path) if path.is_file() else None
+                if last is None:
+                    return None
+                self._last_recorded[key] = last
+            return self._last_recorded[key]
+
+    async def load(self, key: SettingsKey) -> ValueHistory:
+        """Return the loaded value history for a settings key, reading it from disk in a worker thread on first
+        access.
+        """
+        history = self._histories.get(key)
+        if history is not None:
+            return history
+        return await asyncio.to_thread(self.history, key)
+
+    def history(self, key: SettingsKey) -> ValueHistory:
+        """Return the loaded value history for a settings key, reading it from disk on first access."""
+        with self._lock:
+            history = self._histories.get(key)
+            if history is None:
+                history = ValueHistory(key)
+                path = self.path_for(key)
+                if path.is_file():
+                    with path.open("r", encoding="utf-8") as f:
+                        for number, line in enumerate(f, start=1):
+                            if not line.strip():
+                                continue
+                            try:
+                                row = json.loads(line)
+                                assets = row["assets"]
+                                history.append(
+                                    date.fromisoformat(row["date"]),
+                                    {int(asset[0]): int(asset[1]) for asset in assets},
+                                    {int(asset[0]): str(asset[2]) for asset in assets},
+                                )
+                            except (ValueError, KeyError, TypeError, IndexError) as e:
+                                logger.warning(f"Skipping line {number} of {path}: {e}")
+                self._histories[key] = history
+            return history
+
+    def record_in_background(self, snapshot: ValueSnapshot) -> None:
+        """Record a snapshot in a worker thread, unless its day is known to be recorded already.
+        Intended as a snapshot cache listener on the event loop; see record.
+        """
+        last = self._last_recorded.get(snapshot.key)
+        if last is not None and datetime.fromtimestamp(snapshot.fetched_at).date().toordinal() <= last:
+            return
+        task = asyncio.ensure_future(asyncio.to_thread(self.record, snapshot))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def flush(self) -> None:
+        """Wait until every snapshot recorded in the background is written."""
+        if self._pending:
+            await asyncio.gather(*self._pending)
+
+    def record(self, snapshot: ValueSnapshot) -> None:
+        """Append a snapshot as the value of its fetch day, unless that day is already recorded.
+        Disk errors are logged and never raised.
+        """
+        with self._lock:
+            day = datetime.fromtimestamp(snapshot.fetched_at).date()
+            try:
+                last = self.last_recorded_day(snapshot.key)
+                if last is not None and day.toordinal() <= last:
+                    return
+                entries = [entry for entry, value in enumerate(snapshot.values) if value]
+                assets = [[snapshot.ids[entry], snapshot.values[entry], snapshot.names[entry]] for entry in entries]
+                self.directory.mkdir(parents=True, exist_ok=True)
+                with self.path_for(snapshot.key).open("a", encoding="utf-8") as f:
+                    f.write(json.dumps({"date": day.isoformat(), "assets": assets}, separators=(",", ":")) + "\n")
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Could not record value history for {snapshot.key}: {e}")
+                return
+            self._last_recorded[snapshot.key] = day.toordinal()
+            history = self._histories.get(snapshot.key)
+            if history is not None:
+                # Histories handed out by `load` are read on the event loop without the lock, so extend a copy and
+                # swap it in instead of growing the shared one in place.
+                updated = history.copy()
+                updated.append(
+                    day,
+                    {snapshot.ids[entry]: snapshot.values[entry] for entry in entries},
+                    {snapshot.ids[entry]: snapshot.names[entry] for entry in entries},
+                )
+                self._histories[snapshot.key] = updated
+            logger.debug(f"Recorded {len(entries)} values for {snapshot.key} on {day}")
@@ -0,0 +1,58 @@
+"""Tests for the risers command."""
+
+from datetime import date
+from typing import Awaitable, Callable, cast
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from discord import Intents, Interaction, app_commands
+from discord.ext import commands
+
+from qsleeperfantasybot.commands import risers
+from qsleeperfantasybot.snapshot_cache import SettingsKey
+from qsleeperfantasybot.value_history import ValueHistory
+
+risers_type = Callable[[Interaction, int, int, float, bool, int], Awaitable[None]]
+
+
+@pytest.mark.asyncio
+async def test_risers_command_uses_local_history() -> None:
+    """Test the /risers command answers from the recorded history of the requested settings."""
+    bot = commands.Bot(command_prefix="!", intents=Intents.default())
+    risers.setup(bot)
+    interaction = AsyncMock(spec=Interaction)
+    interaction.response = AsyncMock()
+    key = SettingsKey.create(True, 2, 12, 1)
+    history = ValueHistory(key)
+    history.append(date(2026, 10, 1), {1: 1000}, {1: "Player 1"})
+    history.append(date(2026, 10, 8), {1: 1200}, {1: "Player 1"})
+    store = AsyncMock()
+    store.load.return_value = history
+
+    with patch.object(risers, "value_history", store):
+        cmd = bot.tree.get_command("risers")
+        assert isinstance(cmd, app_commands.Command)
+        await cast(risers_type, cmd.callback)(interaction, 7, 5, 1.0, True, 12)
+
+    store.load.assert_awaited_once_with(key)
+    message = interaction.response.send_message.call_args.args[0]
+    assert " - Player 1: +200 (1000 → 1200)" in message
+
+
+@pytest.mark.asyncio
+async def test_risers_command_without_history() -> None:
+    """Test the /risers command explains that nothing is recorded instead of reporting a 0 day window."""
+    bot = commands.Bot(command_prefix="!", intents=Intents.default())
+    risers.setup(bot)
+    interaction = AsyncMock(spec=Interaction)
+    interaction.response = AsyncMock()
+    store = AsyncMock()
+    store.load.return_value = ValueHistory(SettingsKey.create(True, 2, 12, 1))
+
+    with patch.object(risers, "value_history", store):
+        cmd = bot.tree.get_command("risers")
+        assert isinstance(cmd, app_commands.Command)
+        await cast(risers_type, cmd.callback)(interaction, 7, 5, 1.0, True, 12)
+
+    message = interaction.response.send_message.call_args.args[0]
+    assert message.startswith("📈 No value history is recorded for these settings yet.")
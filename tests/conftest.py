@@ -162,3 +162,24 @@ def player_no_name_dict() -> Dict[str, Any]:
         "maybeAdp": None,
         "maybeTradeFrequency": None,
     }
+
+
+@pytest.fixture
+def sleeper_league_dict() -> Dict[str, Any]:
+    return {
+        "total_rosters": 12,
+        "status": "in_season",
+        "sport": "nfl",
+        "settings": {"type": 2, "num_teams": 12, "best_ball": 0},
+        "season_type": "regular",
+        "season": "2026",
+        "scoring_settings": {"rec": 1.0},
+        "roster_positions": ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "SUPER_FLEX", "BN", "BN"],
+        "previous_league_id": "198946952535085056",
+        "name": "Sleeperbot Dynasty",
+        "league_id": "289646328504385536",
+        "draft_id": "289646328508579840",
+        "avatar": "efaefa889ae24046a53265a3c71b8b64",
+        "bracket_id": 1,
+        "loser_bracket_id": 2,
+    }
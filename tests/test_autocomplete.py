@@ -0,0 +1,18 @@
+"""Unit tests for the asset autocomplete callback in `qsleeperfantasybot.autocomplete`."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from qsleeperfantasybot import autocomplete
+from qsleeperfantasybot.name_index import AutocompleteIndex
+
+
+@pytest.mark.asyncio
+async def test_asset_autocomplete_completes_last_comma_separated_part() -> None:
+    """Earlier assets are kept as a prefix and only the last part is completed from the index."""
+    index = AutocompleteIndex(["Josh Allen", "Josh Jacobs", "Bijan Robinson"], [9800, 5200, 9900])
+    with patch.object(autocomplete, "get_asset_index", AsyncMock(return_value=index)):
+        choices = await autocomplete.asset_autocomplete(MagicMock(), "Bijan Robinson, jos")
+
+    assert [choice.value for choice in choices] == ["Bijan Robinson, Josh Allen", "Bijan Robinson, Josh Jacobs"]
@@ -0,0 +1,133 @@
+"""Unit tests for streaming batch trade scoring in `qsleeperfantasybot.batch_compare`."""
+
+import asyncio
+import io
+import json
+import time
+from typing import Any, Dict, Iterator, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from qsleeperfantasybot import batch_compare
+from qsleeperfantasybot import dynasty_compare as compare
+from qsleeperfantasybot.batch_compare import run_batch
+from qsleeperfantasybot.snapshot_cache import SettingsKey, SnapshotCache, ValueSnapshot
+from qsleeperfantasybot.trade_cache import TradeResultCache
+
+
+@pytest.mark.asyncio
+async def test_run_batch_streams_results_in_input_order(
+    player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]
+) -> None:
+    """Trades finish out of order but are written in input order, with one snapshot load per settings."""
+    loads: List[SettingsKey] = []
+
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        loads.append(key)
+        # The superflex snapshot of the first trade loads slower than the 1QB one of the later trades.
+        await asyncio.sleep(0.05 if key.num_qbs == 2 else 0)
+        return ValueSnapshot(key, [player_a_dict, player_b_dict], time.time())
+
+    lines = [
+        json.dumps({"id": "slow", "side_a": ["Player A"], "side_b": ["Player B"]}),
+        "",
+        json.dumps({"id": "fast", "side_a": "Player B", "side_b": "Player A, Nobody", "super_flex": False}),
+        "not json",
+        json.dumps({"side_a": ["Player B"], "side_b": ["Player A"], "super_flex": False}),
+    ]
+    out = io.StringIO()
+    with (
+        patch.object(compare, "snapshot_cache", SnapshotCache(loader)),
+        patch.object(compare, "trade_cache", TradeResultCache()),
+    ):
+        stats = await run_batch(lines, out, concurrency=2)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [record["line"] for record in records] == [1, 3, 4, 5]
+    assert records[0]["id"] == "slow" and records[0]["advantage"] == "B"
+    assert records[1]["side_b"] == [["Player A", 10152], ["Nobody", 0]]
+    assert records[1]["unresolved"] == ["Nobody"]
+    assert "error" in records[2]
+    assert records[3]["total_a"] == 12000 and records[3]["advantage"] == "A"
+    assert len(loads) == 2
+    assert (stats.trades, stats.errors) == (4, 1)
+
+
+@pytest.mark.asyncio
+async def test_run_batch_streams_before_the_input_ends(
+    player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]
+) -> None:
+    """A trade is valued and written while the producer is still waiting to send the next line."""
+    out = io.StringIO()
+    written_before_second_line: List[bool] = []
+
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        return ValueSnapshot(key, [player_a_dict, player_b_dict], time.time())
+
+    def slow_producer() -> Iterator[str]:
+        yield json.dumps({"side_a": ["Player A"], "side_b": ["Player B"]})
+        deadline = time.monotonic() + 2
+        while not out.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        written_before_second_line.append(bool(out.getvalue()))
+        yield json.dumps({"side_a": ["Player B"], "side_b": ["Player A"]})
+
+    with (
+        patch.object(compare, "snapshot_cache", SnapshotCache(loader)),
+        patch.object(compare, "trade_cache", TradeResultCache()),
+    ):
+        stats = await run_batch(slow_producer(), out)
+
+    assert written_before_second_line == [True]
+    assert stats.trades == 2 and len(out.getvalue().splitlines()) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_batch_reports_unexpected_errors_per_line() -> None:
+    """An unexpected exception while valuing one trade becomes that line's error and the batch goes on."""
+    evaluate = AsyncMock(side_effect=[RuntimeError("boom"), asyncio.TimeoutError()])
+    out = io.StringIO()
+    lines = [json.dumps({"side_a": ["Player A"], "side_b": ["Player B"]})] * 2
+
+    with patch.object(batch_compare, "evaluate_trade", evaluate):
+        stats = await run_batch(lines, out)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records[0]["error"] == "unexpected error: RuntimeError('boom')"
+    assert records[1]["line"] == 2 and records[1]["error"].startswith("unexpected error")
+    assert (stats.trades, stats.errors) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_run_batch_cancels_trades_in_flight_on_failure() -> None:
+    """If writing fails, the trades still in flight are cancelled instead of left pending."""
+    started = asyncio.Event()
+    cancelled: List[int] = []
+
+    async def evaluate(side_a: List[str], side_b: List[str], settings: SettingsKey) -> None:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+
+    evaluate_line = batch_compare.evaluate_line
+
+    async def fail_first(number: int, line: str) -> Dict[str, Any]:
+        if number == 1:
+            await started.wait()
+            raise OSError("broken pipe")
+        record: Dict[str, Any] = await evaluate_line(number, line)
+        return record
+
+    lines = ["{}", json.dumps({"side_a": ["Player A"], "side_b": ["Player B"]})]
+    with (
+        patch.object(batch_compare, "evaluate_trade", evaluate),
+        patch.object(batch_compare, "evaluate_line", fail_first),
+        pytest.raises(OSError),
+    ):
+        await run_batch(lines, io.StringIO())
+
+    assert cancelled == [1]
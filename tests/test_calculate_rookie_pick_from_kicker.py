@@ -1,7 +1,7 @@
 """Unit tests for the kicker_to_pick module."""
 
 from typing import Any, Dict, List
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from pathlib import Path
 
@@ -17,6 +17,7 @@ from qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker import
     write_log_file,
     run_kicker_scan,
 )
+from qsleeperfantasybot.sleeper.api.client import SleeperClient
 
 
 @pytest.fixture
@@ -91,48 +92,34 @@ def mock_drafts_list() -> List[Dict[str, Any]]:
 class TestFetchData:
     """Test suite for fetch_data function."""
 
-    @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.requests.get")
-    def test_fetch_data_success(self, mock_get: MagicMock, mock_player_data: Dict[str, Any]) -> None:
-        """Test successful data fetch."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_player_data
-        mock_get.return_value = mock_response
+    @pytest.mark.asyncio
+    @patch.object(SleeperClient, "get_json", new_callable=AsyncMock)
+    async def test_fetch_data_success(self, mock_get_json: AsyncMock, mock_player_data: Dict[str, Any]) -> None:
+        """Test that data is fetched through the rate limited Sleeper client."""
+        mock_get_json.return_value = mock_player_data
 
-        result = fetch_data("https://api.sleeper.app/v1/players/nfl")
+        result = await fetch_data("https://api.sleeper.app/v1/players/nfl")
 
         assert result == mock_player_data
-        mock_get.assert_called_once_with("https://api.sleeper.app/v1/players/nfl")
+        mock_get_json.assert_awaited_once_with("https://api.sleeper.app/v1/players/nfl")
 
-    @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.requests.get")
-    def test_fetch_data_http_error(self, mock_get: MagicMock) -> None:
-        """Test fetch_data with HTTP error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+    @pytest.mark.asyncio
+    @patch.object(SleeperClient, "get_json", new_callable=AsyncMock)
+    async def test_fetch_data_failed_request(self, mock_get_json: AsyncMock) -> None:
+        """Test fetch_data when the client reports a failed request."""
+        mock_get_json.return_value = None
 
-        result = fetch_data("https://api.sleeper.app/v1/invalid")
+        result = await fetch_data("https://api.sleeper.app/v1/invalid")
 
         assert result is None
 
-    @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.requests.get")
-    def test_fetch_data_network_exception(self, mock_get: MagicMock) -> None:
-        """Test fetch_data with network exception."""
-        mock_get.side_effect = Exception("Network error")
-
-        result = fetch_data("https://api.sleeper.app/v1/players/nfl")
-
-        assert result is None
-
-    @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.requests.get")
-    def test_fetch_data_list_response(self, mock_get: MagicMock) -> None:
+    @pytest.mark.asyncio
+    @patch.object(SleeperClient, "get_json", new_callable=AsyncMock)
+    async def test_fetch_data_list_response(self, mock_get_json: AsyncMock) -> None:
         """Test fetch_data with list response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [{"id": "1"}, {"id": "2"}]
-        mock_get.return_value = mock_response
+        mock_get_json.return_value = [{"id": "1"}, {"id": "2"}]
 
-        result = fetch_data("https://api.sleeper.app/v1/league/123/users")
+        result = await fetch_data("https://api.sleeper.app/v1/league/123/users")
 
         assert isinstance(result, list)
         assert len(result) == 2
@@ -141,40 +128,46 @@ class TestFetchData:
 class TestGetAutoAutoDraftId:
     """Test suite for get_auto_draft_id function."""
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_data")
-    def test_get_auto_draft_id_success(self, mock_fetch: MagicMock, mock_drafts_list: List[Dict[str, Any]]) -> None:
+    async def test_get_auto_draft_id_success(
+        self, mock_fetch: AsyncMock, mock_drafts_list: List[Dict[str, Any]]
+    ) -> None:
         """Test successful draft ID retrieval."""
         mock_fetch.return_value = mock_drafts_list
 
-        result = get_auto_draft_id("league123")
+        result = await get_auto_draft_id("league123")
 
         assert result == "draft123"
         mock_fetch.assert_called_once_with("https://api.sleeper.app/v1/league/league123/drafts")
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_data")
-    def test_get_auto_draft_id_empty_list(self, mock_fetch: MagicMock) -> None:
+    async def test_get_auto_draft_id_empty_list(self, mock_fetch: AsyncMock) -> None:
         """Test get_auto_draft_id with empty drafts list."""
         mock_fetch.return_value = []
 
-        result = get_auto_draft_id("league123")
+        result = await get_auto_draft_id("league123")
 
         assert result is None
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_data")
-    def test_get_auto_draft_id_not_list(self, mock_fetch: MagicMock) -> None:
+    async def test_get_auto_draft_id_not_list(self, mock_fetch: AsyncMock) -> None:
         """Test get_auto_draft_id when response is not a list."""
         mock_fetch.return_value = {"error": "not a list"}
 
-        result = get_auto_draft_id("league123")
+        result = await get_auto_draft_id("league123")
 
         assert result is None
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_data")
-    def test_get_auto_draft_id_non_string_draft_id(self, mock_fetch: MagicMock) -> None:
+    async def test_get_auto_draft_id_non_string_draft_id(self, mock_fetch: AsyncMock) -> None:
         """Test get_auto_draft_id when draft_id is not a string."""
         mock_fetch.return_value = [{"draft_id": 12345}]
 
-        result = get_auto_draft_id("league123")
+        result = await get_auto_draft_id("league123")
 
         assert result is None
 
@@ -182,31 +175,34 @@ class TestGetAutoAutoDraftId:
 class TestGetLeagueInfo:
     """Test suite for get_league_info function."""
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_data")
-    def test_get_league_info_success(self, mock_fetch: MagicMock, mock_league_info: Dict[str, Any]) -> None:
+    async def test_get_league_info_success(self, mock_fetch: AsyncMock, mock_league_info: Dict[str, Any]) -> None:
         """Test successful league info retrieval."""
         mock_fetch.return_value = mock_league_info
 
-        result = get_league_info("league123")
+        result = await get_league_info("league123")
 
         assert result == mock_league_info
         mock_fetch.assert_called_once_with("https://api.sleeper.app/v1/league/league123")
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_data")
-    def test_get_league_info_not_dict(self, mock_fetch: MagicMock) -> None:
+    async def test_get_league_info_not_dict(self, mock_fetch: AsyncMock) -> None:
         """Test get_league_info when response is not a dict."""
         mock_fetch.return_value = [{"league_id": "league123"}]
 
-        result = get_league_info("league123")
+        result = await get_league_info("league123")
 
         assert result is None
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_data")
-    def test_get_league_info_none(self, mock_fetch: MagicMock) -> None:
+    async def test_get_league_info_none(self, mock_fetch: AsyncMock) -> None:
         """Test get_league_info when fetch returns None."""
         mock_fetch.return_value = None
 
-        result = get_league_info("league123")
+        result = await get_league_info("league123")
 
         assert result is None
 
@@ -214,28 +210,31 @@ class TestGetLeagueInfo:
 class TestResolveDraftId:
     """Test suite for resolve_draft_id function."""
 
-    def test_resolve_draft_id_provided(self) -> None:
+    @pytest.mark.asyncio
+    async def test_resolve_draft_id_provided(self) -> None:
         """Test resolve_draft_id when draft_id is already provided."""
-        result = resolve_draft_id("league123", "draft456")
+        result = await resolve_draft_id("league123", "draft456")
 
         assert result == "draft456"
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_auto_draft_id")
-    def test_resolve_draft_id_fetch_latest(self, mock_auto_draft: MagicMock) -> None:
+    async def test_resolve_draft_id_fetch_latest(self, mock_auto_draft: AsyncMock) -> None:
         """Test resolve_draft_id fetches latest when not provided."""
         mock_auto_draft.return_value = "draft789"
 
-        result = resolve_draft_id("league123", None)
+        result = await resolve_draft_id("league123", None)
 
         assert result == "draft789"
         mock_auto_draft.assert_called_once_with("league123")
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_auto_draft_id")
-    def test_resolve_draft_id_not_found(self, mock_auto_draft: MagicMock) -> None:
+    async def test_resolve_draft_id_not_found(self, mock_auto_draft: AsyncMock) -> None:
         """Test resolve_draft_id when no draft found."""
         mock_auto_draft.return_value = None
 
-        result = resolve_draft_id("league123", None)
+        result = await resolve_draft_id("league123", None)
 
         assert result is None
 
@@ -243,38 +242,41 @@ class TestResolveDraftId:
 class TestFetchDraftData:
     """Test suite for fetch_draft_data function."""
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_data")
-    def test_fetch_draft_data_success(
-        self, mock_fetch: MagicMock, mock_users_data: List[Dict[str, Any]], mock_draft_picks: List[Dict[str, Any]]
+    async def test_fetch_draft_data_success(
+        self, mock_fetch: AsyncMock, mock_users_data: List[Dict[str, Any]], mock_draft_picks: List[Dict[str, Any]]
     ) -> None:
         """Test successful draft data fetch."""
         mock_fetch.side_effect = [mock_users_data, mock_draft_picks]
 
-        users, picks = fetch_draft_data("league123", "draft456")
+        users, picks = await fetch_draft_data("league123", "draft456")
 
         assert users == mock_users_data
         assert picks == mock_draft_picks
         assert mock_fetch.call_count == 2
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_data")
-    def test_fetch_draft_data_partial_failure(
-        self, mock_fetch: MagicMock,
+    async def test_fetch_draft_data_partial_failure(
+        self, mock_fetch: AsyncMock,
         mock_users_data: List[Dict[str, Any]]
         ) -> None:
         """Test draft data fetch with one request failing."""
         mock_fetch.side_effect = [mock_users_data, None]
 
-        users, picks = fetch_draft_data("league123", "draft456")
+        users, picks = await fetch_draft_data("league123", "draft456")
 
         assert users == mock_users_data
         assert picks is None
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_data")
-    def test_fetch_draft_data_both_none(self, mock_fetch: MagicMock) -> None:
+    async def test_fetch_draft_data_both_none(self, mock_fetch: AsyncMock) -> None:
         """Test draft data fetch when both requests fail."""
         mock_fetch.side_effect = [None, None]
 
-        users, picks = fetch_draft_data("league123", "draft456")
+        users, picks = await fetch_draft_data("league123", "draft456")
 
         assert users is None
         assert picks is None
@@ -423,16 +425,19 @@ class TestWriteLogFile:
 class TestRunKickerScan:
     """Test suite for run_kicker_scan function."""
 
+    @pytest.mark.asyncio
+    @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.write_log_file")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_draft_data")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_players")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.resolve_draft_id")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_league_info")
-    def test_run_kicker_scan_success(
+    async def test_run_kicker_scan_success(
         self,
-        mock_get_league_info: MagicMock,
-        mock_resolve_draft: MagicMock,
-        mock_get_players: MagicMock,
-        mock_fetch_draft: MagicMock,
+        mock_get_league_info: AsyncMock,
+        mock_resolve_draft: AsyncMock,
+        mock_get_players: AsyncMock,
+        mock_fetch_draft: AsyncMock,
+        mock_write_log: MagicMock,
         mock_player_data: Dict[str, Any],
         mock_users_data: List[Dict[str, Any]],
         mock_draft_picks: List[Dict[str, Any]],
@@ -444,51 +449,55 @@ class TestRunKickerScan:
         mock_get_players.return_value = mock_player_data
         mock_fetch_draft.return_value = (mock_users_data, mock_draft_picks)
 
-        result = run_kicker_scan("league123", None, "Default Name", 12, rounds=4)
+        result = await run_kicker_scan("league123", None, "Default Name", 12, rounds=4)
 
         assert result is not None
         assert "Test Dynasty League" in result
+        mock_write_log.assert_called_once_with("Test Dynasty League", result)
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_league_info")
-    def test_run_kicker_scan_invalid_league(self, mock_league_info: MagicMock) -> None:
+    async def test_run_kicker_scan_invalid_league(self, mock_league_info: AsyncMock) -> None:
         """Test kicker scan with invalid league."""
         mock_league_info.return_value = None
 
-        result = run_kicker_scan("invalid_league", None, "Default Name", 12, rounds=4)
+        result = await run_kicker_scan("invalid_league", None, "Default Name", 12, rounds=4)
 
         assert result is None
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_draft_data")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_players")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.resolve_draft_id")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_league_info")
-    def test_run_kicker_scan_missing_draft_id(
+    async def test_run_kicker_scan_missing_draft_id(
         self,
-        mock_get_league_info: MagicMock,
-        mock_resolve_draft: MagicMock,
-        mock_get_players: MagicMock,
-        mock_fetch_draft: MagicMock,
+        mock_get_league_info: AsyncMock,
+        mock_resolve_draft: AsyncMock,
+        mock_get_players: AsyncMock,
+        mock_fetch_draft: AsyncMock,
         mock_league_info: Dict[str, Any],
     ) -> None:
         """Test kicker scan when draft ID resolution fails."""
         mock_get_league_info.return_value = mock_league_info
         mock_resolve_draft.return_value = None
 
-        result = run_kicker_scan("league123", None, "Default Name", 12, rounds=4)
+        result = await run_kicker_scan("league123", None, "Default Name", 12, rounds=4)
 
         assert result is None
 
+    @pytest.mark.asyncio
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.write_log_file")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_draft_data")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_players")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.resolve_draft_id")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_league_info")
-    def test_run_kicker_scan_failed_data_fetch(
+    async def test_run_kicker_scan_failed_data_fetch(
         self,
-        mock_get_league_info: MagicMock,
-        mock_resolve_draft: MagicMock,
-        mock_get_players: MagicMock,
-        mock_fetch_draft: MagicMock,
+        mock_get_league_info: AsyncMock,
+        mock_resolve_draft: AsyncMock,
+        mock_get_players: AsyncMock,
+        mock_fetch_draft: AsyncMock,
         mock_write_log: MagicMock,
         mock_league_info: Dict[str, Any],
         mock_player_data: Dict[str, Any],
@@ -499,20 +508,23 @@ class TestRunKickerScan:
         mock_get_players.return_value = mock_player_data
         mock_fetch_draft.return_value = (None, None)
 
-        result = run_kicker_scan("league123", None, "Default Name", 12, rounds=4)
+        result = await run_kicker_scan("league123", None, "Default Name", 12, rounds=4)
 
         assert result is None
 
+    @pytest.mark.asyncio
+    @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.write_log_file")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.fetch_draft_data")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_players")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.resolve_draft_id")
     @patch("qsleeperfantasybot.kicker_to_pick.calculate_rookie_pick_from_kicker.get_league_info")
-    def test_run_kicker_scan_custom_name(
+    async def test_run_kicker_scan_custom_name(
         self,
-        mock_get_league_info: MagicMock,
-        mock_resolve_draft: MagicMock,
-        mock_get_players: MagicMock,
-        mock_fetch_draft: MagicMock,
+        mock_get_league_info: AsyncMock,
+        mock_resolve_draft: AsyncMock,
+        mock_get_players: AsyncMock,
+        mock_fetch_draft: AsyncMock,
+        mock_write_log: MagicMock,
         mock_player_data: Dict[str, Any],
         mock_users_data: List[Dict[str, Any]],
         mock_draft_picks: List[Dict[str, Any]],
@@ -524,7 +536,7 @@ class TestRunKickerScan:
         mock_get_players.return_value = mock_player_data
         mock_fetch_draft.return_value = (mock_users_data, mock_draft_picks)
 
-        result = run_kicker_scan("league123", None, "Custom League Name", 12, rounds=4)
+        result = await run_kicker_scan("league123", None, "Custom League Name", 12, rounds=4)
 
         assert result is not None
         assert "Custom League Name" in result
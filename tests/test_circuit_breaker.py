@@ -0,0 +1,97 @@
+"""Unit tests for the circuit breaker in `qsleeperfantasybot.circuit_breaker`.
+They verify that the circuit opens after repeated failures, fails fast while open and recovers through one trial call.
+"""
+
+import pytest
+
+from qsleeperfantasybot.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def state_of(breaker: CircuitBreaker) -> CircuitState:
+    """Read the state freshly, so mypy does not keep it narrowed from an earlier assert."""
+    return breaker.state
+
+
+def test_circuit_opens_after_threshold_and_fails_fast() -> None:
+    """Consecutive failures up to the threshold open the circuit and further calls are rejected."""
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30, clock=FakeClock())
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert state_of(breaker) is CircuitState.CLOSED
+    breaker.before_call()
+    breaker.record_failure()
+    assert state_of(breaker) is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert error.value.retry_in == 30
+
+
+def test_half_open_allows_one_trial_call() -> None:
+    """After the cooldown one trial call is allowed; success closes the circuit and failure reopens it."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+
+    clock.now += 30
+    assert state_of(breaker) is CircuitState.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert state_of(breaker) is CircuitState.OPEN
+
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_success()
+    assert state_of(breaker) is CircuitState.CLOSED
+    assert breaker.failures == 0
+
+
+def test_release_frees_the_trial_without_counting() -> None:
+    """A released trial call neither closes nor reopens the circuit, and the next call may try again."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30, clock=clock)
+    breaker.record_failure()
+
+    clock.now += 30
+    trial = breaker.before_call()
+    assert trial is not None
+    breaker.release(trial)
+    assert state_of(breaker) is CircuitState.HALF_OPEN
+    assert breaker.failures == 1
+    breaker.before_call()
+
+
+def test_release_only_frees_the_trial_it_holds() -> None:
+    """Releasing a call that does not hold the trial, or a trial that already ended, keeps the current trial."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30, clock=clock)
+
+    closed_call = breaker.before_call()
+    assert closed_call is None
+    breaker.record_failure()
+    breaker.record_failure()
+    clock.now += 30
+    stale_trial = breaker.before_call()
+    breaker.record_failure()
+    clock.now += 30
+    trial = breaker.before_call()
+
+    breaker.release(closed_call)
+    breaker.release(stale_trial)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.release(trial)
+    assert breaker.before_call() is not None
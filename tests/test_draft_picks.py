@@ -0,0 +1,65 @@
+"""Unit tests for draft pick parsing and the pick index in `qsleeperfantasybot.draft_picks`."""
+
+from typing import Optional
+
+import pytest
+
+from qsleeperfantasybot.draft_picks import PickIndex, PickKey, PickTier, parse_pick
+
+LISTED = {
+    "2026 Pick 1.01": 8000,
+    "2026 Pick 1.12": 4000,
+    "2027 Early 1st": 7000,
+    "2027 Mid 1st": 5500,
+    "2027 Late 1st": 4500,
+    "2028 1st": 5000,
+}
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("2026 1.05", PickKey(2026, 1, 5)),
+        ("2026 Pick 1.05", PickKey(2026, 1, 5)),
+        ("2026 #2.11", PickKey(2026, 2, 11)),
+        ("2027 Early 1st", PickKey(2027, 1, tier=PickTier.EARLY)),
+        ("2027 middle second", PickKey(2027, 2, tier=PickTier.MID)),
+        ("2028 Round 1", PickKey(2028, 1)),
+        ("2028 first round", PickKey(2028, 1)),
+        ("2028 R3", PickKey(2028, 3)),
+        ("2028 round two", PickKey(2028, 2)),
+        ("Tyreek Hill", None),
+        ("2026 Round 1 Chase", None),
+        ("2026 8th", None),
+        ("2026 1.00", None),
+    ],
+)
+def test_parse_pick(text: str, expected: Optional[PickKey]) -> None:
+    """Slot, tier and round spellings parse to the same keys; anything else is not a pick."""
+    assert parse_pick(text) == expected
+
+
+def test_pick_labels() -> None:
+    """Keys are displayed the way FantasyCalc names its picks."""
+    assert PickKey(2026, 1, 5).label == "2026 Pick 1.05"
+    assert PickKey(2027, 2, tier=PickTier.LATE).label == "2027 Late 2nd"
+    assert PickKey(2028, 3).label == "2028 3rd"
+
+
+def test_pick_index_interpolates_unlisted_picks() -> None:
+    """Listed picks keep their entry; unlisted slots, tiers and rounds are read from the interpolated curve."""
+    index = PickIndex(list(LISTED), list(LISTED.values()), ["PICK"] * len(LISTED), num_teams=12)
+
+    listed = index.lookup(PickKey(2026, 1, 1))
+    slot = index.lookup(PickKey(2026, 1, 5))
+    tier_slot = index.lookup(PickKey(2027, 1, 3))
+
+    assert listed is not None and (listed.entry, listed.value) == (0, 8000)
+    assert slot is not None and slot.entry is None and slot.value == round(8000 - 4 * 4000 / 11)
+    assert slot.template == 0
+    assert tier_slot is not None and 5500 < tier_slot.value < 7000
+    flat = index.lookup(PickKey(2028, 1, 7))
+    assert flat is not None and (flat.value, flat.template) == (5000, 5)
+    beyond = index.lookup(PickKey(2026, 1, 14))
+    assert beyond is not None and (beyond.entry, beyond.value) == (1, 4000)
+    assert index.lookup(PickKey(2029, 1)) is None
@@ -0,0 +1,115 @@
+"""Unit tests for the trade comparison pipeline in `qsleeperfantasybot.dynasty_compare`."""
+
+import asyncio
+import time
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from qsleeperfantasybot import dynasty_compare as compare
+from qsleeperfantasybot.fantasycalc import FantasyCalcError, resolve_player
+from qsleeperfantasybot.snapshot_cache import SettingsKey, SnapshotCache, ValueSnapshot
+from qsleeperfantasybot.trade_cache import TradeResultCache
+
+
+@pytest.mark.asyncio
+async def test_dynasty_compare_reports_unresolved_assets(
+    player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]
+) -> None:
+    """Assets that cannot be resolved are listed as not found instead of failing the comparison."""
+
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        return ValueSnapshot(key, [player_a_dict, player_b_dict], time.time())
+
+    with patch.object(compare, "snapshot_cache", SnapshotCache(loader)):
+        message = await compare.dynasty_compare(["Player A", "Nobody"], ["Player B"], 1, True, 12)
+
+    assert "🅰️ Side A Total: 10152" in message
+    assert message.endswith("❓ Not found, counted as 0: Nobody")
+
+
+@pytest.mark.asyncio
+async def test_dynasty_compare_flags_refreshing_and_unreachable_values(
+    player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]
+) -> None:
+    """An expired snapshot reports an outage only after its reload failed, otherwise that it is being refreshed."""
+    key = SettingsKey.create(True, 2, 12, 1)
+    fail = False
+
+    async def loader(settings: SettingsKey) -> ValueSnapshot:
+        if fail:
+            raise FantasyCalcError("FantasyCalc circuit is open")
+        return ValueSnapshot(settings, [player_a_dict, player_b_dict], time.time())
+
+    cache = SnapshotCache(loader, stale_while_revalidate=60, stale_if_error=True)
+    cache.put(ValueSnapshot(key, [player_a_dict, player_b_dict], time.time() - 15 * 60 - 30))
+    with patch.object(compare, "snapshot_cache", cache):
+        refreshing = await compare.dynasty_compare(["Player A"], ["Player B"], 1, True, 12)
+        await asyncio.sleep(0.01)
+        fresh = await compare.dynasty_compare(["Player A"], ["Player B"], 1, True, 12)
+        fail = True
+        cache.put(ValueSnapshot(key, [player_a_dict, player_b_dict], time.time() - 6 * 86400))
+        unreachable = await compare.dynasty_compare(["Player A"], ["Player B"], 1, True, 12)
+
+    assert refreshing.endswith("🔄 FantasyCalc values are being refreshed, these are from 15 minutes ago.")
+    assert "FantasyCalc" not in fresh
+    assert unreachable.endswith("⚠️ FantasyCalc is unreachable, values are from 6 days ago.")
+
+
+@pytest.mark.asyncio
+async def test_dynasty_compare_enforces_deadline() -> None:
+    """A snapshot load slower than the command deadline raises `FantasyCalcError` if nothing is cached."""
+
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        await asyncio.sleep(1)
+        return ValueSnapshot(key, [], time.time())
+
+    with patch.object(compare, "snapshot_cache", SnapshotCache(loader)):
+        with pytest.raises(FantasyCalcError):
+            await compare.dynasty_compare(["Player A"], ["Player B"], 1, True, 12, deadline=0.01)
+
+
+@pytest.mark.asyncio
+async def test_dynasty_compare_falls_back_to_cached_snapshot_past_deadline(
+    player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]
+) -> None:
+    """Past the deadline an expired cached snapshot is used and the message says how old its values are."""
+
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        await asyncio.sleep(1)
+        return ValueSnapshot(key, [], time.time())
+
+    cache = SnapshotCache(loader)
+    cache.put(ValueSnapshot(SettingsKey.create(True, 2, 12, 1), [player_a_dict, player_b_dict], time.time() - 7200))
+    with patch.object(compare, "snapshot_cache", cache):
+        message = await compare.dynasty_compare(["Player A"], ["Player B"], 1, True, 12, deadline=0.01)
+
+    assert "🅱️ Side B Total: 12000" in message
+    assert message.endswith("⚠️ FantasyCalc is unreachable, values are from 2 hours ago.")
+
+
+@pytest.mark.asyncio
+async def test_dynasty_compare_memoizes_trades(player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]) -> None:
+    """A repeated trade, also with the sides swapped, skips name resolution; a new snapshot is valued again."""
+
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        return ValueSnapshot(key, [player_a_dict, player_b_dict], time.time())
+
+    cache = SnapshotCache(loader)
+    with (
+        patch.object(compare, "snapshot_cache", cache),
+        patch.object(compare, "trade_cache", TradeResultCache()),
+        patch("qsleeperfantasybot.dynasty_compare.resolve_player", wraps=resolve_player) as resolve,
+    ):
+        first = await compare.dynasty_compare(["Player A"], ["Player B"], 1, True, 12)
+        again = await compare.dynasty_compare(["player a"], ["Player B"], 1, True, 12)
+        swapped = await compare.dynasty_compare(["Player B"], ["Player A"], 1, True, 12)
+        assert resolve.call_count == 2
+        cache.invalidate()
+        fresh = await compare.dynasty_compare(["Player B"], ["Player A"], 1, True, 12)
+
+    assert again is first
+    assert "🅰️ Side A Total: 12000" in swapped and "**Advantage:** Side A" in swapped
+    assert fresh == swapped
+    assert resolve.call_count == 4
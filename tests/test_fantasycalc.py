@@ -4,10 +4,28 @@ It verifies that the function correctly processes player dictionaries, handles m
 and manages duplicate player names.
 """
 
+import asyncio
+import copy
+from pathlib import Path
 from typing import Any, Dict
+from unittest.mock import AsyncMock, patch
 
-from qsleeperfantasybot.fantasycalc import create_lookup_dict
+import pytest
+
+from qsleeperfantasybot import fantasycalc
+from qsleeperfantasybot.circuit_breaker import CircuitBreaker
+from qsleeperfantasybot.fantasycalc import (
+    FantasyCalcError,
+    create_lookup_dict,
+    fetch_values,
+    get_player_values,
+    resolve_player,
+)
+from qsleeperfantasybot.name_index import MatchQuality
 from qsleeperfantasybot.player_model import Player
+from qsleeperfantasybot.snapshot_cache import SettingsKey, SnapshotCache, ValueSnapshot
+from qsleeperfantasybot.snapshot_store import SnapshotStore
+from qsleeperfantasybot.value_history import ValueHistoryStore
 
 
 def test_create_lookup_dict_basic(player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]) -> None:
@@ -70,3 +88,111 @@ def test_create_lookup_dict_overwrites_duplicates(
 
     assert "player a" in lookup
     assert len(lookup) == 1
+
+
+def test_resolve_player_reports_match_quality(player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]) -> None:
+    """Test that `resolve_player` returns exact, substring and missing matches with the right quality."""
+    snapshot = ValueSnapshot(SettingsKey.create(True, 1, 12, 1), [player_a_dict, player_b_dict], 0)
+
+    exact = resolve_player(snapshot, "Player A")
+    substring = resolve_player(snapshot, "yer b")
+    missing = resolve_player(snapshot, "Nobody")
+
+    assert exact.player is not None and exact.player.info.name == "Player A"
+    assert exact.quality is MatchQuality.EXACT
+    assert substring.player is not None and substring.player.info.name == "Player B"
+    assert substring.quality is MatchQuality.SUBSTRING
+    assert missing.player is None
+    assert missing.quality is MatchQuality.NONE
+
+
+def test_resolve_player_resolves_pick_spellings(player_a_dict: Dict[str, Any]) -> None:
+    """Pick spellings resolve to the listed pick asset or to an interpolated value between listed slots."""
+    picks = []
+    for entry, (name, value) in enumerate([("2026 Pick 1.01", 8000), ("2026 Pick 1.12", 4000)]):
+        pick = copy.deepcopy(player_a_dict)
+        pick["player"].update(id=entry, name=name, position="PICK", sleeperId=None)
+        pick["value"] = value
+        picks.append(pick)
+    snapshot = ValueSnapshot(SettingsKey.create(True, 1, 12, 1), [player_a_dict, *picks], 0)
+
+    listed = resolve_player(snapshot, "2026 1.01")
+    interpolated = resolve_player(snapshot, "2026 1.05")
+    player = resolve_player(snapshot, "Player A")
+
+    assert listed.entry == 1 and listed.quality is MatchQuality.NORMALIZED
+    assert interpolated.entry is None and interpolated.quality is MatchQuality.INTERPOLATED
+    assert interpolated.player is not None and interpolated.player.info.name == "2026 Pick 1.05"
+    assert interpolated.player.value == 6545
+    assert player.quality is MatchQuality.EXACT
+
+
+@pytest.mark.asyncio
+async def test_get_player_values_uses_one_snapshot(
+    player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]
+) -> None:
+    """Test that `get_player_values` resolves every name against a single snapshot load, preserving input order."""
+    key = SettingsKey.create(True, 2, 12, 1)
+    snapshot = ValueSnapshot(key, [player_a_dict, player_b_dict], 0)
+    with patch.object(fantasycalc.snapshot_cache, "get", AsyncMock(return_value=snapshot)) as mock_get:
+        matches = await get_player_values(["Player B", "Nobody", "Player A"], key)
+
+    mock_get.assert_awaited_once_with(key)
+    assert [m.query for m in matches] == ["Player B", "Nobody", "Player A"]
+    assert [m.quality for m in matches] == [MatchQuality.EXACT, MatchQuality.NONE, MatchQuality.EXACT]
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshots_loads_persisted_payloads(
+    tmp_path: Path, player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]
+) -> None:
+    """Test that persisted payloads are restored into the cache and feed the autocomplete names."""
+    store = SnapshotStore(tmp_path)
+    store.save(fantasycalc.ASSET_NAMES_KEY, 1234.0, [player_a_dict, player_b_dict])
+    cache = SnapshotCache(AsyncMock())
+    cache.add_listener(fantasycalc._update_asset_names)
+
+    history = ValueHistoryStore(tmp_path / "history")
+    with (
+        patch.object(fantasycalc, "snapshot_store", store),
+        patch.object(fantasycalc, "snapshot_cache", cache),
+        patch.object(fantasycalc, "value_history", history),
+    ):
+        assert await fantasycalc.restore_snapshots() == 1
+
+    snapshot = cache.peek(fantasycalc.ASSET_NAMES_KEY)
+    assert snapshot is not None
+    assert snapshot.fetched_at == 1234.0 and snapshot.restored
+    assert len(history.history(fantasycalc.ASSET_NAMES_KEY)) == 1
+    assert fantasycalc._cached_asset_names == ["Player A", "Player B"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_values_fails_fast_while_circuit_is_open() -> None:
+    """Test that an open circuit raises `FantasyCalcError` without calling FantasyCalc."""
+    breaker = CircuitBreaker("FantasyCalc", failure_threshold=1)
+    breaker.record_failure()
+    get_session = AsyncMock()
+
+    with patch.object(fantasycalc, "circuit_breaker", breaker), patch.object(fantasycalc, "get_session", get_session):
+        with pytest.raises(FantasyCalcError):
+            await fetch_values(SettingsKey.create(True, 1, 12, 1))
+
+    get_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_fetch_is_not_counted_as_failure() -> None:
+    """Test that a cancelled call releases the half-open trial instead of reopening the circuit."""
+    clock = [1000.0]
+    breaker = CircuitBreaker("FantasyCalc", failure_threshold=1, reset_timeout=30, clock=lambda: clock[0])
+    breaker.record_failure()
+    clock[0] += 30
+    get_session = AsyncMock(side_effect=asyncio.CancelledError)
+
+    with patch.object(fantasycalc, "circuit_breaker", breaker), patch.object(fantasycalc, "get_session", get_session):
+        with pytest.raises(asyncio.CancelledError):
+            await fetch_values(SettingsKey.create(True, 1, 12, 1))
+
+    assert breaker.failures == 1
+    breaker.before_call()
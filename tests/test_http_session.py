@@ -0,0 +1,31 @@
+"""Unit tests for the shared HTTP session lifecycle in `qsleeperfantasybot.http_session`."""
+
+import pytest
+
+from qsleeperfantasybot import http_session
+from qsleeperfantasybot.http_session import HttpSettings
+
+
+def test_http_settings_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pool limits and timeouts are configurable through environment variables."""
+    monkeypatch.setenv("HTTP_TOTAL_TIMEOUT", "3.5")
+    monkeypatch.setenv("HTTP_MAX_CONNECTIONS_PER_HOST", "4")
+    settings = HttpSettings.from_env()
+    assert settings.total_timeout == 3.5
+    assert settings.max_connections_per_host == 4
+    assert settings.max_connections == HttpSettings.max_connections
+
+
+@pytest.mark.asyncio
+async def test_session_is_shared_until_closed() -> None:
+    """All callers get the same pooled session until it is closed."""
+    async with http_session.session_scope(HttpSettings(max_connections_per_host=2)) as session:
+        assert await http_session.get_session() is session
+        assert session.connector is not None
+        assert session.connector.limit_per_host == 2
+    assert session.closed
+
+    reopened = await http_session.get_session()
+    assert reopened is not session
+    await http_session.close_session()
+    assert reopened.closed
@@ -0,0 +1,88 @@
+"""Unit tests for the joined league view in `qsleeperfantasybot.league_snapshot`."""
+
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock
+
+import pytest
+
+from qsleeperfantasybot.league_snapshot import LeagueSnapshotCache, build_league_snapshot
+
+ROSTERS: List[Dict[str, Any]] = [
+    {"roster_id": 1, "owner_id": "u1", "players": ["10"], "co_owners": ["u3"], "settings": {"wins": 3, "fpts": 101}},
+    {"roster_id": 2, "owner_id": "u2", "players": ["20"], "starters": ["20", "0"]},
+    {"roster_id": 3, "owner_id": None, "players": []},
+]
+USERS = [
+    {"user_id": "u1", "display_name": "manager1", "metadata": {"team_name": "Team One"}},
+    {"user_id": "u2", "display_name": "manager2", "metadata": {}},
+]
+TRADED_PICKS = [{"season": "2027", "round": 1, "roster_id": 1, "previous_owner_id": 1, "owner_id": 2}]
+DRAFTS = [
+    {"draft_id": "d1", "season": "2025", "status": "complete", "settings": {"rounds": 4}},
+    {"draft_id": "d2", "season": "2026", "status": "pre_draft", "settings": {"rounds": 4}},
+]
+
+
+def client_for(league: Dict[str, Any]) -> AsyncMock:
+    client = AsyncMock()
+    client.get_specific_league.return_value = league
+    client.get_rosters_in_a_league.return_value = ROSTERS
+    client.get_users_in_a_league.return_value = USERS
+    client.get_traded_picks_in_league.return_value = TRADED_PICKS
+    client.get_all_drafts_for_a_league.return_value = DRAFTS
+    client.get_nfl_state.return_value = {"season": "2026", "season_type": "regular", "week": 5}
+    return client
+
+
+def test_snapshot_joins_rosters_users_and_picks(sleeper_league_dict: Dict[str, Any]) -> None:
+    """Owners, co-owners and traded picks are joined by roster ID and user ID."""
+    league = build_league_snapshot("123", sleeper_league_dict, ROSTERS, USERS, TRADED_PICKS, DRAFTS, None)
+    assert league is not None
+
+    assert league.team_names == {1: "Team One", 2: "manager2", 3: "Roster 3"}
+    assert league.roster_of("u3") is league.rosters[1]
+    assert league.rosters[1].wins == 3 and league.rosters[2].starters == ["20"]
+    assert league.pick_owner("2027", 1, 1) == 2
+    assert league.pick_owner("2027", 2, 1) == 1
+    assert league.picks_owned(2, ["2027"], 1) == [("2027", 1, 1), ("2027", 1, 2)]
+    assert [draft.draft_id for draft in league.drafts] == ["d2", "d1"]
+    assert league.nfl_state is None
+    assert build_league_snapshot("123", None, ROSTERS, USERS) is None
+    assert build_league_snapshot("123", {"settings": {}}, ROSTERS, USERS) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_shares_one_load_until_ttl(sleeper_league_dict: Dict[str, Any]) -> None:
+    """Concurrent loads share one fetch of all six resources; a reload after the TTL gets a new version."""
+    now = [1000.0]
+    client = client_for(sleeper_league_dict)
+    cache = LeagueSnapshotCache(client, ttl=60, clock=lambda: now[0])
+
+    first, second = await asyncio.gather(cache.get("123"), cache.get("123"))
+    assert first is second and first is not None
+    assert first.nfl_state is not None and first.nfl_state.week == 5
+    assert client.get_rosters_in_a_league.await_count == 1
+    assert await cache.get("123") is first
+
+    now[0] += 60
+    reloaded = await cache.get("123")
+    assert reloaded is not None and reloaded.version > first.version
+    assert client.get_rosters_in_a_league.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_league(sleeper_league_dict: Dict[str, Any]) -> None:
+    """Only max_entries leagues stay cached; the least recently used one is loaded again."""
+    client = client_for(sleeper_league_dict)
+    cache = LeagueSnapshotCache(client, max_entries=2)
+
+    first = await cache.get("1")
+    await cache.get("2")
+    assert await cache.get("1") is first
+    await cache.get("3")
+
+    assert await cache.get("1") is first
+    assert client.get_rosters_in_a_league.await_count == 3
+    await cache.get("2")
+    assert client.get_rosters_in_a_league.await_count == 4
@@ -0,0 +1,100 @@
+"""Unit tests for the league trade tools in `qsleeperfantasybot.league_trades`."""
+
+import copy
+import time
+from typing import Any, Dict
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from qsleeperfantasybot import league_trades
+from qsleeperfantasybot.league_snapshot import LeagueSnapshotCache
+from qsleeperfantasybot.snapshot_cache import SettingsKey, SnapshotCache, ValueSnapshot
+from qsleeperfantasybot.trade_finder import TradeFinder
+from qsleeperfantasybot.trade_valuation import TradeValuator, ValuationSettings
+
+
+def test_league_settings_key_reads_league_format() -> None:
+    """Dynasty type, superflex roster positions, league size and reception scoring select the snapshot."""
+    league = {
+        "settings": {"type": 2},
+        "roster_positions": ["QB", "RB", "WR", "SUPER_FLEX", "BN"],
+        "total_rosters": 10,
+        "scoring_settings": {"rec": 0.5},
+    }
+
+    assert league_trades.league_settings_key(league) == SettingsKey.create(True, 2, 10, 0.5)
+    assert league_trades.league_settings_key({}) == SettingsKey.create(False, 1, 12, 1)
+
+
+@pytest.mark.asyncio
+async def test_propose_trades_joins_rosters_with_values(
+    player_a_dict: Dict[str, Any], sleeper_league_dict: Dict[str, Any]
+) -> None:
+    """Roster player IDs are mapped to snapshot entries through their Sleeper IDs."""
+    assets = []
+    players = [("10", "QB", 6000), ("11", "QB", 5000), ("20", "QB", 800)]
+    players += [("21", "WR", 5100), ("22", "WR", 4900), ("23", "WR", 4800), ("24", "WR", 4700)]
+    for sleeper_id, position, value in players:
+        asset = copy.deepcopy(player_a_dict)
+        asset["player"].update(name=f"Player {sleeper_id}", position=position, sleeperId=sleeper_id)
+        asset["value"] = value
+        assets.append(asset)
+    client = AsyncMock()
+    client.get_specific_league.return_value = {**sleeper_league_dict, "roster_positions": ["QB", "WR"]}
+    client.get_rosters_in_a_league.return_value = [
+        {"roster_id": 1, "players": ["10", "11", "999"]},
+        {"roster_id": 2, "players": ["20", "21", "22", "23", "24"]},
+    ]
+
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        return ValueSnapshot(key, assets, time.time())
+
+    with (
+        patch.object(league_trades, "league_snapshots", LeagueSnapshotCache(client)),
+        patch.object(league_trades, "snapshot_cache", SnapshotCache(loader)),
+    ):
+        message = await league_trades.propose_trades("123", 1, 2, max_assets=1)
+        missing = await league_trades.propose_trades("123", 1, 3)
+
+    assert "1. Roster 1 gives: Player 11\n   Roster 2 gives: Player 23" in message
+    assert missing == "❌ League `123` has no roster 3."
+
+
+@pytest.mark.asyncio
+async def test_shop_asset_scans_league_once(
+    player_a_dict: Dict[str, Any], sleeper_league_dict: Dict[str, Any]
+) -> None:
+    """A second scan of the same league reuses the cached matrix instead of fetching Sleeper again."""
+    assets = []
+    for sleeper_id, position, value in [("10", "QB", 6000), ("11", "QB", 5000), ("20", "WR", 5000)]:
+        asset = copy.deepcopy(player_a_dict)
+        asset["player"].update(name=f"Player {sleeper_id}", position=position, sleeperId=sleeper_id)
+        asset["value"] = value
+        assets.append(asset)
+    client = AsyncMock()
+    client.get_specific_league.return_value = {**sleeper_league_dict, "roster_positions": ["QB", "WR", "FLEX"]}
+    client.get_rosters_in_a_league.return_value = [
+        {"roster_id": 1, "owner_id": "u1", "players": ["10", "11"]},
+        {"roster_id": 2, "owner_id": "u2", "players": ["20"]},
+    ]
+    client.get_users_in_a_league.return_value = [{"user_id": "u2", "display_name": "manager2"}]
+
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        return ValueSnapshot(key, assets, time.time())
+
+    finder = TradeFinder(TradeValuator(ValuationSettings(consolidation_exponent=1, roster_spot_cost=0)))
+    with (
+        patch.object(league_trades, "league_snapshots", LeagueSnapshotCache(client)),
+        patch.object(league_trades, "snapshot_cache", SnapshotCache(loader)),
+        patch.object(league_trades, "trade_finder", finder),
+    ):
+        first = await league_trades.shop_asset("123", 1, "Player 11")
+        second = await league_trades.shop_asset("123", 1, "Player 11")
+        missing = await league_trades.shop_asset("123", 1, "Nobody At All")
+        foreign = await league_trades.shop_asset("123", 1, "Player 20")
+
+    assert first == second == "🛒 No team has a fair package for Player 11 (5000) that fills a need of yours."
+    assert missing == "❌ Could not find an asset named `Nobody At All`."
+    assert foreign == "❌ Roster 1 does not hold Player 20."
+    assert client.get_rosters_in_a_league.call_count == 1
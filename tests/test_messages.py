@@ -7,7 +7,15 @@ Each test verifies that the output matches the expected format and content, ensu
 trade evaluations and comparisons.
 """
 
-from qsleeperfantasybot.messages import construct_dynasty_trade_message, format_side
+from qsleeperfantasybot.messages import (
+    construct_dynasty_trade_message,
+    construct_risers_message,
+    construct_shop_message,
+    format_side,
+)
+from qsleeperfantasybot.trade_balancer import BalanceSuggestion
+from qsleeperfantasybot.trade_finder import TradeTarget
+from qsleeperfantasybot.value_history import Mover
 
 
 def test_format_side() -> None:
@@ -38,3 +46,51 @@ def test_construct_dynasty_trade_message() -> None:
         "Side B Total: 250\n - Player 3: 150\n - Player 4: 100\n\n➡️ **Advantage:** Side A by 50 points"
     )
     assert construct_dynasty_trade_message(total_a, details_a, total_b, details_b) == expected_message
+
+
+def test_construct_dynasty_trade_message_lists_balancing_assets() -> None:
+    """Test that balancing suggestions are listed for the side without the advantage."""
+    suggestion = BalanceSuggestion(entries=[3, 7], names=["C", "D"], values=[30, 15], remaining_gap=-5)
+
+    message = construct_dynasty_trade_message(100, [("A", 100)], 60, [("B", 60)], suggestions=[suggestion])
+
+    assert message.endswith("⚖️ To even it out, Side B could add:\n - C + D (45, -5 left)")
+
+
+def test_construct_dynasty_trade_message_flags_stale_values() -> None:
+    """Test that values from an old snapshot are flagged with their age."""
+    message = construct_dynasty_trade_message(10, [("A", 10)], 5, [("B", 5)], stale_age=2 * 3600 + 120)
+
+    assert message.endswith("⚠️ FantasyCalc is unreachable, values are from 2 hours ago.")
+
+
+def test_construct_dynasty_trade_message_flags_refreshing_values() -> None:
+    """Test that expired values served while newer ones are fetched are not reported as an outage."""
+    message = construct_dynasty_trade_message(10, [("A", 10)], 5, [("B", 5)], stale_age=20 * 60, refreshing=True)
+
+    assert message.endswith("🔄 FantasyCalc values are being refreshed, these are from 20 minutes ago.")
+    assert "unreachable" not in message
+
+
+def test_construct_risers_message() -> None:
+    """Test that the risers message lists gainers and losers with their change and start/end values."""
+    gainers = [Mover(1, "Player 1", 1000, 1500)]
+    expected_message = (
+        "📈 Value Risers (last 7 days)\n\n⬆️ Top Gainers\n - Player 1: +500 (1000 → 1500)\n\n"
+        "⬇️ Top Losers\n - No changes recorded"
+    )
+    assert construct_risers_message(7, gainers, []) == expected_message
+    assert construct_risers_message(7, gainers, [], recorded_days=7) == expected_message
+    assert construct_risers_message(30, [], [], recorded_days=3).startswith(
+        "📈 Value Risers (last 3 days recorded, 30 requested)"
+    )
+
+
+def test_construct_shop_message() -> None:
+    """Test that the shop message lists one package per team with both lineup changes."""
+    targets = [TradeTarget(3, "Deep WRs", [20, 21], ["Player C", "Player D"], -150, 4300, 4000)]
+    expected_message = (
+        "🛒 Shopping Player A (6000)\n\n"
+        "1. Deep WRs: Player C, Player D (-150)\n   Your lineup: +4300, their lineup: +4000"
+    )
+    assert construct_shop_message("Player A", 6000, targets) == expected_message
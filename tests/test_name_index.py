@@ -0,0 +1,137 @@
+"""Unit tests for indexed asset name matching in `qsleeperfantasybot.name_index`.
+Besides normalization and ranking, they check that the index returns the same or a better match than the
+previous linear substring scan over the lowercase lookup dictionary.
+"""
+
+from typing import Dict, List, Optional
+
+import pytest
+
+from qsleeperfantasybot.name_index import AutocompleteIndex, MatchQuality, NameIndex, normalize_name
+
+ASSETS: Dict[str, int] = {
+    "Ja'Marr Chase": 10152,
+    "Amon-Ra St. Brown": 8700,
+    "Kenneth Walker III": 5400,
+    "Marvin Harrison Jr.": 7600,
+    "Michael Pittman Jr.": 4100,
+    "Travis Etienne": 4800,
+    "Josh Allen": 9800,
+    "Josh Jacobs": 5200,
+    "Brian Thomas": 7900,
+    "Mike Evans": 4500,
+    "2026 1st": 6200,
+    "2026 Early 1st": 7100,
+}
+
+
+def legacy_match(query: str) -> Optional[str]:
+    """The previous behaviour: exact lowercase match, then first substring hit in dict order."""
+    lookup = {name.lower(): name for name in ASSETS}
+    if query.lower() in lookup:
+        return lookup[query.lower()]
+    for key, name in lookup.items():
+        if query.lower() in key:
+            return name
+    return None
+
+
+@pytest.fixture
+def index() -> NameIndex:
+    return NameIndex(list(ASSETS), list(ASSETS.values()))
+
+
+def matched_name(index: NameIndex, query: str) -> Optional[str]:
+    entry, _ = index.match(query)
+    return None if entry is None else index.names[entry]
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Ja'Marr Chase", "jamarr chase"),
+        ("Amon-Ra St. Brown", "amon ra st brown"),
+        ("Kenneth Walker III", "kenneth walker"),
+        ("Marvin Harrison Jr.", "marvin harrison"),
+        ("Jérémy Ruckert", "jeremy ruckert"),
+        ("  JOSH   ALLEN ", "josh allen"),
+        ("Jr.", "jr"),
+    ],
+)
+def test_normalize_name(raw: str, expected: str) -> None:
+    """Accents, punctuation, separators and generational suffixes are normalized away."""
+    assert normalize_name(raw) == expected
+
+
+def test_match_quality_levels(index: NameIndex) -> None:
+    """Exact names win, then normalized keys, then substring matches."""
+    assert index.match("josh allen")[1] is MatchQuality.EXACT
+    assert index.match("Jamarr Chase")[1] is MatchQuality.NORMALIZED
+    assert index.match("Kenneth Walker")[1] is MatchQuality.NORMALIZED
+    assert index.match("harrison")[1] is MatchQuality.SUBSTRING
+    assert index.match("Nobody Here") == (None, MatchQuality.NONE)
+
+
+@pytest.mark.parametrize(
+    "query", ["josh allen", "chase", "Evans", "2026 1st", "walker", "Pittman Jr.", "st. brown", "thomas"]
+)
+def test_index_finds_everything_the_linear_scan_found(index: NameIndex, query: str) -> None:
+    """Every query the old fallback resolved still resolves to the same asset."""
+    assert legacy_match(query) is not None
+    assert matched_name(index, query) == legacy_match(query)
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("Jamarr Chase", "Ja'Marr Chase"),
+        ("Amon Ra St Brown", "Amon-Ra St. Brown"),
+        ("Kenneth Walker", "Kenneth Walker III"),
+        ("Marvin Harrison", "Marvin Harrison Jr."),
+        ("Kenneth Walker Jr", "Kenneth Walker III"),
+    ],
+)
+def test_index_resolves_spellings_the_linear_scan_missed(index: NameIndex, query: str, expected: str) -> None:
+    """Spelling variants without punctuation or with a different suffix now resolve."""
+    if legacy_match(query) is not None:
+        assert legacy_match(query) == expected
+    assert matched_name(index, query) == expected
+
+
+def test_substring_ranking_is_deterministic() -> None:
+    """Ties are broken by word-start, value, length and name rather than by insertion order."""
+    names: List[str] = ["Joshua Palmer", "Josh Allen", "Josh Downs"]
+    values = [1500, 9800, 3000]
+    forward = NameIndex(names, values)
+    backward = NameIndex(names[::-1], values[::-1])
+
+    assert [forward.names[e] for e in forward.search("josh")] == ["Josh Allen", "Josh Downs", "Joshua Palmer"]
+    assert [backward.names[e] for e in backward.search("josh")] == ["Josh Allen", "Josh Downs", "Joshua Palmer"]
+    assert [forward.names[e] for e in forward.search("all")] == ["Josh Allen"]
+    assert forward.search("sh", limit=1) == [1]
+
+
+@pytest.fixture
+def autocomplete_index() -> AutocompleteIndex:
+    return AutocompleteIndex(list(ASSETS), list(ASSETS.values()))
+
+
+def test_autocomplete_matches_previous_substring_filter(autocomplete_index: AutocompleteIndex) -> None:
+    """Suggestions contain exactly the names the old case-insensitive substring filter returned."""
+    for query in ["jo", "JOSH", "r", "st. b", "2026", "an", "zzz"]:
+        expected = {name for name in ASSETS if query.lower() in name.lower()}
+        assert set(autocomplete_index.complete(query, limit=len(ASSETS))) == expected
+
+
+def test_autocomplete_ranks_by_relevance_then_value(autocomplete_index: AutocompleteIndex) -> None:
+    """Name prefixes beat word prefixes, which beat infix matches; value breaks ties."""
+    assert autocomplete_index.complete("j") == [
+        "Ja'Marr Chase",
+        "Josh Allen",
+        "Josh Jacobs",
+        "Marvin Harrison Jr.",
+        "Michael Pittman Jr.",
+    ]
+    assert autocomplete_index.complete("a", limit=3) == ["Amon-Ra St. Brown", "Josh Allen", "Ja'Marr Chase"]
+    assert autocomplete_index.complete("1st") == ["2026 Early 1st", "2026 1st"]
+    assert autocomplete_index.complete("", limit=2) == ["Ja'Marr Chase", "Josh Allen"]
@@ -0,0 +1,29 @@
+"""Unit tests for the compact player model in `qsleeperfantasybot.player_model`."""
+
+import json
+from typing import Any, Dict
+
+from qsleeperfantasybot.player_model import create_player_from_dict
+
+
+def test_create_player_from_dict_is_slotted_and_interned(player_a_dict: Dict[str, Any]) -> None:
+    """Players carry no per-instance __dict__ and equal strings from separate payloads share one object."""
+    first = create_player_from_dict(json.loads(json.dumps(player_a_dict)))
+    second = create_player_from_dict(json.loads(json.dumps(player_a_dict)))
+
+    assert not hasattr(first, "__dict__")
+    assert not hasattr(first.info, "__dict__")
+    assert first == second
+    assert first.info.name is second.info.name
+    assert first.info.maybeTeam is second.info.maybeTeam
+
+
+def test_create_player_from_dict_ignores_unknown_fields(player_a_dict: Dict[str, Any]) -> None:
+    """New fields added upstream by FantasyCalc do not break parsing."""
+    player_a_dict["newMetric"] = 1
+    player_a_dict["player"]["maybeNickname"] = "A"
+
+    player = create_player_from_dict(player_a_dict)
+
+    assert player.info.name == "Player A"
+    assert player.value == 10152
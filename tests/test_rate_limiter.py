@@ -0,0 +1,96 @@
+"""Unit tests for the rate limiter in `qsleeperfantasybot.rate_limiter`.
+They verify token bucket pacing, Retry-After handling and the jittered exponential backoff.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from qsleeperfantasybot.rate_limiter import RateLimiter, RateLimitSettings, TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSleep:
+    """Records the requested sleeps and advances the clock instead of sleeping."""
+
+    def __init__(self, clock: FakeClock) -> None:
+        self.clock = clock
+        self.calls: List[float] = []
+
+    async def __call__(self, seconds: float) -> None:
+        self.calls.append(seconds)
+        self.clock.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces() -> None:
+    """A full bucket serves a burst at once; further takers queue up one refill interval apart."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=3, clock=clock)
+    assert [bucket.reserve() for _ in range(5)] == [0.0, 0.0, 0.0, 0.5, 1.0]
+    clock.now += 10
+    assert bucket.tokens == 3
+
+
+def test_token_bucket_reservations_from_threads() -> None:
+    """Reservations from many threads each take exactly one token."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=1, clock=clock)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        waits = sorted(pool.map(lambda _: bucket.reserve(), range(400)))
+    assert waits == [float(wait) for wait in range(400)]
+
+
+def test_parse_retry_after() -> None:
+    """Retry-After is accepted as seconds or as an HTTP date; anything else is ignored."""
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    assert parse_retry_after(later) == pytest.approx(60, abs=2)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_every_request() -> None:
+    """A 429 with Retry-After delays the next request of any caller until the pause is over."""
+    clock = FakeClock()
+    sleep = FakeSleep(clock)
+    limiter = RateLimiter("test", RateLimitSettings(calls_per_minute=6000, burst=10), clock=clock, sleep=sleep)
+
+    assert await limiter.backoff(0, 429, retry_after=5)
+    assert sleep.calls == [5]
+    clock.now -= 5  # another caller that did not sleep
+    await limiter.acquire()
+    assert sleep.calls == [5, 5]
+    assert limiter.metrics.rate_limited == 1
+    assert limiter.metrics.throttled == 1
+
+
+@pytest.mark.asyncio
+async def test_backoff_grows_and_gives_up() -> None:
+    """Without Retry-After the delay doubles per attempt with jitter; retries and long pauses are bounded."""
+    clock = FakeClock()
+    sleep = FakeSleep(clock)
+    settings = RateLimitSettings(max_retries=2, backoff_base=1, backoff_max=10)
+    limiter = RateLimiter("test", settings, clock=clock, sleep=sleep, jitter=lambda: 1.0)
+
+    assert await limiter.backoff(0, 503)
+    assert await limiter.backoff(1, 503)
+    assert not await limiter.backoff(2, 503)
+    assert not await limiter.backoff(0, 429, retry_after=60)
+    assert sleep.calls == [1, 2]
+    assert limiter.metrics.retries == 2
+    assert limiter.metrics.gave_up == 2
+    assert limiter.backoff_delay(10) == 10
+    assert RateLimiter("test", settings, jitter=lambda: 0.0).backoff_delay(1) == 1
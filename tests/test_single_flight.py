@@ -0,0 +1,70 @@
+"""Unit tests for request coalescing in `qsleeperfantasybot.single_flight`.
+They verify that concurrent calls for one key share a single call and its result or exception.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List
+
+import pytest
+
+from qsleeperfantasybot.single_flight import BlockingSingleFlight, SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_coroutines_share_one_call() -> None:
+    """Callers of the same key wait for one call; other keys and later calls run on their own."""
+    flights = SingleFlight()
+    started: List[str] = []
+
+    async def fetch(key: str) -> str:
+        started.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    results = await asyncio.gather(*(flights.do(key, partial(fetch, key)) for key in ["a"] * 5 + ["b"]))
+    assert results == ["A"] * 5 + ["B"]
+    assert started == ["a", "b"]
+    assert (flights.calls, flights.coalesced, len(flights)) == (2, 4, 0)
+
+    await flights.do("a", lambda: fetch("a"))
+    assert started == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_exceptions_are_shared() -> None:
+    """Every waiting caller gets the exception of the shared call."""
+    flights = SingleFlight()
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    results = await asyncio.gather(*(flights.do("a", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flights.calls == 1
+
+
+def test_blocking_calls_share_one_call_across_threads() -> None:
+    """Threads asking for the same key while the first call runs block on it and share its result."""
+    flights = BlockingSingleFlight()
+    release = threading.Event()
+    calls: List[int] = []
+
+    def fetch() -> dict[str, int]:
+        calls.append(1)
+        release.wait(timeout=5)
+        return {"picks": 12}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flights.do, "draft", fetch) for _ in range(4)]
+        while flights.calls + flights.coalesced < 4:
+            threading.Event().wait(0.001)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == [{"picks": 12}] * 4
+    assert len(calls) == 1
+    assert (flights.coalesced, len(flights)) == (3, 0)
@@ -0,0 +1,86 @@
+"""Unit tests for the Sleeper response cache in `qsleeperfantasybot.sleeper.api.cache`.
+They verify the per-endpoint TTL policies, LRU eviction and the on-disk tier.
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from qsleeperfantasybot.sleeper.api.cache import (
+    FOREVER,
+    CacheSettings,
+    ResponseCache,
+    policy_for,
+)
+
+BASE = "https://api.sleeper.app/v1"
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_policies_per_endpoint() -> None:
+    """Endpoints get their own TTLs, completed leagues never expire and unknown URLs are not cached."""
+    state, league, rosters = (policy_for(f"{BASE}{path}") for path in ("/state/nfl", "/league/1", "/league/1/rosters"))
+    assert state is not None and league is not None and rosters is not None
+    assert rosters.ttl < state.ttl < league.ttl
+    assert league.ttl_for({"status": "in_season"}) == league.ttl
+    assert league.ttl_for({"status": "complete"}) == FOREVER
+    assert policy_for(f"{BASE}/user/42/leagues/nfl/2025") is not policy_for(f"{BASE}/user/42")
+    assert policy_for("https://sleepercdn.com/avatars/abc") is None
+
+
+def test_entries_expire_and_are_evicted() -> None:
+    """Responses are served until their TTL ends and the least recently used ones are dropped beyond max_entries."""
+    clock = FakeClock()
+    cache = ResponseCache(CacheSettings(max_entries=2), clock=clock)
+    cache.put(f"{BASE}/state/nfl", {"week": 1})
+    cache.put(f"{BASE}/league/1", {"status": "complete"})
+    assert cache.get(f"{BASE}/state/nfl") == {"week": 1}
+
+    cache.put(f"{BASE}/user/42", {"user_id": "42"})
+    assert cache.get(f"{BASE}/league/1") is None
+    clock.now += 3600
+    assert cache.get(f"{BASE}/state/nfl") is None
+    assert cache.get(f"{BASE}/user/42") is None
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 3, 1)
+
+
+def test_disk_tier_survives_restart(tmp_path: Path) -> None:
+    """Long-lived responses are written to disk and served by a new cache; short-lived ones are not."""
+    settings = CacheSettings(directory=tmp_path)
+    cache = ResponseCache(settings)
+    cache.put(f"{BASE}/league/1", {"status": "complete"})
+    cache.put(f"{BASE}/league/1/rosters", [{"roster_id": 1}])
+
+    restarted = ResponseCache(settings)
+    assert restarted.get(f"{BASE}/league/1") == {"status": "complete"}
+    assert restarted.get(f"{BASE}/league/1") == {"status": "complete"}
+    assert restarted.get(f"{BASE}/league/1/rosters") is None
+    assert (restarted.stats.disk_hits, restarted.stats.hits, restarted.stats.misses) == (1, 1, 1)
+    assert restarted.stats.hit_rate == 2 / 3
+
+
+@pytest.mark.asyncio
+async def test_async_disk_tier_runs_in_worker_threads(tmp_path: Path) -> None:
+    """The async variants read and write the on-disk tier through asyncio.to_thread."""
+    settings = CacheSettings(directory=tmp_path)
+    cache = ResponseCache(settings)
+    restarted = ResponseCache(settings)
+
+    with patch("qsleeperfantasybot.sleeper.api.cache.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+        await cache.put_async(f"{BASE}/league/1", {"status": "complete"})
+        assert await restarted.get_async(f"{BASE}/league/1") == {"status": "complete"}
+        assert await restarted.get_async(f"{BASE}/league/1") == {"status": "complete"}
+
+    assert [call.args[0].__name__ for call in to_thread.call_args_list] == ["save", "load"]
+    assert (restarted.stats.disk_hits, restarted.stats.hits) == (1, 1)
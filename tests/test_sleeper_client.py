@@ -0,0 +1,78 @@
+"""Unit tests for the async Sleeper API client in `qsleeperfantasybot.sleeper.api.client`."""
+
+import asyncio
+from itertools import count
+from typing import AsyncIterator
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from qsleeperfantasybot.rate_limiter import RateLimiter, RateLimitSettings
+from qsleeperfantasybot.sleeper.api.cache import CacheSettings, ResponseCache
+from qsleeperfantasybot.sleeper.api.client import SleeperClient
+
+
+async def _league(request: web.Request) -> web.Response:
+    return web.json_response({"league_id": request.match_info["league_id"], "total_rosters": 12})
+
+
+async def _slow(request: web.Request) -> web.Response:
+    await asyncio.sleep(1)
+    return web.json_response([])
+
+
+@pytest_asyncio.fixture
+async def server() -> AsyncIterator[TestServer]:
+    calls = count(1)
+
+    async def throttled(request: web.Request) -> web.Response:
+        if next(calls) == 1:
+            return web.json_response({}, status=429, headers={"Retry-After": "0"})
+        return web.json_response({"season": "2026"})
+
+    app = web.Application()
+    app.router.add_get("/league/{league_id}", _league)
+    app.router.add_get("/league/{league_id}/rosters", _slow)
+    app.router.add_get("/state/nfl", throttled)
+    test_server = TestServer(app)
+    await test_server.start_server()
+    try:
+        yield test_server
+    finally:
+        await test_server.close()
+
+
+@pytest.mark.asyncio
+async def test_get_specific_league(server: TestServer) -> None:
+    """Endpoints return the parsed JSON of a successful response, and repeated requests are served from the cache."""
+    cache = ResponseCache(CacheSettings())
+    async with aiohttp.ClientSession() as session:
+        client = SleeperClient(session, base_url=str(server.make_url("")).rstrip("/"), cache=cache)
+        assert await client.get_specific_league("123") == {"league_id": "123", "total_rosters": 12}
+    assert await client.get_specific_league("123") == {"league_id": "123", "total_rosters": 12}
+    assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_errors_and_timeouts_return_none(server: TestServer) -> None:
+    """HTTP errors and timed out requests are logged and return None instead of raising."""
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=0.1)) as session:
+        client = SleeperClient(session, base_url=str(server.make_url("")).rstrip("/"))
+        assert await client.get_user(user_name="nobody") is None
+        assert await client.get_rosters_in_a_league("123") is None
+        with pytest.raises(ValueError):
+            await client.get_user()
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_is_retried(server: TestServer) -> None:
+    """A 429 response is retried after the Retry-After time and counted in the limiter metrics."""
+    limiter = RateLimiter("test", RateLimitSettings())
+    async with aiohttp.ClientSession() as session:
+        client = SleeperClient(session, base_url=str(server.make_url("")).rstrip("/"), limiter=limiter)
+        assert await client.get_nfl_state() == {"season": "2026"}
+    assert limiter.metrics.requests == 2
+    assert limiter.metrics.rate_limited == limiter.metrics.retries == 1
@@ -0,0 +1,196 @@
+"""Unit tests for the settings-keyed value snapshot cache in `qsleeperfantasybot.snapshot_cache`.
+They verify TTL expiry, LRU eviction across settings combinations and single-flight loading.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from qsleeperfantasybot.snapshot_cache import SettingsKey, SnapshotCache, SnapshotStatus, ValueSnapshot
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(clock: FakeClock, calls: List[SettingsKey], ttl: float = 60, max_entries: int = 2) -> SnapshotCache:
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        calls.append(key)
+        await asyncio.sleep(0)
+        return ValueSnapshot(key=key, assets=[], fetched_at=clock())
+
+    return SnapshotCache(loader, ttl=ttl, max_entries=max_entries, clock=clock)
+
+
+def test_settings_key_normalizes_ppr() -> None:
+    """ppr=1 and ppr=1.0 must select the same snapshot."""
+    assert SettingsKey.create(True, 1, 12, 1) == SettingsKey.create(True, 1, 12, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_get_reuses_fresh_snapshot_and_reloads_after_ttl() -> None:
+    """A snapshot is served from memory until its TTL expires."""
+    clock = FakeClock()
+    calls: List[SettingsKey] = []
+    cache = make_cache(clock, calls)
+    key = SettingsKey.create(True, 1, 12, 1)
+
+    first = await cache.get(key)
+    assert await cache.get(key) is first
+    assert len(calls) == 1
+
+    clock.now += 61
+    assert await cache.get(key) is not first
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_evicts_least_recently_used_settings() -> None:
+    """The least recently used settings combination is evicted above max_entries."""
+    clock = FakeClock()
+    calls: List[SettingsKey] = []
+    cache = make_cache(clock, calls, max_entries=2)
+    key_a = SettingsKey.create(True, 1, 12, 1)
+    key_b = SettingsKey.create(True, 2, 12, 1)
+    key_c = SettingsKey.create(False, 1, 10, 0.5)
+
+    await cache.get(key_a)
+    await cache.get(key_b)
+    await cache.get(key_a)
+    await cache.get(key_c)
+
+    assert key_a in cache
+    assert key_b not in cache
+    assert key_c in cache
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_load() -> None:
+    """Concurrent lookups for the same settings await a single in-flight load."""
+    clock = FakeClock()
+    calls: List[SettingsKey] = []
+    cache = make_cache(clock, calls)
+    key = SettingsKey.create(True, 1, 12, 1)
+
+    snapshots = await asyncio.gather(*(cache.get(key) for _ in range(7)))
+
+    assert len(calls) == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_served_while_revalidating() -> None:
+    """Within the stale-while-revalidate window the expired snapshot is returned and reloaded in the background."""
+    clock = FakeClock()
+    calls: List[SettingsKey] = []
+    key = SettingsKey.create(True, 1, 12, 1)
+    cache = make_cache(clock, calls)
+    cache.stale_while_revalidate = 3600
+
+    stale = await cache.get(key)
+    clock.now += 120
+    assert await cache.get(key) is stale
+    await asyncio.sleep(0.01)
+
+    assert len(calls) == 2
+    assert cache.peek(key) is not stale
+
+
+@pytest.mark.asyncio
+async def test_restored_snapshot_gets_the_longer_window() -> None:
+    """Only snapshots restored from disk are served far past their TTL; fetched ones wait for the reload."""
+    clock = FakeClock()
+    calls: List[SettingsKey] = []
+    key = SettingsKey.create(True, 1, 12, 1)
+    cache = make_cache(clock, calls)
+    cache.stale_while_revalidate = 60
+    cache.restored_stale_while_revalidate = 86400
+    restored = ValueSnapshot(key=key, assets=[], fetched_at=clock() - 3600, restored=True)
+    cache.put(restored)
+
+    assert await cache.get(key) is restored
+    await asyncio.sleep(0.01)
+    fetched = cache.peek(key)
+    assert fetched is not None and not fetched.restored
+
+    clock.now += 3600
+    assert await cache.get(key) is not fetched
+    assert len(calls) == 2
+
+
+def test_snapshot_materializes_players_on_demand(
+    player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any], player_no_name_dict: Dict[str, Any]
+) -> None:
+    """Only indexing columns are parsed up front; a Player is built on first access and then reused."""
+    snapshot = ValueSnapshot(
+        SettingsKey.create(True, 1, 12, 1), [player_a_dict, player_no_name_dict, player_b_dict], 0
+    )
+
+    assert snapshot.names == ["Player A", "Player B"]
+    assert snapshot.values == [10152, 12000]
+    assert len(snapshot) == 2
+    assert not snapshot._players
+
+    player = snapshot.player(1)
+    assert player.info.name == "Player B"
+    assert snapshot.player(1) is player
+    assert list(snapshot._players) == [1]
+
+
+@pytest.mark.asyncio
+async def test_stale_if_error_serves_last_good_snapshot() -> None:
+    """Past the revalidation window a failed or slow reload falls back to the expired snapshot."""
+    clock = FakeClock()
+    key = SettingsKey.create(True, 1, 12, 1)
+    outcomes: List[str] = ["ok", "fail", "slow"]
+
+    async def loader(settings: SettingsKey) -> ValueSnapshot:
+        outcome = outcomes.pop(0)
+        if outcome == "fail":
+            raise RuntimeError("upstream down")
+        if outcome == "slow":
+            await asyncio.sleep(1)
+        return ValueSnapshot(key=settings, assets=[], fetched_at=clock())
+
+    cache = SnapshotCache(loader, ttl=60, clock=clock, stale_if_error=True, stale_timeout=0.01)
+    good = await cache.get(key)
+    clock.now += 120
+
+    assert await cache.lookup(key) == (good, SnapshotStatus.FALLBACK)
+    assert await cache.lookup(key) == (good, SnapshotStatus.FALLBACK)
+    assert not cache.is_fresh(good)
+
+
+@pytest.mark.asyncio
+async def test_lookup_reports_refreshing_until_a_reload_fails() -> None:
+    """Within the revalidation window a snapshot is refreshing, unless its last reload failed."""
+    clock = FakeClock()
+    key = SettingsKey.create(True, 1, 12, 1)
+    fail = False
+
+    async def loader(settings: SettingsKey) -> ValueSnapshot:
+        if fail:
+            raise RuntimeError("upstream down")
+        return ValueSnapshot(key=settings, assets=[], fetched_at=clock() - 120)
+
+    cache = SnapshotCache(loader, ttl=60, clock=clock, stale_while_revalidate=3600)
+    stale = ValueSnapshot(key=key, assets=[], fetched_at=clock() - 120)
+    cache.put(stale)
+
+    assert await cache.lookup(key) == (stale, SnapshotStatus.REFRESHING)
+    await asyncio.sleep(0.01)
+    fail = True
+    refreshed = cache.peek(key)
+    assert refreshed is not None and refreshed is not stale
+    assert await cache.lookup(key) == (refreshed, SnapshotStatus.REFRESHING)
+    await asyncio.sleep(0.01)
+    assert await cache.lookup(key) == (refreshed, SnapshotStatus.FALLBACK)
+    await asyncio.sleep(0.01)
@@ -0,0 +1,65 @@
+"""Unit tests for the background snapshot refresher in `qsleeperfantasybot.snapshot_refresher`."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from qsleeperfantasybot.snapshot_cache import SettingsKey, SnapshotCache, ValueSnapshot
+from qsleeperfantasybot.snapshot_refresher import SnapshotRefresher, default_prewarm_matrix
+
+
+def test_default_prewarm_matrix_covers_common_settings() -> None:
+    """The default matrix covers 1QB/SF, 10/12/14 teams, 0/0.5/1 PPR for dynasty and redraft."""
+    matrix = default_prewarm_matrix()
+    assert len(matrix) == 36
+    assert SettingsKey.create(True, 2, 14, 0.5) in matrix
+    assert SettingsKey.create(False, 1, 10, 0) in matrix
+
+
+@pytest.mark.asyncio
+async def test_refresh_once_swaps_snapshots_and_skips_failures() -> None:
+    """Every key is reloaded; a failing key is logged and does not stop the round."""
+    calls: List[SettingsKey] = []
+    bad = SettingsKey.create(False, 1, 12, 1)
+
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        calls.append(key)
+        if key == bad:
+            raise RuntimeError("upstream down")
+        return ValueSnapshot(key=key, assets=[], fetched_at=float(len(calls)))
+
+    cache = SnapshotCache(loader)
+    keys = [SettingsKey.create(True, 1, 12, 1), bad, SettingsKey.create(True, 2, 12, 1)]
+    refresher = SnapshotRefresher(cache, keys, spacing=0)
+
+    assert await refresher.refresh_once() == 2
+    old = cache.peek(keys[0])
+    assert await refresher.refresh_once() == 2
+    assert cache.peek(keys[0]) is not old
+    assert calls.count(keys[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_start_fills_missing_snapshots_and_stop_cancels() -> None:
+    """The first background round only loads keys that are missing, then the task can be stopped cleanly."""
+    calls: List[SettingsKey] = []
+
+    async def loader(key: SettingsKey) -> ValueSnapshot:
+        calls.append(key)
+        return ValueSnapshot(key=key, assets=[], fetched_at=10**12)
+
+    cache = SnapshotCache(loader)
+    warm = SettingsKey.create(True, 1, 12, 1)
+    cold = SettingsKey.create(True, 2, 12, 1)
+    await cache.get(warm)
+    refresher = SnapshotRefresher(cache, [warm, cold], interval=60, spacing=0)
+
+    refresher.start()
+    await asyncio.sleep(0.01)
+    assert refresher.running
+    await refresher.stop()
+
+    assert not refresher.running
+    assert calls == [warm, cold]
+    assert 54 <= refresher.next_delay() <= 66
@@ -0,0 +1,35 @@
+"""Unit tests for on-disk value snapshot persistence in `qsleeperfantasybot.snapshot_store`."""
+
+from pathlib import Path
+from typing import Any, Dict
+
+from qsleeperfantasybot.snapshot_cache import SettingsKey
+from qsleeperfantasybot.snapshot_store import SnapshotStore
+
+
+def test_save_and_load_round_trip(tmp_path: Path, player_a_dict: Dict[str, Any]) -> None:
+    """A saved payload is loaded back with its settings key and fetch timestamp."""
+    store = SnapshotStore(tmp_path / "fantasycalc")
+    key = SettingsKey.create(True, 2, 12, 0.5)
+
+    store.save(key, 1700000000.5, [player_a_dict])
+    persisted = store.load(key)
+
+    assert persisted is not None
+    assert persisted.key == key
+    assert persisted.fetched_at == 1700000000.5
+    assert persisted.assets == [player_a_dict]
+    assert store.path_for(key).name == "dynasty_2qb_12teams_0.5ppr.json"
+    assert not list((tmp_path / "fantasycalc").glob("*.tmp"))
+
+
+def test_load_all_skips_corrupt_files(tmp_path: Path, player_a_dict: Dict[str, Any]) -> None:
+    """Unreadable snapshot files are ignored instead of breaking startup."""
+    store = SnapshotStore(tmp_path)
+    key = SettingsKey.create(False, 1, 10, 0)
+    store.save(key, 1.0, [player_a_dict])
+    (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+
+    assert [persisted.key for persisted in store.load_all()] == [key]
+    assert store.load(SettingsKey.create(True, 1, 12, 1)) is None
+    assert list(SnapshotStore(tmp_path / "missing").load_all()) == []
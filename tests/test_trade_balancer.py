@@ -0,0 +1,93 @@
+"""Unit tests for the trade balancer in `qsleeperfantasybot.trade_balancer`."""
+
+import copy
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from qsleeperfantasybot.snapshot_cache import SettingsKey, ValueSnapshot
+from qsleeperfantasybot.trade_balancer import TradeBalancer
+from qsleeperfantasybot.trade_valuation import TradeValuator, ValuationSettings
+
+
+def make_snapshot(template: Dict[str, Any], values: List[int]) -> ValueSnapshot:
+    assets = []
+    for number, value in enumerate(values):
+        asset = copy.deepcopy(template)
+        asset["player"]["id"] = number
+        asset["player"]["name"] = f"Asset {number}"
+        asset["value"] = value
+        assets.append(asset)
+    return ValueSnapshot(SettingsKey.create(True, 1, 12, 1), assets, 0)
+
+
+def plain_sum_balancer() -> TradeBalancer:
+    return TradeBalancer(TradeValuator(ValuationSettings(consolidation_exponent=1, roster_spot_cost=0)))
+
+
+def test_suggest_single_and_combined_fillers(player_a_dict: Dict[str, Any]) -> None:
+    """The closest single asset ranks first and combinations fill gaps no single asset can."""
+    snapshot = make_snapshot(player_a_dict, [100, 300, 700, 1000, 5000])
+    balancer = plain_sum_balancer()
+
+    suggestions = balancer.suggest(snapshot, [6000], [5000], exclude={4}, tolerance=10)
+    assert [suggestion.names for suggestion in suggestions] == [["Asset 3"], ["Asset 2", "Asset 1"]]
+    assert suggestions[0].remaining_gap == 0
+
+    combined = balancer.suggest(snapshot, [6100], [5000], exclude={4}, tolerance=10, limit=1)
+    assert combined[0].names == ["Asset 3", "Asset 0"]
+
+
+def test_suggest_respects_roster_and_balanced_trades(player_a_dict: Dict[str, Any]) -> None:
+    """Only roster assets are suggested and balanced trades get no suggestions."""
+    snapshot = make_snapshot(player_a_dict, [100, 300, 700, 1000, 5000])
+    balancer = plain_sum_balancer()
+
+    suggestions = balancer.suggest(snapshot, [6000], [5000], roster={0, 1, 2}, tolerance=10)
+    assert [suggestion.names for suggestion in suggestions] == [["Asset 2", "Asset 1"]]
+    assert balancer.suggest(snapshot, [5000], [5000]) == []
+
+
+def test_suggest_accounts_for_consolidation(player_a_dict: Dict[str, Any]) -> None:
+    """With the consolidation adjustment a filler must be worth more than the raw gap."""
+    snapshot = make_snapshot(player_a_dict, [1000, 2000, 3000, 4000])
+    valuator = TradeValuator(ValuationSettings(consolidation_exponent=2, roster_spot_cost=0))
+    balancer = TradeBalancer(valuator, max_assets=1)
+
+    suggestions = balancer.suggest(snapshot, [5000], [3000], exclude={2}, tolerance=100)
+
+    assert suggestions[0].names == ["Asset 3"]
+    assert valuator.side_value([3000, 4000]) == pytest.approx(5000)
+
+
+def test_suggest_is_fast_on_a_full_snapshot(player_a_dict: Dict[str, Any]) -> None:
+    """Balancing against a full size snapshot answers in milliseconds."""
+    snapshot = make_snapshot(player_a_dict, list(range(10000, 0, -20)))
+    balancer = TradeBalancer(TradeValuator(ValuationSettings()))
+    balancer.suggest(snapshot, [9000, 4000], [7000])
+
+    start = time.perf_counter()
+    suggestions = balancer.suggest(snapshot, [9000, 4000], [7000])
+    elapsed = time.perf_counter() - start
+
+    assert suggestions
+    assert elapsed < 0.1
+
+
+def test_value_order_tables_are_bounded_and_dropped_on_replacement(player_a_dict: Dict[str, Any]) -> None:
+    """Sorted assets are kept for max_entries settings keys and dropped once their snapshot is replaced."""
+    balancer = TradeBalancer(TradeValuator(), max_entries=1)
+    snapshot = make_snapshot(player_a_dict, [300, 100, 200])
+    other = ValueSnapshot(SettingsKey.create(True, 2, 12, 1), snapshot.assets, 0)
+
+    order = balancer.value_order(snapshot)
+    assert order.tolist() == [1, 2, 0] and balancer.value_order(snapshot) is order
+    other_order = balancer.value_order(other)
+    assert balancer.value_order(snapshot) is not order
+
+    other_order = balancer.value_order(other)
+    balancer.evict_replaced(other)
+    assert balancer.value_order(other) is other_order
+    balancer.evict_replaced(ValueSnapshot(other.key, snapshot.assets, 1))
+    assert balancer.value_order(other) is not other_order
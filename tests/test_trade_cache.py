@@ -0,0 +1,47 @@
+"""Unit tests for the trade result cache in `qsleeperfantasybot.trade_cache`."""
+
+from qsleeperfantasybot.messages import construct_dynasty_trade_message
+from qsleeperfantasybot.snapshot_cache import SettingsKey, ValueSnapshot
+from qsleeperfantasybot.trade_cache import TradeResult, TradeResultCache, canonical_trade
+
+SETTINGS = SettingsKey.create(True, 2, 12, 1)
+
+
+def test_canonical_trade_ignores_asset_and_side_order() -> None:
+    """Assets are sorted and lowercased per side and the sides are sorted, so equal trades share one key."""
+    snapshot = ValueSnapshot(SETTINGS, [], 0)
+
+    key, swapped = canonical_trade(snapshot, ["Bijan Robinson"], ["2026 Round 1", "2027 round 1 "])
+    same, swapped_back = canonical_trade(snapshot, ["2027 Round 1", "2026 Round 1"], ["bijan robinson"])
+
+    assert key == same
+    assert key.side_a == ("2026 round 1", "2027 round 1")
+    assert (swapped, swapped_back) == (True, False)
+    assert canonical_trade(ValueSnapshot(SETTINGS, [], 0), ["Bijan Robinson"], ["2026 Round 1"])[0] != key
+
+
+def test_trade_result_message_in_both_side_orders() -> None:
+    """A swapped query gets the message with the sides exchanged, formatted once per order."""
+    result = TradeResult(10, [("A", 10)], 20, [("B", 20)], [], [])
+
+    assert result.message() == construct_dynasty_trade_message(10, [("A", 10)], 20, [("B", 20)])
+    assert result.message(swapped=True) == construct_dynasty_trade_message(20, [("B", 20)], 10, [("A", 10)])
+    assert result.message(swapped=True) is result.message(swapped=True)
+
+
+def test_cache_drops_results_of_replaced_snapshots() -> None:
+    """A new snapshot for the same settings evicts the results of the old one; the LRU bound holds."""
+    old, other = ValueSnapshot(SETTINGS, [], 0), ValueSnapshot(SettingsKey.create(True, 1, 12, 1), [], 0)
+    cache = TradeResultCache(max_entries=2)
+    old_key, _ = canonical_trade(old, ["A"], ["B"])
+    other_key, _ = canonical_trade(other, ["A"], ["B"])
+    cache.put(old_key, TradeResult(1, [], 2, [], [], []))
+    cache.put(other_key, TradeResult(1, [], 2, [], [], []))
+
+    cache.evict_replaced(ValueSnapshot(SETTINGS, [], 1))
+
+    assert cache.get(old_key) is None
+    assert cache.get(other_key) is not None
+    for name in ["C", "D"]:
+        cache.put(canonical_trade(other, [name], ["B"])[0], TradeResult(1, [], 2, [], [], []))
+    assert len(cache) == 2 and cache.get(other_key) is None
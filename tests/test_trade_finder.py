@@ -0,0 +1,95 @@
+"""Unit tests for the league-wide trade finder in `qsleeperfantasybot.trade_finder`."""
+
+import copy
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+from qsleeperfantasybot.sleeper.model.roster import Roster
+from qsleeperfantasybot.snapshot_cache import SettingsKey, ValueSnapshot
+from qsleeperfantasybot.trade_finder import LeagueMatrix, TradeFinder, build_league_matrix
+from qsleeperfantasybot.trade_proposals import starter_slots
+from qsleeperfantasybot.trade_valuation import TradeValuator, ValuationSettings
+
+TEAMS: List[List[Tuple[str, int]]] = [
+    [("QB", 7000), ("QB", 6000), ("WR", 1000), ("WR", 900), ("WR", 800), ("RB", 3000), ("RB", 2800), ("TE", 1500)],
+    [("QB", 2000), ("WR", 5000), ("WR", 4500), ("WR", 4200), ("WR", 4000), ("WR", 2000), ("RB", 3000), ("RB", 2900)],
+    [("QB", 6500), ("WR", 6000), ("WR", 5900), ("WR", 5850), ("WR", 5800), ("RB", 3000), ("RB", 2900), ("TE", 1000)],
+]
+
+
+@pytest.fixture
+def league(player_a_dict: Dict[str, Any]) -> LeagueMatrix:
+    assets: List[Dict[str, Any]] = []
+    rosters: List[Roster] = []
+    for team, players in enumerate(TEAMS, start=1):
+        roster: List[str] = []
+        for position, value in players:
+            number = len(assets)
+            asset = copy.deepcopy(player_a_dict)
+            asset["player"].update(id=number, name=f"{position} {number}", position=position, sleeperId=str(number))
+            asset["value"] = value
+            assets.append(asset)
+            roster.append(str(number))
+        rosters.append(Roster(roster_id=team, owner_id=f"user{team}", players=roster))
+    snapshot = ValueSnapshot(SettingsKey.create(True, 1, 12, 1), assets, 0)
+    return build_league_matrix("123", snapshot, rosters, {2: "Deep WRs"}, starter_slots(False))
+
+
+def test_league_matrix_needs_and_surplus(league: LeagueMatrix) -> None:
+    """Needs are measured against the league median starters and surplus is the best bench asset."""
+    wr = league.positions.index("WR")
+    qb = league.positions.index("QB")
+
+    assert league.owners == ["Roster 1", "Deep WRs", "Roster 3"]
+    assert league.starters[:, wr].tolist() == [2700, 13700, 17750]
+    assert league.needs[:, wr].tolist() == [11000, 0, 0]
+    assert league.surplus[:, wr].tolist() == [0, 4000, 5800]
+    assert league.surplus[0, qb] == 6000
+
+
+def test_shop_finds_one_package_per_team(league: LeagueMatrix) -> None:
+    """Every team offers its best fair package of bench assets at positions the shopping team needs."""
+    finder = TradeFinder(TradeValuator(ValuationSettings(consolidation_exponent=1, roster_spot_cost=0)))
+
+    targets = finder.shop(league, 1, entry=1)
+
+    assert [target.roster_id for target in targets] == [3, 2]
+    assert targets[0].names == ["WR 20"] and targets[0].gain == 5000 and targets[0].interest == 0
+    assert targets[1].names == ["WR 12", "WR 13"]
+    assert targets[1].value_gap == 0 and targets[1].gain == 4300 and targets[1].interest == 4000
+    with pytest.raises(ValueError):
+        finder.shop(league, 9, entry=1)
+    with pytest.raises(ValueError, match="does not hold"):
+        finder.shop(league, 1, entry=20)
+
+
+def test_cached_matrix_expires_after_ttl(league: LeagueMatrix) -> None:
+    """League matrices are reused until the TTL passes."""
+    now = [100.0]
+    finder = TradeFinder(TradeValuator(), ttl=60, clock=lambda: now[0])
+    finder.store(league)
+
+    now[0] += 59
+    assert finder.cached("123") is league
+    now[0] += 1
+    assert finder.cached("123") is None
+    assert np.all(league.entries[0, league.positions.index("QB"), :2] == [0, 1])
+
+
+def test_matrices_are_bounded_and_dropped_with_their_snapshot(league: LeagueMatrix) -> None:
+    """Only max_entries leagues stay cached and a replaced value snapshot drops the matrices built from it."""
+    finder = TradeFinder(TradeValuator(), max_entries=2)
+    other, third = copy.copy(league), copy.copy(league)
+    other.league_id, third.league_id = "456", "789"
+    finder.store(league)
+    finder.store(other)
+    assert finder.cached("123") is league
+    finder.store(third)
+    assert finder.cached("456") is None and finder.cached("123") is league
+
+    finder.evict_replaced(league.snapshot)
+    assert finder.cached("123") is league
+    finder.evict_replaced(ValueSnapshot(league.snapshot.key, [], 0))
+    assert finder.cached("123") is None and finder.cached("789") is None
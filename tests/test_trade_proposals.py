@@ -0,0 +1,75 @@
+"""Unit tests for the trade proposal generator in `qsleeperfantasybot.trade_proposals`."""
+
+import copy
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
+from qsleeperfantasybot.snapshot_cache import SettingsKey, ValueSnapshot
+from qsleeperfantasybot.trade_proposals import Lineup, ProposalGenerator, starter_slots
+from qsleeperfantasybot.trade_valuation import TradeValuator, ValuationSettings
+
+
+def make_snapshot(template: Dict[str, Any], assets: List[Tuple[str, int]]) -> ValueSnapshot:
+    rows = []
+    for number, (position, value) in enumerate(assets):
+        asset = copy.deepcopy(template)
+        asset["player"].update(id=number, name=f"{position} {number}", position=position, sleeperId=str(number))
+        asset["value"] = value
+        rows.append(asset)
+    return ValueSnapshot(SettingsKey.create(True, 1, 12, 1), rows, 0)
+
+
+def test_lineup_change_only_counts_starters(player_a_dict: Dict[str, Any]) -> None:
+    """Bench players and picks do not add lineup value; losing a starter promotes the next best player."""
+    snapshot = make_snapshot(player_a_dict, [("QB", 6000), ("QB", 5000), ("PICK", 3000), ("WR", 1000)])
+    lineup = Lineup(snapshot, [0, 1, 2, 3], starter_slots(False))
+
+    assert lineup.value() == 7000
+    assert lineup.change([1, 2], []) == 0
+    assert lineup.change([0], []) == -1000
+    assert lineup.change([], [1]) == 0
+
+
+def test_propose_trades_surplus_for_need(player_a_dict: Dict[str, Any]) -> None:
+    """A backup QB is traded for a WR the other team cannot start, helping both teams."""
+    snapshot = make_snapshot(
+        player_a_dict,
+        [
+            ("QB", 6000),
+            ("QB", 5000),
+            ("WR", 1000),
+            ("RB", 3000),
+            ("QB", 800),
+            ("WR", 5100),
+            ("WR", 4000),
+            ("WR", 3900),
+            ("WR", 3800),
+            ("RB", 2900),
+        ],
+    )
+    generator = ProposalGenerator(TradeValuator(ValuationSettings(roster_spot_cost=0)), max_assets=2)
+
+    proposals = generator.propose(snapshot, [0, 1, 2, 3], [4, 5, 6, 7, 8, 9], starter_slots(False))
+
+    assert proposals
+    assert "QB 1" in proposals[0].give_names
+    assert proposals[0].gain_a > 0 and proposals[0].gain_b > 0
+    for proposal in proposals:
+        assert proposal.gain_a > 0 and proposal.gain_b > 0
+        assert abs(proposal.value_gap) <= 0.05 * 5000 * 2
+
+
+def test_propose_trades_full_rosters_within_budget(player_a_dict: Dict[str, Any]) -> None:
+    """Two 25-man rosters are searched for 3-for-3 trades within the latency budget."""
+    rng = random.Random(7)
+    positions = ["QB", "RB", "WR", "TE", "PICK"]
+    snapshot = make_snapshot(player_a_dict, [(rng.choice(positions), rng.randint(100, 9000)) for _ in range(50)])
+    generator = ProposalGenerator(TradeValuator(ValuationSettings()), max_assets=3, budget=0.5)
+
+    start = time.perf_counter()
+    proposals = generator.propose(snapshot, list(range(25)), list(range(25, 50)), starter_slots(True))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.5
+    assert all(proposal.gain_a > 0 and proposal.gain_b > 0 for proposal in proposals)
@@ -0,0 +1,41 @@
+"""Unit tests for the vectorized trade valuation engine in `qsleeperfantasybot.trade_valuation`."""
+
+import numpy as np
+import pytest
+
+from qsleeperfantasybot.trade_valuation import TradeValuator, ValuationSettings, pad_sides
+
+
+def test_plain_sum_without_adjustment() -> None:
+    """With exponent 1 and no roster spot cost a side is worth the sum of its assets."""
+    valuator = TradeValuator(ValuationSettings(consolidation_exponent=1, roster_spot_cost=0))
+
+    assert valuator.side_value([3000, 2000, 1000]) == pytest.approx(6000)
+    assert valuator.side_value([]) == 0
+
+
+def test_consolidation_favours_the_best_asset() -> None:
+    """Two mid-value assets are worth less than one star of their combined value."""
+    valuator = TradeValuator(ValuationSettings(consolidation_exponent=2, roster_spot_cost=100))
+
+    assert valuator.side_value([8000]) == pytest.approx(8000)
+    assert valuator.side_value([4000, 4000]) == pytest.approx(4000 * np.sqrt(2) - 100)
+    assert valuator.score_trades([[8000, 0]], [[4000, 4000]])[0] > 0
+
+
+def test_score_trades_matches_scalar_valuation() -> None:
+    """Scoring many padded candidates at once agrees with valuing each side separately."""
+    valuator = TradeValuator(ValuationSettings(consolidation_exponent=1.5, roster_spot_cost=250))
+    sides_a = [[9000], [5000, 3000], [2000, 2000, 2000]]
+    sides_b = [[4000, 4000], [8000], [6000]]
+
+    scores = valuator.score_trades(pad_sides(sides_a, width=3), pad_sides(sides_b, width=3))
+
+    expected = [valuator.side_value(a) - valuator.side_value(b) for a, b in zip(sides_a, sides_b)]
+    assert scores == pytest.approx(expected)
+
+
+def test_settings_reject_exponent_below_one() -> None:
+    """An exponent below 1 would reward splitting value and is rejected."""
+    with pytest.raises(ValueError):
+        ValuationSettings(consolidation_exponent=0.5)
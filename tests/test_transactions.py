@@ -0,0 +1,65 @@
+"""Unit tests for the incremental transactions crawler in `qsleeperfantasybot.transactions`."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+from qsleeperfantasybot.transactions import MAX_WEEKS, TransactionCrawler, TransactionStore
+
+
+def week_of(week: int) -> List[Dict[str, Any]]:
+    return [
+        {"transaction_id": f"t{week}", "type": "trade", "status": "complete", "leg": week, "created": week},
+        {"transaction_id": f"w{week}", "type": "waiver", "status": "failed", "leg": week, "created": week},
+    ]
+
+
+def client_for(league: Dict[str, Any], state: Dict[str, Any], failing: Optional[int] = None) -> AsyncMock:
+    client = AsyncMock()
+    client.get_specific_league.return_value = league
+    client.get_nfl_state.return_value = state
+
+    async def transactions(league_id: str, week: str) -> Optional[List[Dict[str, Any]]]:
+        return None if int(week) == failing else week_of(int(week))
+
+    client.get_transactions.side_effect = transactions
+    return client
+
+
+def fetched_weeks(client: AsyncMock) -> List[int]:
+    return sorted(int(call.args[1]) for call in client.get_transactions.await_args_list)
+
+
+@pytest.mark.asyncio
+async def test_later_crawls_fetch_only_open_weeks(tmp_path: Path) -> None:
+    """Past weeks are closed after one crawl; the current week and new weeks are fetched again later."""
+    store = TransactionStore(tmp_path)
+    league = {"season": "2026", "status": "in_season"}
+    client = client_for(league, {"season": "2026", "leg": 3}, failing=1)
+    history = await TransactionCrawler(client, store).crawl("123")
+    assert fetched_weeks(client) == [1, 2, 3]
+    assert history.closed_weeks == {2}
+    assert [t.transaction_id for t in history.of_type("trade")] == ["t2", "t3"]
+
+    client = client_for(league, {"season": "2026", "leg": 4})
+    history = await TransactionCrawler(client, store).crawl("123")
+    assert fetched_weeks(client) == [1, 3, 4]
+    assert history.closed_weeks == {1, 2, 3}
+    assert len(store.load("123").transactions) == 8
+
+
+@pytest.mark.asyncio
+async def test_finished_season_loads_from_disk(tmp_path: Path) -> None:
+    """A complete league is crawled once; later crawls read the stored history without any request."""
+    store = TransactionStore(tmp_path)
+    client = client_for({"season": "2025", "status": "complete"}, {"season": "2026", "leg": 5})
+    await TransactionCrawler(client, store).crawl("123")
+    assert fetched_weeks(client) == list(range(1, MAX_WEEKS + 1))
+
+    client = AsyncMock()
+    history = await TransactionCrawler(client, store).crawl("123")
+    assert len(history.parsed()) == 2 * MAX_WEEKS
+    assert client.get_specific_league.await_count == 0
+    assert client.get_transactions.await_count == 0
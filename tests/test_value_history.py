@@ -0,0 +1,125 @@
+"""Unit tests for the value time-series store in `qsleeperfantasybot.value_history`."""
+
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from qsleeperfantasybot.snapshot_cache import SettingsKey, ValueSnapshot
+from qsleeperfantasybot.value_history import ValueHistory, ValueHistoryStore
+
+KEY = SettingsKey.create(True, 1, 12, 1)
+NAMES = {1: "Riser", 2: "Faller", 3: "Steady", 4: "Rookie"}
+
+
+def build_history() -> ValueHistory:
+    history = ValueHistory(KEY)
+    history.append(date(2026, 10, 1), {1: 1000, 2: 5000, 3: 3000}, NAMES)
+    history.append(date(2026, 10, 5), {1: 1500, 2: 4500, 3: 3000}, NAMES)
+    history.append(date(2026, 10, 8), {1: 2500, 2: 4000, 3: 3000, 4: 800}, NAMES)
+    return history
+
+
+def test_movers_over_window() -> None:
+    """Gainers and losers are computed between the last day and the last day on or before the window start."""
+    gainers, losers = build_history().movers(days=7, count=5)
+
+    assert [(m.name, m.change) for m in gainers] == [("Riser", 1500)]
+    assert [(m.name, m.change) for m in losers] == [("Faller", -1000)]
+
+
+def test_movers_with_shorter_window_and_count() -> None:
+    """A shorter window compares against an intermediate day; assets missing on either day are ignored."""
+    history = build_history()
+    gainers, losers = history.movers(days=3, count=1)
+
+    assert [(m.name, m.start_value, m.end_value) for m in gainers] == [("Riser", 1500, 2500)]
+    assert [(m.name, m.change) for m in losers] == [("Faller", -500)]
+    assert ValueHistory(KEY).movers(days=7, count=5) == ([], [])
+
+
+def test_movers_with_partial_history() -> None:
+    """A window reaching back before the first recorded day compares against the earliest day instead."""
+    history = build_history()
+    gainers, losers = history.movers(days=30, count=5)
+
+    assert [(m.name, m.start_value, m.end_value) for m in gainers] == [("Riser", 1000, 2500)]
+    assert [(m.name, m.change) for m in losers] == [("Faller", -1000)]
+    assert history.window(30) == (date(2026, 10, 1), date(2026, 10, 8))
+    assert history.window(3) == (date(2026, 10, 5), date(2026, 10, 8))
+    assert ValueHistory(KEY).window(7) is None
+
+
+def test_series_range_query() -> None:
+    """A range query returns only the recorded points inside the range."""
+    history = build_history()
+
+    assert history.series(1, date(2026, 10, 2), date(2026, 10, 8)) == [
+        (date(2026, 10, 5), 1500),
+        (date(2026, 10, 8), 2500),
+    ]
+    assert history.series(4, date(2026, 10, 1), date(2026, 10, 8)) == [(date(2026, 10, 8), 800)]
+    assert history.series(99, date(2026, 10, 1), date(2026, 10, 8)) == []
+
+
+def test_store_records_once_per_day_and_reloads(
+    tmp_path: Path, player_a_dict: Dict[str, Any], player_b_dict: Dict[str, Any]
+) -> None:
+    """Snapshots are appended at most once per day and the file loads back into the same history."""
+    store = ValueHistoryStore(tmp_path)
+    assets = [player_a_dict, player_b_dict]
+    day_one = datetime(2026, 10, 1, 12).timestamp()
+    day_two = datetime(2026, 10, 2, 12).timestamp()
+
+    store.record(ValueSnapshot(KEY, assets, day_one))
+    store.record(ValueSnapshot(KEY, assets, day_one + 60))
+    store.record(ValueSnapshot(KEY, assets, day_two))
+
+    assert len(store.path_for(KEY).read_text(encoding="utf-8").splitlines()) == 2
+    reloaded = ValueHistoryStore(tmp_path)
+    assert reloaded.last_recorded_day(KEY) == date(2026, 10, 2).toordinal()
+    assert len(reloaded.history(KEY)) == 2
+
+
+@pytest.mark.asyncio
+async def test_store_records_and_loads_off_the_event_loop(tmp_path: Path, player_a_dict: Dict[str, Any]) -> None:
+    """Background recording writes the day once and a loaded history includes it."""
+    store = ValueHistoryStore(tmp_path)
+    day_one = datetime(2026, 10, 1, 12).timestamp()
+
+    store.record_in_background(ValueSnapshot(KEY, [player_a_dict], day_one))
+    await store.flush()
+    store.record_in_background(ValueSnapshot(KEY, [player_a_dict], day_one + 60))
+    await store.flush()
+
+    assert len(store.path_for(KEY).read_text(encoding="utf-8").splitlines()) == 1
+    history = await ValueHistoryStore(tmp_path).load(KEY)
+    assert history.days == [date(2026, 10, 1).toordinal()]
+
+
+def test_store_skips_bad_lines_and_does_not_mutate_loaded_histories(
+    tmp_path: Path, player_a_dict: Dict[str, Any]
+) -> None:
+    """Malformed and duplicate-day lines are skipped, and recording swaps in a new history object."""
+    store = ValueHistoryStore(tmp_path)
+    store.path_for(KEY).write_text(
+        '{"date":"2026-10-01","assets":[[1,1000,"Riser"]]}\n'
+        "not json\n"
+        '{"date":"2026-10-01","assets":[[1,1100,"Riser"]]}\n'
+        '{"assets":[]}\n'
+        '{"date":"2026-10-02","assets":[[1,1200,"Riser"]]}\n',
+        encoding="utf-8",
+    )
+
+    loaded = store.history(KEY)
+    assert loaded.series(1, date(2026, 10, 1), date(2026, 10, 2)) == [
+        (date(2026, 10, 1), 1000),
+        (date(2026, 10, 2), 1200),
+    ]
+
+    store.record(ValueSnapshot(KEY, [player_a_dict], datetime(2026, 10, 3, 12).timestamp()))
+
+    assert len(loaded) == 2
+    assert store.history(KEY) is not loaded
+    assert len(store.history(KEY)) == 3